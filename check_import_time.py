@@ -0,0 +1,54 @@
+"""Check cold import times against a budget.
+
+Runs each entry module in a fresh interpreter with `-X importtime` and fails
+if its cumulative import time exceeds the budget, listing the slowest
+imports so regressions (e.g. a provider SDK imported at module level) are
+easy to spot.
+
+Usage: python check_import_time.py
+"""
+
+import subprocess
+import sys
+
+# Module -> budget in seconds (cumulative, cold start)
+IMPORT_BUDGETS = {
+    "cli.main": 1.5,
+    "tradingagents.graph.trading_graph": 3.0,
+}
+SHOW_SLOWEST = 8
+
+
+def measure(module: str):
+    """Return (total seconds, [(seconds, module), ...]) for importing module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings.append((int(cumulative) / 1e6, name.strip()))
+    total = next(seconds for seconds, name in reversed(timings) if name == module)
+    return total, timings
+
+
+def main() -> int:
+    failed = False
+    for module, budget in IMPORT_BUDGETS.items():
+        total, timings = measure(module)
+        status = "OK  " if total <= budget else "OVER"
+        print(f"{status} {module}: {total:.2f}s (budget {budget:.2f}s)")
+        if total > budget:
+            failed = True
+            for seconds, name in sorted(timings, reverse=True)[1:SHOW_SLOWEST + 1]:
+                print(f"       {seconds:6.2f}s  {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,7 +23,6 @@ from rich import box
 from rich.align import Align
 from rich.rule import Rule
 
-from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 from cli.models import AnalystType
 from cli.utils import *
@@ -440,6 +439,8 @@ def update_display(layout, spinner_text=None, stats_handler=None, start_time=Non
         # Token display with graceful fallback
         if stats["tokens_in"] > 0 or stats["tokens_out"] > 0:
             tokens_str = f"Tokens: {format_tokens(stats['tokens_in'])}\u2191 {format_tokens(stats['tokens_out'])}\u2193"
+            if stats["tokens_cached"] > 0:
+                tokens_str += f" ({format_tokens(stats['tokens_cached'])} cached)"
         else:
             tokens_str = "Tokens: --"
         stats_parts.append(tokens_str)
@@ -787,12 +788,12 @@ ANALYST_REPORT_MAP = {
 }
 
 
-def update_analyst_statuses(message_buffer, chunk):
+def update_analyst_statuses(message_buffer, chunk, parallel=False):
     """Update all analyst statuses based on current report state.
 
     Logic:
     - Analysts with reports = completed
-    - First analyst without report = in_progress
+    - First analyst without report = in_progress (every one when parallel)
     - Remaining analysts without reports = pending
     - When all analysts done, set Bull Researcher to in_progress
     """
@@ -810,7 +811,7 @@ def update_analyst_statuses(message_buffer, chunk):
         if has_report:
             message_buffer.update_agent_status(agent_name, "completed")
             message_buffer.update_report_section(report_key, chunk[report_key])
-        elif not found_active:
+        elif parallel or not found_active:
             message_buffer.update_agent_status(agent_name, "in_progress")
             found_active = True
         else:
@@ -863,6 +864,22 @@ def extract_content_string(content):
     return str(content).strip() if not is_empty(content) else None
 
 
+def add_streamed_message(message_buffer, message):
+    """Add a streamed message and its tool calls to the buffer."""
+    # Add message to buffer
+    msg_type, content = classify_message_type(message)
+    if content and content.strip():
+        message_buffer.add_message(msg_type, content)
+
+    # Handle tool calls
+    if hasattr(message, "tool_calls") and message.tool_calls:
+        for tool_call in message.tool_calls:
+            if isinstance(tool_call, dict):
+                message_buffer.add_tool_call(tool_call["name"], tool_call["args"])
+            else:
+                message_buffer.add_tool_call(tool_call.name, tool_call.args)
+
+
 def classify_message_type(message) -> tuple[str, str | None]:
     """Classify LangChain message into display type and extract content.
 
@@ -919,6 +936,10 @@ def run_analysis():
     selected_set = {analyst.value for analyst in selections["analysts"]}
     selected_analyst_keys = [a for a in ANALYST_ORDER if a in selected_set]
 
+    # Imported here so `--help` and the interactive prompts don't pay for
+    # LangGraph and the provider SDKs
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
     # Initialize the graph with callbacks bound to LLMs
     graph = TradingAgentsGraph(
         selected_analyst_keys,
@@ -1010,16 +1031,36 @@ def run_analysis():
         update_display(layout, spinner_text, stats_handler=stats_handler, start_time=start_time)
 
         # Initialize state and get graph args with callbacks
-        init_agent_state = graph.propagator.create_initial_state(
-            selections["ticker"], selections["analysis_date"]
-        )
         # Pass callbacks to graph config for tool execution tracking
         # (LLM tracking is handled separately via LLM constructor)
-        args = graph.propagator.get_graph_args(callbacks=[stats_handler])
+        init_agent_state, args = graph.prepare_run(
+            selections["ticker"], selections["analysis_date"], callbacks=[stats_handler]
+        )
 
-        # Stream the analysis
+        # Stream the analysis. Parallel analysts run as subgraphs that only
+        # output their report, so their messages and tool calls are read
+        # from the subgraphs' task results; the main graph streams states.
         trace = []
-        for chunk in graph.graph.stream(init_agent_state, **args):
+        for namespace, mode, chunk in graph.graph.stream(
+            init_agent_state, args["config"], stream_mode=["values", "tasks"], subgraphs=True
+        ):
+            if namespace:
+                if mode == "tasks" and isinstance(chunk.get("result"), dict):
+                    result = chunk["result"]
+                    for message in result.get("messages", []):
+                        add_streamed_message(message_buffer, message)
+                    # A branch's report is shown as soon as it is written
+                    for analyst_key, report_key in ANALYST_REPORT_MAP.items():
+                        if result.get(report_key):
+                            message_buffer.update_agent_status(
+                                ANALYST_AGENT_NAMES[analyst_key], "completed"
+                            )
+                            message_buffer.update_report_section(report_key, result[report_key])
+                    update_display(layout, stats_handler=stats_handler, start_time=start_time)
+                continue
+            if mode != "values":
+                continue
+
             # Process messages if present (skip duplicates via message ID)
             if len(chunk["messages"]) > 0:
                 last_message = chunk["messages"][-1]
@@ -1027,24 +1068,12 @@ def run_analysis():
 
                 if msg_id != message_buffer._last_message_id:
                     message_buffer._last_message_id = msg_id
-
-                    # Add message to buffer
-                    msg_type, content = classify_message_type(last_message)
-                    if content and content.strip():
-                        message_buffer.add_message(msg_type, content)
-
-                    # Handle tool calls
-                    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-                        for tool_call in last_message.tool_calls:
-                            if isinstance(tool_call, dict):
-                                message_buffer.add_tool_call(
-                                    tool_call["name"], tool_call["args"]
-                                )
-                            else:
-                                message_buffer.add_tool_call(tool_call.name, tool_call.args)
+                    add_streamed_message(message_buffer, last_message)
 
             # Update analyst statuses based on report state (runs on every chunk)
-            update_analyst_statuses(message_buffer, chunk)
+            update_analyst_statuses(
+                message_buffer, chunk, parallel=graph.config.get("parallel_analysts", False)
+            )
 
             # Research Team - Handle Investment Debate State
             if chunk.get("investment_debate_state"):
@@ -16,6 +16,7 @@ class StatsCallbackHandler(BaseCallbackHandler):
         self.tool_calls = 0
         self.tokens_in = 0
         self.tokens_out = 0
+        self.tokens_cached = 0
 
     def on_llm_start(
         self,
@@ -54,6 +55,8 @@ class StatsCallbackHandler(BaseCallbackHandler):
             with self._lock:
                 self.tokens_in += usage_metadata.get("input_tokens", 0)
                 self.tokens_out += usage_metadata.get("output_tokens", 0)
+                details = usage_metadata.get("input_token_details") or {}
+                self.tokens_cached += details.get("cache_read", 0)
 
     def on_tool_start(
         self,
@@ -73,4 +76,5 @@ class StatsCallbackHandler(BaseCallbackHandler):
                 "tool_calls": self.tool_calls,
                 "tokens_in": self.tokens_in,
                 "tokens_out": self.tokens_out,
+                "tokens_cached": self.tokens_cached,
             }
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from tradingagents.llm_clients.load_balancer import create_balanced_llm
+from tradingagents.llm_clients.rate_limit import ProviderRateLimiter, RateLimitedChatModel
+
+
+class LimitedFakeModel(RateLimitedChatModel, FakeListChatModel):
+    """Fake chat model behind a call limiter, like the provider clients."""
+
+
+def test_pool_members_each_get_their_own_budget():
+    limits = {"openai": {"rpm": 2, "max_concurrency": 1}}
+    pool = create_balanced_llm(
+        "openai", "gpt-4o-mini", [{"api_key": "key-a"}, {"api_key": "key-b"}], rate_limits=limits
+    )
+    first, second = (member.call_limiter for member in pool.members)
+    assert first is not second
+
+    # Each member holds its one in-flight slot and spends its whole RPM at
+    # the same time; neither waits on the other
+    def use_full_budget(limiter):
+        limiter.acquire(100)
+        limiter.release(100, 100)
+        limiter.acquire(100)
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=use_full_budget, args=(limiter,)) for limiter in (first, second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert not any(thread.is_alive() for thread in threads)
+    assert time.monotonic() - start < 1.0
+
+
+def test_cancelled_acquire_does_not_leak_the_slot():
+    limiter = ProviderRateLimiter(max_concurrency=1)
+    model = LimitedFakeModel(responses=["ok"], call_limiter=limiter)
+
+    async def scenario():
+        limiter.acquire(0)  # hold the only slot so the call queues
+        call = asyncio.create_task(model.ainvoke("hi"))
+        await asyncio.sleep(0.1)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+        # The cancelled call's worker thread gets the slot once it is free
+        # and must hand it straight back
+        limiter.release(0, 0)
+
+    asyncio.run(scenario())
+
+    acquired = threading.Event()
+    threading.Thread(target=lambda: (limiter.acquire(0), acquired.set()), daemon=True).start()
+    assert acquired.wait(timeout=2)
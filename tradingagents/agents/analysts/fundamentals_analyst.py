@@ -3,55 +3,76 @@ from langchain_core.messages import HumanMessage
 import re
 import time
 import json
-from tradingagents.agents.utils.agent_utils import get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement, get_insider_transactions, get_sec_filings
+from tradingagents.agents.utils.agent_utils import get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement, get_insider_transactions, get_sec_filings, get_sec_filing_section
 from tradingagents.dataflows.config import get_config
+from tradingagents.agents.utils.llm_steps import llm_node
+from tradingagents.agents.utils.tool_blobs import expand_tool_outputs
 
 
-def create_fundamentals_analyst(llm):
-    def fundamentals_analyst_node(state):
-        current_date = state["trade_date"]
-        ticker = state["company_of_interest"]
-        company_name = state["company_of_interest"]
+def create_fundamentals_analyst(llm, tool_budget=None):
+    tools = [
+        get_fundamentals,
+        get_balance_sheet,
+        get_cashflow,
+        get_income_statement,
+        get_sec_filings,
+        get_sec_filing_section,
+    ]
+
+    system_message = (
+        "You are a researcher tasked with analyzing fundamental information over the past week about a company. Please write a comprehensive report of the company's fundamental information such as financial documents, company profile, basic company financials, and company financial history to gain a full view of the company's fundamental information to inform traders. Make sure to include as much detail as possible. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."
+        + " Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."
+        + " Use the available tools: `get_fundamentals` for comprehensive company analysis, `get_balance_sheet`, `get_cashflow`, and `get_income_statement` for specific financial statements, and `get_sec_filings(ticker, filing_type, limit)` to retrieve SEC EDGAR filings (10-K, 10-Q, 8-K) with filing dates and content excerpts. For substance beyond the cover page, use `get_sec_filing_section(ticker, section, query, curr_date)` to read Item 1 (Business), 1A (Risk Factors), 7 (MD&A) or 7A (Market Risk) of the latest 10-K filed by the current date, passing a query to get only the most relevant paragraphs.",
+    )
 
-        tools = [
-            get_fundamentals,
-            get_balance_sheet,
-            get_cashflow,
-            get_income_statement,
-            get_sec_filings,
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a helpful AI assistant, collaborating with other assistants."
+                " Use the provided tools to progress towards answering the question."
+                " If you are unable to fully answer, that's OK; another assistant with different tools"
+                " will help where you left off. Execute what you can to make progress."
+                " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
+                " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
+                " You have access to the following tools: {tool_names}.\n{system_message}"
+                "For your reference, the current date is {current_date}. The company we want to look at is {ticker}",
+            ),
+            MessagesPlaceholder(variable_name="messages"),
         ]
+    )
 
-        system_message = (
-            "You are a researcher tasked with analyzing fundamental information over the past week about a company. Please write a comprehensive report of the company's fundamental information such as financial documents, company profile, basic company financials, and company financial history to gain a full view of the company's fundamental information to inform traders. Make sure to include as much detail as possible. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."
-            + " Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."
-            + " Use the available tools: `get_fundamentals` for comprehensive company analysis, `get_balance_sheet`, `get_cashflow`, and `get_income_statement` for specific financial statements, and `get_sec_filings(ticker, filing_type, limit)` to retrieve SEC EDGAR filings (10-K, 10-Q, 8-K) with filing dates and content excerpts.",
-        )
+    prompt = prompt.partial(system_message=system_message)
+    prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a helpful AI assistant, collaborating with other assistants."
-                    " Use the provided tools to progress towards answering the question."
-                    " If you are unable to fully answer, that's OK; another assistant with different tools"
-                    " will help where you left off. Execute what you can to make progress."
-                    " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
-                    " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
-                    " You have access to the following tools: {tool_names}.\n{system_message}"
-                    "For your reference, the current date is {current_date}. The company we want to look at is {ticker}",
-                ),
-                MessagesPlaceholder(variable_name="messages"),
-            ]
-        )
+    # Built once; only the date and ticker are filled in per call
+    tool_chain = prompt | llm.bind_tools(tools)
+    report_chain = prompt | llm
 
-        prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
-        prompt = prompt.partial(current_date=current_date)
-        prompt = prompt.partial(ticker=ticker)
+    # Asks for the written report without tools
+    report_request = (
+        "Based on all the financial data gathered above, write your "
+        "comprehensive fundamentals analysis report now with a summary table at the end. "
+        "Do not attempt to call any tools."
+    )
 
-        chain = prompt | llm.bind_tools(tools)
+    def fundamentals_analyst_node(state):
+        prompt_vars = {
+            "current_date": state["trade_date"],
+            "ticker": state["company_of_interest"],
+        }
+        messages = expand_tool_outputs(state["messages"])
+
+        if tool_budget is not None and tool_budget.exhausted(state["messages"]):
+            # Tool budget spent: write the report from the data gathered so far
+            nudge = HumanMessage(content=report_request)
+            result = yield report_chain, {"messages": messages + [nudge], **prompt_vars}
+            return {
+                "messages": [nudge, result],
+                "fundamentals_report": result.content or "",
+            }
 
-        result = chain.invoke(state["messages"])
+        result = yield tool_chain, {"messages": messages, **prompt_vars}
 
         if result.tool_calls:
             # Intermediate step — don't overwrite report with empty string
@@ -63,14 +84,9 @@ def create_fundamentals_analyst(llm):
         # Detect if model wrote inline tool calls instead of a real report
         if len(content) < 300 or re.search(r'get_\w+\s*\{', content):
             # Re-invoke LLM without tools to force a written analysis
-            report_chain = prompt | llm
-            nudge = HumanMessage(
-                content="Based on all the financial data gathered above, write your "
-                "comprehensive fundamentals analysis report now with a summary table at the end. "
-                "Do not attempt to call any tools."
-            )
-            retry_msgs = state["messages"] + [result, nudge]
-            retry_result = report_chain.invoke(retry_msgs)
+            nudge = HumanMessage(content=report_request)
+            retry_msgs = messages + [result, nudge]
+            retry_result = yield report_chain, {"messages": retry_msgs, **prompt_vars}
             report = retry_result.content or content
             return {
                 "messages": [result, nudge, retry_result],
@@ -82,4 +98,4 @@ def create_fundamentals_analyst(llm):
             "fundamentals_report": content,
         }
 
-    return fundamentals_analyst_node
+    return llm_node(fundamentals_analyst_node)
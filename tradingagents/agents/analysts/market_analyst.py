@@ -5,23 +5,19 @@ import time
 import json
 from tradingagents.agents.utils.agent_utils import get_stock_data, get_indicators, get_options_chain
 from tradingagents.dataflows.config import get_config
+from tradingagents.agents.utils.llm_steps import llm_node
+from tradingagents.agents.utils.tool_blobs import expand_tool_outputs
 
 
-def create_market_analyst(llm):
+def create_market_analyst(llm, tool_budget=None):
+    tools = [
+        get_stock_data,
+        get_indicators,
+        get_options_chain,
+    ]
 
-    def market_analyst_node(state):
-        current_date = state["trade_date"]
-        ticker = state["company_of_interest"]
-        company_name = state["company_of_interest"]
-
-        tools = [
-            get_stock_data,
-            get_indicators,
-            get_options_chain,
-        ]
-
-        system_message = (
-            """You are a trading assistant tasked with analyzing financial markets. Your role is to select the **most relevant indicators** for a given market condition or trading strategy from the following list. The goal is to choose up to **8 indicators** that provide complementary insights without redundancy. Categories and each category's indicators are:
+    system_message = (
+        """You are a trading assistant tasked with analyzing financial markets. Your role is to select the **most relevant indicators** for a given market condition or trading strategy from the following list. The goal is to choose up to **8 indicators** that provide complementary insights without redundancy. Categories and each category's indicators are:
 
 Moving Averages:
 - close_50_sma: 50 SMA: A medium-term trend indicator. Usage: Identify trend direction and serve as dynamic support/resistance. Tips: It lags price; combine with faster indicators for timely signals.
@@ -50,34 +46,57 @@ Volume-Based Indicators:
 You also have access to get_options_chain(symbol, curr_date) which provides options market data including calls/puts, implied volatility, volume, open interest, and put/call ratios. Use this to gauge market sentiment and expected volatility from the options market. High put/call ratios may indicate bearish sentiment, while high IV suggests expected price movement.
 
 Write a very detailed and nuanced report of the trends you observe. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."""
-            + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
-        )
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a helpful AI assistant, collaborating with other assistants."
-                    " Use the provided tools to progress towards answering the question."
-                    " If you are unable to fully answer, that's OK; another assistant with different tools"
-                    " will help where you left off. Execute what you can to make progress."
-                    " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
-                    " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
-                    " You have access to the following tools: {tool_names}.\n{system_message}"
-                    "For your reference, the current date is {current_date}. The company we want to look at is {ticker}",
-                ),
-                MessagesPlaceholder(variable_name="messages"),
-            ]
-        )
-
-        prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
-        prompt = prompt.partial(current_date=current_date)
-        prompt = prompt.partial(ticker=ticker)
-
-        chain = prompt | llm.bind_tools(tools)
-
-        result = chain.invoke(state["messages"])
+        + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
+    )
+
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a helpful AI assistant, collaborating with other assistants."
+                " Use the provided tools to progress towards answering the question."
+                " If you are unable to fully answer, that's OK; another assistant with different tools"
+                " will help where you left off. Execute what you can to make progress."
+                " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
+                " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
+                " You have access to the following tools: {tool_names}.\n{system_message}"
+                "For your reference, the current date is {current_date}. The company we want to look at is {ticker}",
+            ),
+            MessagesPlaceholder(variable_name="messages"),
+        ]
+    )
+
+    prompt = prompt.partial(system_message=system_message)
+    prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
+
+    # Built once; only the date and ticker are filled in per call
+    tool_chain = prompt | llm.bind_tools(tools)
+    report_chain = prompt | llm
+
+    # Asks for the written report without tools
+    report_request = (
+        "Based on all the data gathered above, write your detailed "
+        "market analysis report now with a summary table at the end. "
+        "Do not attempt to call any tools."
+    )
+
+    def market_analyst_node(state):
+        prompt_vars = {
+            "current_date": state["trade_date"],
+            "ticker": state["company_of_interest"],
+        }
+        messages = expand_tool_outputs(state["messages"])
+
+        if tool_budget is not None and tool_budget.exhausted(state["messages"]):
+            # Tool budget spent: write the report from the data gathered so far
+            nudge = HumanMessage(content=report_request)
+            result = yield report_chain, {"messages": messages + [nudge], **prompt_vars}
+            return {
+                "messages": [nudge, result],
+                "market_report": result.content or "",
+            }
+
+        result = yield tool_chain, {"messages": messages, **prompt_vars}
 
         if result.tool_calls:
             # Intermediate step — don't overwrite report with empty string
@@ -89,14 +108,9 @@ Write a very detailed and nuanced report of the trends you observe. Do not simpl
         # Detect if model wrote inline tool calls instead of a real report
         if len(content) < 300 or re.search(r'get_\w+\s*\{', content):
             # Re-invoke LLM without tools to force a written analysis
-            report_chain = prompt | llm
-            nudge = HumanMessage(
-                content="Based on all the data gathered above, write your detailed "
-                "market analysis report now with a summary table at the end. "
-                "Do not attempt to call any tools."
-            )
-            retry_msgs = state["messages"] + [result, nudge]
-            retry_result = report_chain.invoke(retry_msgs)
+            nudge = HumanMessage(content=report_request)
+            retry_msgs = messages + [result, nudge]
+            retry_result = yield report_chain, {"messages": retry_msgs, **prompt_vars}
             report = retry_result.content or content
             return {
                 "messages": [result, nudge, retry_result],
@@ -108,4 +122,4 @@ Write a very detailed and nuanced report of the trends you observe. Do not simpl
             "market_report": content,
         }
 
-    return market_analyst_node
+    return llm_node(market_analyst_node)
@@ -5,48 +5,70 @@ import time
 import json
 from tradingagents.agents.utils.agent_utils import get_news, get_global_news, get_macro_indicators
 from tradingagents.dataflows.config import get_config
+from tradingagents.agents.utils.llm_steps import llm_node
+from tradingagents.agents.utils.tool_blobs import expand_tool_outputs
 
 
-def create_news_analyst(llm):
-    def news_analyst_node(state):
-        current_date = state["trade_date"]
-        ticker = state["company_of_interest"]
+def create_news_analyst(llm, tool_budget=None):
+    tools = [
+        get_news,
+        get_global_news,
+        get_macro_indicators,
+    ]
+
+    system_message = (
+        "You are a news researcher tasked with analyzing recent news and trends over the past week. Please write a comprehensive report of the current state of the world that is relevant for trading and macroeconomics. Use the available tools: get_news(query, start_date, end_date) for company-specific or targeted news searches, get_global_news(curr_date, look_back_days, limit) for broader macroeconomic news, and get_macro_indicators(curr_date) for key economic data from FRED (Fed Funds Rate, CPI, Unemployment, GDP, 10Y Treasury, Consumer Sentiment). The macro indicators provide hard data context for the news narrative — use them to ground your analysis in actual economic figures. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."
+        + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
+    )
 
-        tools = [
-            get_news,
-            get_global_news,
-            get_macro_indicators,
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a helpful AI assistant, collaborating with other assistants."
+                " Use the provided tools to progress towards answering the question."
+                " If you are unable to fully answer, that's OK; another assistant with different tools"
+                " will help where you left off. Execute what you can to make progress."
+                " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
+                " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
+                " You have access to the following tools: {tool_names}.\n{system_message}"
+                "For your reference, the current date is {current_date}. We are looking at the company {ticker}",
+            ),
+            MessagesPlaceholder(variable_name="messages"),
         ]
+    )
+
+    prompt = prompt.partial(system_message=system_message)
+    prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
+
+    # Built once; only the date and ticker are filled in per call
+    tool_chain = prompt | llm.bind_tools(tools)
+    report_chain = prompt | llm
 
-        system_message = (
-            "You are a news researcher tasked with analyzing recent news and trends over the past week. Please write a comprehensive report of the current state of the world that is relevant for trading and macroeconomics. Use the available tools: get_news(query, start_date, end_date) for company-specific or targeted news searches, get_global_news(curr_date, look_back_days, limit) for broader macroeconomic news, and get_macro_indicators(curr_date) for key economic data from FRED (Fed Funds Rate, CPI, Unemployment, GDP, 10Y Treasury, Consumer Sentiment). The macro indicators provide hard data context for the news narrative — use them to ground your analysis in actual economic figures. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."
-            + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
-        )
+    # Asks for the written report without tools
+    report_request = (
+        "Based on all the news and macro data gathered above, write your "
+        "comprehensive news analysis report now with a summary table at the end. "
+        "Do not attempt to call any tools."
+    )
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a helpful AI assistant, collaborating with other assistants."
-                    " Use the provided tools to progress towards answering the question."
-                    " If you are unable to fully answer, that's OK; another assistant with different tools"
-                    " will help where you left off. Execute what you can to make progress."
-                    " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
-                    " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
-                    " You have access to the following tools: {tool_names}.\n{system_message}"
-                    "For your reference, the current date is {current_date}. We are looking at the company {ticker}",
-                ),
-                MessagesPlaceholder(variable_name="messages"),
-            ]
-        )
+    def news_analyst_node(state):
+        prompt_vars = {
+            "current_date": state["trade_date"],
+            "ticker": state["company_of_interest"],
+        }
+        messages = expand_tool_outputs(state["messages"])
 
-        prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
-        prompt = prompt.partial(current_date=current_date)
-        prompt = prompt.partial(ticker=ticker)
+        if tool_budget is not None and tool_budget.exhausted(state["messages"]):
+            # Tool budget spent: write the report from the data gathered so far
+            nudge = HumanMessage(content=report_request)
+            result = yield report_chain, {"messages": messages + [nudge], **prompt_vars}
+            return {
+                "messages": [nudge, result],
+                "news_report": result.content or "",
+            }
 
-        chain = prompt | llm.bind_tools(tools)
-        result = chain.invoke(state["messages"])
+        result = yield tool_chain, {"messages": messages, **prompt_vars}
 
         if result.tool_calls:
             # Intermediate step — don't overwrite report with empty string
@@ -58,14 +80,9 @@ def create_news_analyst(llm):
         # Detect if model wrote inline tool calls instead of a real report
         if len(content) < 300 or re.search(r'get_\w+\s*\{', content):
             # Re-invoke LLM without tools to force a written analysis
-            report_chain = prompt | llm
-            nudge = HumanMessage(
-                content="Based on all the news and macro data gathered above, write your "
-                "comprehensive news analysis report now with a summary table at the end. "
-                "Do not attempt to call any tools."
-            )
-            retry_msgs = state["messages"] + [result, nudge]
-            retry_result = report_chain.invoke(retry_msgs)
+            nudge = HumanMessage(content=report_request)
+            retry_msgs = messages + [result, nudge]
+            retry_result = yield report_chain, {"messages": retry_msgs, **prompt_vars}
             report = retry_result.content or content
             return {
                 "messages": [result, nudge, retry_result],
@@ -77,4 +94,4 @@ def create_news_analyst(llm):
             "news_report": content,
         }
 
-    return news_analyst_node
+    return llm_node(news_analyst_node)
@@ -11,60 +11,80 @@ from tradingagents.agents.utils.agent_utils import (
     get_fear_greed_index,
 )
 from tradingagents.dataflows.config import get_config
+from tradingagents.agents.utils.llm_steps import llm_node
+from tradingagents.agents.utils.tool_blobs import expand_tool_outputs
 
 
-def create_social_media_analyst(llm):
-    def social_media_analyst_node(state):
-        current_date = state["trade_date"]
-        ticker = state["company_of_interest"]
-        company_name = state["company_of_interest"]
+def create_social_media_analyst(llm, tool_budget=None):
+    tools = [
+        get_reddit_sentiment,
+        get_stocktwits_sentiment,
+        get_search_trends,
+        get_fear_greed_index,
+        get_news,
+    ]
+
+    system_message = (
+        "You are a social media sentiment analyst tasked with gauging public opinion and retail investor sentiment for a specific company. You have access to multiple real data sources:\n\n"
+        "1. **get_reddit_sentiment(ticker, curr_date, look_back_days)** — Analyzes posts from r/wallstreetbets, r/stocks, r/investing for bull/bear sentiment\n"
+        "2. **get_stocktwits_sentiment(ticker)** — Gets bull/bear ratio and recent messages from the Stocktwits community\n"
+        "3. **get_search_trends(ticker, curr_date, look_back_days)** — Google Trends search interest showing public attention over time\n"
+        "4. **get_fear_greed_index(curr_date)** — CNN Fear & Greed Index (0-100) showing overall market sentiment\n"
+        "5. **get_news(ticker, start_date, end_date)** — Company-specific news for context\n\n"
+        "Use ALL available tools to build a comprehensive sentiment picture. Cross-reference signals across sources — if Reddit is bullish but Fear & Greed shows extreme greed, that's a different signal than if both are moderate. "
+        "Look for divergences between social sentiment and market sentiment indicators. Rising Google Trends interest combined with strong Reddit sentiment can signal incoming retail momentum. "
+        "Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."
+        + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
+    )
 
-        tools = [
-            get_reddit_sentiment,
-            get_stocktwits_sentiment,
-            get_search_trends,
-            get_fear_greed_index,
-            get_news,
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a helpful AI assistant, collaborating with other assistants."
+                " Use the provided tools to progress towards answering the question."
+                " If you are unable to fully answer, that's OK; another assistant with different tools"
+                " will help where you left off. Execute what you can to make progress."
+                " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
+                " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
+                " You have access to the following tools: {tool_names}.\n{system_message}"
+                "For your reference, the current date is {current_date}. The current company we want to analyze is {ticker}",
+            ),
+            MessagesPlaceholder(variable_name="messages"),
         ]
+    )
 
-        system_message = (
-            "You are a social media sentiment analyst tasked with gauging public opinion and retail investor sentiment for a specific company. You have access to multiple real data sources:\n\n"
-            "1. **get_reddit_sentiment(ticker, curr_date, look_back_days)** — Analyzes posts from r/wallstreetbets, r/stocks, r/investing for bull/bear sentiment\n"
-            "2. **get_stocktwits_sentiment(ticker)** — Gets bull/bear ratio and recent messages from the Stocktwits community\n"
-            "3. **get_search_trends(ticker, curr_date, look_back_days)** — Google Trends search interest showing public attention over time\n"
-            "4. **get_fear_greed_index(curr_date)** — CNN Fear & Greed Index (0-100) showing overall market sentiment\n"
-            "5. **get_news(ticker, start_date, end_date)** — Company-specific news for context\n\n"
-            "Use ALL available tools to build a comprehensive sentiment picture. Cross-reference signals across sources — if Reddit is bullish but Fear & Greed shows extreme greed, that's a different signal than if both are moderate. "
-            "Look for divergences between social sentiment and market sentiment indicators. Rising Google Trends interest combined with strong Reddit sentiment can signal incoming retail momentum. "
-            "Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."
-            + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
-        )
+    prompt = prompt.partial(system_message=system_message)
+    prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a helpful AI assistant, collaborating with other assistants."
-                    " Use the provided tools to progress towards answering the question."
-                    " If you are unable to fully answer, that's OK; another assistant with different tools"
-                    " will help where you left off. Execute what you can to make progress."
-                    " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
-                    " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
-                    " You have access to the following tools: {tool_names}.\n{system_message}"
-                    "For your reference, the current date is {current_date}. The current company we want to analyze is {ticker}",
-                ),
-                MessagesPlaceholder(variable_name="messages"),
-            ]
-        )
+    # Built once; only the date and ticker are filled in per call
+    tool_chain = prompt | llm.bind_tools(tools)
+    report_chain = prompt | llm
 
-        prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
-        prompt = prompt.partial(current_date=current_date)
-        prompt = prompt.partial(ticker=ticker)
+    # Asks for the written report without tools
+    report_request = (
+        "Based on all the sentiment data gathered above, write your "
+        "comprehensive social media sentiment report now with a summary table at the end. "
+        "Do not attempt to call any tools."
+    )
 
-        chain = prompt | llm.bind_tools(tools)
+    def social_media_analyst_node(state):
+        prompt_vars = {
+            "current_date": state["trade_date"],
+            "ticker": state["company_of_interest"],
+        }
+        messages = expand_tool_outputs(state["messages"])
+
+        if tool_budget is not None and tool_budget.exhausted(state["messages"]):
+            # Tool budget spent: write the report from the data gathered so far
+            nudge = HumanMessage(content=report_request)
+            result = yield report_chain, {"messages": messages + [nudge], **prompt_vars}
+            return {
+                "messages": [nudge, result],
+                "sentiment_report": result.content or "",
+            }
 
-        result = chain.invoke(state["messages"])
+        result = yield tool_chain, {"messages": messages, **prompt_vars}
 
         if result.tool_calls:
             # Intermediate step — don't overwrite report with empty string
@@ -76,14 +96,9 @@ def create_social_media_analyst(llm):
         # Detect if model wrote inline tool calls instead of a real report
         if len(content) < 300 or re.search(r'get_\w+\s*\{', content):
             # Re-invoke LLM without tools to force a written analysis
-            report_chain = prompt | llm
-            nudge = HumanMessage(
-                content="Based on all the sentiment data gathered above, write your "
-                "comprehensive social media sentiment report now with a summary table at the end. "
-                "Do not attempt to call any tools."
-            )
-            retry_msgs = state["messages"] + [result, nudge]
-            retry_result = report_chain.invoke(retry_msgs)
+            nudge = HumanMessage(content=report_request)
+            retry_msgs = messages + [result, nudge]
+            retry_result = yield report_chain, {"messages": retry_msgs, **prompt_vars}
             report = retry_result.content or content
             return {
                 "messages": [result, nudge, retry_result],
@@ -95,4 +110,4 @@ def create_social_media_analyst(llm):
             "sentiment_report": content,
         }
 
-    return social_media_analyst_node
+    return llm_node(social_media_analyst_node)
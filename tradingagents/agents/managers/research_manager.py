@@ -1,9 +1,11 @@
 import time
 import json
 
+from tradingagents.agents.utils.llm_steps import llm_node
+
 
 def create_research_manager(llm, memory):
-    def research_manager_node(state) -> dict:
+    def research_manager_node(state):
         history = state["investment_debate_state"].get("history", "")
         market_research_report = state["market_report"]
         sentiment_report = state["sentiment_report"]
@@ -36,7 +38,7 @@ Here are your past reflections on mistakes:
 Here is the debate:
 Debate History:
 {history}"""
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         new_investment_debate_state = {
             "judge_decision": response.content,
@@ -52,4 +54,4 @@ Debate History:
             "investment_plan": response.content,
         }
 
-    return research_manager_node
+    return llm_node(research_manager_node)
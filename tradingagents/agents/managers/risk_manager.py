@@ -1,9 +1,11 @@
 import time
 import json
 
+from tradingagents.agents.utils.llm_steps import llm_node
+
 
 def create_risk_manager(llm, memory):
-    def risk_manager_node(state) -> dict:
+    def risk_manager_node(state):
 
         company_name = state["company_of_interest"]
 
@@ -43,7 +45,7 @@ Deliverables:
 
 Focus on actionable insights and continuous improvement. Build on past lessons, critically evaluate all perspectives, and ensure each decision advances better outcomes."""
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         new_risk_debate_state = {
             "judge_decision": response.content,
@@ -63,4 +65,4 @@ Focus on actionable insights and continuous improvement. Build on past lessons,
             "final_trade_decision": response.content,
         }
 
-    return risk_manager_node
+    return llm_node(risk_manager_node)
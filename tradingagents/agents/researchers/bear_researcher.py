@@ -1,12 +1,17 @@
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, HumanMessage
 import time
 import json
 
+from tradingagents.agents.utils.agent_utils import STANCE_INSTRUCTION, build_shared_report_message
+from tradingagents.agents.utils.debate_history import debate_history_for_prompt
+from tradingagents.agents.utils.llm_steps import llm_node
 
-def create_bear_researcher(llm, memory):
-    def bear_node(state) -> dict:
+
+def create_bear_researcher(llm, memory, history_compactor=None, ask_stance=False):
+    def bear_node(state):
         investment_debate_state = state["investment_debate_state"]
         history = investment_debate_state.get("history", "")
+        prompt_history, history_fields = yield from debate_history_for_prompt(investment_debate_state, history_compactor)
         bear_history = investment_debate_state.get("bear_history", "")
 
         current_response = investment_debate_state.get("current_response", "")
@@ -34,17 +39,17 @@ Key points to focus on:
 
 Resources available:
 
-Market research report: {market_research_report}
-Social media sentiment report: {sentiment_report}
-Latest world affairs news: {news_report}
-Company fundamentals report: {fundamentals_report}
-Conversation history of the debate: {history}
+Market research, social media sentiment, world affairs news and company fundamentals reports: provided above
+Conversation history of the debate: {prompt_history}
 Last bull argument: {current_response}
 Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bear argument, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in the stock. You must also address reflections and learn from lessons and mistakes you made in the past.
 """
 
-        response = llm.invoke(prompt)
+        if ask_stance:
+            prompt += "\n\n" + STANCE_INSTRUCTION
+
+        response = yield llm, [build_shared_report_message(state), HumanMessage(content=prompt)]
 
         argument = f"Bear Analyst: {response.content}"
 
@@ -54,8 +59,9 @@ Use this information to deliver a compelling bear argument, refute the bull's cl
             "bull_history": investment_debate_state.get("bull_history", ""),
             "current_response": argument,
             "count": investment_debate_state["count"] + 1,
+            **history_fields,
         }
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bear_node
+    return llm_node(bear_node)
@@ -1,11 +1,18 @@
 import time
 import json
 
+from langchain_core.messages import HumanMessage
 
-def create_aggressive_debator(llm):
-    def aggressive_node(state) -> dict:
+from tradingagents.agents.utils.agent_utils import STANCE_INSTRUCTION, build_shared_report_message
+from tradingagents.agents.utils.debate_history import debate_history_for_prompt
+from tradingagents.agents.utils.llm_steps import llm_node
+
+
+def create_aggressive_debator(llm, history_compactor=None, ask_stance=False):
+    def aggressive_node(state):
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
+        prompt_history, history_fields = yield from debate_history_for_prompt(risk_debate_state, history_compactor)
         aggressive_history = risk_debate_state.get("aggressive_history", "")
 
         current_conservative_response = risk_debate_state.get("current_conservative_response", "")
@@ -24,15 +31,15 @@ def create_aggressive_debator(llm):
 
 Your task is to create a compelling case for the trader's decision by questioning and critiquing the conservative and neutral stances to demonstrate why your high-reward perspective offers the best path forward. Incorporate insights from the following sources into your arguments:
 
-Market Research Report: {market_research_report}
-Social Media Sentiment Report: {sentiment_report}
-Latest World Affairs Report: {news_report}
-Company Fundamentals Report: {fundamentals_report}
-Here is the current conversation history: {history} Here are the last arguments from the conservative analyst: {current_conservative_response} Here are the last arguments from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not hallucinate and just present your point.
+The Market Research, Social Media Sentiment, Latest World Affairs and Company Fundamentals Reports are provided above.
+Here is the current conversation history: {prompt_history} Here are the last arguments from the conservative analyst: {current_conservative_response} Here are the last arguments from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not hallucinate and just present your point.
 
 Engage actively by addressing any specific concerns raised, refuting the weaknesses in their logic, and asserting the benefits of risk-taking to outpace market norms. Maintain a focus on debating and persuading, not just presenting data. Challenge each counterpoint to underscore why a high-risk approach is optimal. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        if ask_stance:
+            prompt += "\n\n" + STANCE_INSTRUCTION
+
+        response = yield llm, [build_shared_report_message(state), HumanMessage(content=prompt)]
 
         argument = f"Aggressive Analyst: {response.content}"
 
@@ -48,8 +55,9 @@ Engage actively by addressing any specific concerns raised, refuting the weaknes
                 "current_neutral_response", ""
             ),
             "count": risk_debate_state["count"] + 1,
+            **history_fields,
         }
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return aggressive_node
+    return llm_node(aggressive_node)
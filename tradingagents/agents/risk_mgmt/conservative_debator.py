@@ -1,12 +1,17 @@
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, HumanMessage
 import time
 import json
 
+from tradingagents.agents.utils.agent_utils import STANCE_INSTRUCTION, build_shared_report_message
+from tradingagents.agents.utils.debate_history import debate_history_for_prompt
+from tradingagents.agents.utils.llm_steps import llm_node
 
-def create_conservative_debator(llm):
-    def conservative_node(state) -> dict:
+
+def create_conservative_debator(llm, history_compactor=None, ask_stance=False):
+    def conservative_node(state):
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
+        prompt_history, history_fields = yield from debate_history_for_prompt(risk_debate_state, history_compactor)
         conservative_history = risk_debate_state.get("conservative_history", "")
 
         current_aggressive_response = risk_debate_state.get("current_aggressive_response", "")
@@ -25,15 +30,15 @@ def create_conservative_debator(llm):
 
 Your task is to actively counter the arguments of the Aggressive and Neutral Analysts, highlighting where their views may overlook potential threats or fail to prioritize sustainability. Respond directly to their points, drawing from the following data sources to build a convincing case for a low-risk approach adjustment to the trader's decision:
 
-Market Research Report: {market_research_report}
-Social Media Sentiment Report: {sentiment_report}
-Latest World Affairs Report: {news_report}
-Company Fundamentals Report: {fundamentals_report}
-Here is the current conversation history: {history} Here is the last response from the aggressive analyst: {current_aggressive_response} Here is the last response from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not hallucinate and just present your point.
+The Market Research, Social Media Sentiment, Latest World Affairs and Company Fundamentals Reports are provided above.
+Here is the current conversation history: {prompt_history} Here is the last response from the aggressive analyst: {current_aggressive_response} Here is the last response from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not hallucinate and just present your point.
 
 Engage by questioning their optimism and emphasizing the potential downsides they may have overlooked. Address each of their counterpoints to showcase why a conservative stance is ultimately the safest path for the firm's assets. Focus on debating and critiquing their arguments to demonstrate the strength of a low-risk strategy over their approaches. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        if ask_stance:
+            prompt += "\n\n" + STANCE_INSTRUCTION
+
+        response = yield llm, [build_shared_report_message(state), HumanMessage(content=prompt)]
 
         argument = f"Conservative Analyst: {response.content}"
 
@@ -51,8 +56,9 @@ Engage by questioning their optimism and emphasizing the potential downsides the
                 "current_neutral_response", ""
             ),
             "count": risk_debate_state["count"] + 1,
+            **history_fields,
         }
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return conservative_node
+    return llm_node(conservative_node)
@@ -1,11 +1,18 @@
 import time
 import json
 
+from langchain_core.messages import HumanMessage
 
-def create_neutral_debator(llm):
-    def neutral_node(state) -> dict:
+from tradingagents.agents.utils.agent_utils import STANCE_INSTRUCTION, build_shared_report_message
+from tradingagents.agents.utils.debate_history import debate_history_for_prompt
+from tradingagents.agents.utils.llm_steps import llm_node
+
+
+def create_neutral_debator(llm, history_compactor=None, ask_stance=False):
+    def neutral_node(state):
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
+        prompt_history, history_fields = yield from debate_history_for_prompt(risk_debate_state, history_compactor)
         neutral_history = risk_debate_state.get("neutral_history", "")
 
         current_aggressive_response = risk_debate_state.get("current_aggressive_response", "")
@@ -24,15 +31,15 @@ def create_neutral_debator(llm):
 
 Your task is to challenge both the Aggressive and Conservative Analysts, pointing out where each perspective may be overly optimistic or overly cautious. Use insights from the following data sources to support a moderate, sustainable strategy to adjust the trader's decision:
 
-Market Research Report: {market_research_report}
-Social Media Sentiment Report: {sentiment_report}
-Latest World Affairs Report: {news_report}
-Company Fundamentals Report: {fundamentals_report}
-Here is the current conversation history: {history} Here is the last response from the aggressive analyst: {current_aggressive_response} Here is the last response from the conservative analyst: {current_conservative_response}. If there are no responses from the other viewpoints, do not hallucinate and just present your point.
+The Market Research, Social Media Sentiment, Latest World Affairs and Company Fundamentals Reports are provided above.
+Here is the current conversation history: {prompt_history} Here is the last response from the aggressive analyst: {current_aggressive_response} Here is the last response from the conservative analyst: {current_conservative_response}. If there are no responses from the other viewpoints, do not hallucinate and just present your point.
 
 Engage actively by analyzing both sides critically, addressing weaknesses in the aggressive and conservative arguments to advocate for a more balanced approach. Challenge each of their points to illustrate why a moderate risk strategy might offer the best of both worlds, providing growth potential while safeguarding against extreme volatility. Focus on debating rather than simply presenting data, aiming to show that a balanced view can lead to the most reliable outcomes. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        if ask_stance:
+            prompt += "\n\n" + STANCE_INSTRUCTION
+
+        response = yield llm, [build_shared_report_message(state), HumanMessage(content=prompt)]
 
         argument = f"Neutral Analyst: {response.content}"
 
@@ -48,8 +55,9 @@ Engage actively by analyzing both sides critically, addressing weaknesses in the
             "current_conservative_response": risk_debate_state.get("current_conservative_response", ""),
             "current_neutral_response": argument,
             "count": risk_debate_state["count"] + 1,
+            **history_fields,
         }
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return neutral_node
+    return llm_node(neutral_node)
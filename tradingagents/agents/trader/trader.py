@@ -2,6 +2,8 @@ import functools
 import time
 import json
 
+from tradingagents.agents.utils.llm_steps import llm_node
+
 
 def create_trader(llm, memory):
     def trader_node(state, name):
@@ -35,7 +37,7 @@ def create_trader(llm, memory):
             context,
         ]
 
-        result = llm.invoke(messages)
+        result = yield llm, messages
 
         return {
             "messages": [result],
@@ -43,4 +45,4 @@ def create_trader(llm, memory):
             "sender": name,
         }
 
-    return functools.partial(trader_node, name="Trader")
+    return llm_node(functools.partial(trader_node, name="Trader"))
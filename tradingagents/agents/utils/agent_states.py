@@ -1,7 +1,6 @@
 from typing import Annotated, Sequence
 from datetime import date, timedelta, datetime
 from typing_extensions import TypedDict, Optional
-from langchain_openai import ChatOpenAI
 from tradingagents.agents import *
 from langgraph.prebuilt import ToolNode
 from langgraph.graph import END, StateGraph, START, MessagesState
@@ -16,6 +15,8 @@ class InvestDebateState(TypedDict):
         str, "Bearish Conversation history"
     ]  # Bullish Conversation history
     history: Annotated[str, "Conversation history"]  # Conversation history
+    history_summary: Annotated[str, "Rolling summary of compacted older turns"]
+    summarized_turns: Annotated[int, "Number of turns folded into history_summary"]
     current_response: Annotated[str, "Latest response"]  # Last response
     judge_decision: Annotated[str, "Final judge decision"]  # Last response
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
@@ -33,6 +34,8 @@ class RiskDebateState(TypedDict):
         str, "Neutral Agent's Conversation history"
     ]  # Conversation history
     history: Annotated[str, "Conversation history"]  # Conversation history
+    history_summary: Annotated[str, "Rolling summary of compacted older turns"]
+    summarized_turns: Annotated[int, "Number of turns folded into history_summary"]
     latest_speaker: Annotated[str, "Analyst that spoke last"]
     current_aggressive_response: Annotated[
         str, "Latest response by the aggressive analyst"
@@ -47,9 +50,28 @@ class RiskDebateState(TypedDict):
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
 
 
+def merge_risk_debate_state(current: dict, update: dict) -> dict:
+    """Reducer for risk_debate_state.
+
+    Sequential debators return the whole new state, which replaces the
+    current one. In parallel rounds the three debators write concurrently,
+    so each returns a round update ({"round_update": True, "speaker",
+    "argument", "fields"}) instead: its own fields are set, its argument is
+    appended to the shared history and the count advances by one.
+    """
+    if not update.get("round_update"):
+        return update
+    merged = {**(current or {}), **update["fields"]}
+    merged["history"] = (current or {}).get("history", "") + "\n" + update["argument"]
+    merged["latest_speaker"] = update["speaker"]
+    merged["count"] = (current or {}).get("count", 0) + 1
+    return merged
+
+
 class AgentState(MessagesState):
     company_of_interest: Annotated[str, "Company that we are interested in trading"]
     trade_date: Annotated[str, "What date we are trading at"]
+    run_id: Annotated[str, "Id of this propagate run (scopes the tool-call memo)"]
 
     sender: Annotated[str, "Agent that sent this message"]
 
@@ -71,6 +93,8 @@ class AgentState(MessagesState):
 
     # risk management team discussion step
     risk_debate_state: Annotated[
-        RiskDebateState, "Current state of the debate on evaluating risk"
+        RiskDebateState,
+        "Current state of the debate on evaluating risk",
+        merge_risk_debate_state,
     ]
     final_trade_decision: Annotated[str, "Final decision made by the Risk Analysts"]
@@ -1,4 +1,6 @@
-from langchain_core.messages import HumanMessage, RemoveMessage
+from langchain_core.messages import HumanMessage, RemoveMessage, SystemMessage
+
+from tradingagents.llm_clients.prompt_cache import mark_cache_prefix
 
 # Import tools from separate utility files
 from tradingagents.agents.utils.core_stock_tools import (
@@ -39,13 +41,40 @@ from tradingagents.agents.utils.social_media_tools import (
 
 # Phase 3: SEC EDGAR, CoinGecko
 from tradingagents.agents.utils.sec_tools import (
-    get_sec_filings
+    get_sec_filings,
+    get_sec_filing_section
 )
 from tradingagents.agents.utils.crypto_tools import (
     get_crypto_data,
+    get_crypto_markets,
     get_crypto_fear_greed
 )
 
+# Appended to debate prompts when debates may stop early on agreement, so
+# each turn ends with a stance that can be read without another LLM call
+STANCE_INSTRUCTION = (
+    "Finish with one final line of the form \"Stance: BUY\", \"Stance: HOLD\" "
+    "or \"Stance: SELL\" naming the action you currently support."
+)
+
+
+def build_shared_report_message(state) -> SystemMessage:
+    """Analyst-report block shared verbatim by every debate prompt.
+
+    The text depends only on the ticker, trade date and the four reports, so
+    it is byte-identical across the bull/bear and risk debators and is
+    marked as a cacheable prompt prefix for the provider.
+    """
+    content = (
+        f"Analyst reports for {state['company_of_interest']} as of {state['trade_date']}.\n\n"
+        f"## Market Research Report\n{state['market_report']}\n\n"
+        f"## Social Media Sentiment Report\n{state['sentiment_report']}\n\n"
+        f"## Latest World Affairs Report\n{state['news_report']}\n\n"
+        f"## Company Fundamentals Report\n{state['fundamentals_report']}"
+    )
+    return mark_cache_prefix(SystemMessage(content=content))
+
+
 def create_msg_delete():
     def delete_messages(state):
         """Clear messages and add placeholder for Anthropic compatibility"""
@@ -23,11 +23,30 @@ def get_crypto_data(
 
 
 @tool
-def get_crypto_fear_greed() -> str:
+def get_crypto_markets(
+    symbols: Annotated[str, "comma-separated crypto symbols e.g. BTC,ETH,SOL"],
+) -> str:
+    """
+    Get a market snapshot (price, rank, market cap, volume, 24h/7d/30d change)
+    for a basket of cryptocurrencies in a single bulk CoinGecko request.
+    Args:
+        symbols (str): Comma-separated crypto symbols (e.g. BTC,ETH,SOL)
+    Returns:
+        str: Table with one row per coin
+    """
+    return route_to_vendor("get_crypto_markets", symbols)
+
+
+@tool
+def get_crypto_fear_greed(
+    curr_date: Annotated[str, "current date in yyyy-mm-dd format"],
+) -> str:
     """
-    Get the Crypto Fear & Greed Index (0-100) with recent trend.
+    Get the Crypto Fear & Greed Index (0-100) with recent trend as of a date.
     0 = Extreme Fear, 100 = Extreme Greed.
+    Args:
+        curr_date (str): Current date in yyyy-mm-dd format
     Returns:
         str: Crypto Fear & Greed report with score and historical trend
     """
-    return route_to_vendor("get_crypto_fear_greed")
+    return route_to_vendor("get_crypto_fear_greed", curr_date)
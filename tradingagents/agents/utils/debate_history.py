@@ -0,0 +1,90 @@
+"""Token-budgeted view of a debate history for the next speaker's prompt.
+
+The full ``history`` string in the debate state is never modified (judges,
+reflection and logs still read it). Speakers instead see a rolling summary
+of the older turns followed by the last few turns verbatim, so each prompt
+stays near the budget and a long debate costs close to linear in tokens.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from tradingagents.agents.utils.llm_steps import Steps, run_steps
+
+# Debate turns are appended as "\n<Speaker> Analyst: <argument>"
+_TURN_START = re.compile(r"\n(?=(?:Bull|Bear|Aggressive|Conservative|Neutral) Analyst: )")
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4
+
+
+def split_turns(history: str) -> List[str]:
+    """Split an appended debate history into its individual turns."""
+    return [turn.strip() for turn in _TURN_START.split(history) if turn.strip()]
+
+
+class DebateHistoryCompactor:
+    """Folds older debate turns into a rolling summary once over budget."""
+
+    def __init__(self, llm, budget_tokens: int, keep_turns: int = 2, summarize: bool = True):
+        self.llm = llm
+        self.budget_tokens = budget_tokens
+        self.keep_turns = keep_turns
+        self.summarize = summarize
+
+    def read_only(self) -> "DebateHistoryCompactor":
+        """A compactor that only reads the summary already in the state.
+
+        For speakers running concurrently on one snapshot, after a single
+        compaction step has folded their history.
+        """
+        return DebateHistoryCompactor(self.llm, self.budget_tokens, self.keep_turns, summarize=False)
+
+    def _summarize_steps(self, summary: str, turns: List[str]) -> Steps:
+        prompt = f"""You maintain a running summary of a trading debate between analysts. Merge the new turns below into the existing summary. Keep every distinct argument, the data points cited for it, and which analyst made it; drop repetition and rhetoric. Keep the result under {self.budget_tokens // 2} tokens and output only the updated summary.
+
+Existing summary:
+{summary or "(none)"}
+
+New turns:
+{chr(10).join(turns)}"""
+        response = yield self.llm, prompt
+        return response.content
+
+    def compact(self, debate_state: Dict) -> Tuple[str, Dict]:
+        """Return (history text for the prompt, summary fields to carry in state)."""
+        return run_steps(self.compact_steps(debate_state))
+
+    def compact_steps(self, debate_state: Dict) -> Steps:
+        """Step-generator form of compact, for use inside agent nodes."""
+        summary = debate_state.get("history_summary", "")
+        summarized = debate_state.get("summarized_turns", 0)
+        turns = split_turns(debate_state.get("history", ""))
+
+        recent = turns[summarized:]
+        if self.summarize and _estimate_tokens(summary + "\n".join(recent)) > self.budget_tokens:
+            fold_until = max(summarized, len(turns) - self.keep_turns)
+            if fold_until > summarized:
+                summary = yield from self._summarize_steps(summary, turns[summarized:fold_until])
+                summarized = fold_until
+                recent = turns[summarized:]
+
+        fields = {"history_summary": summary, "summarized_turns": summarized}
+        if not summary:
+            return debate_state.get("history", ""), fields
+
+        view = f"Summary of earlier turns:\n{summary}\n\nMost recent turns:\n" + "\n".join(recent)
+        return view, fields
+
+
+def debate_history_for_prompt(
+    debate_state: Dict, compactor: Optional[DebateHistoryCompactor]
+) -> Steps:
+    """Full history when compaction is off, otherwise the compacted view.
+
+    A step generator: use ``prompt_history, fields = yield from ...``.
+    """
+    if compactor is None:
+        return debate_state.get("history", ""), {}
+    return (yield from compactor.compact_steps(debate_state))
@@ -0,0 +1,54 @@
+"""Agent nodes with a sync and an async path written once.
+
+A node body is a generator that yields ``(runnable, input)`` for each LLM
+call and is sent the response back; its return value is the node's state
+update:
+
+    def bull_steps(state):
+        response = yield llm, messages
+        return {"investment_debate_state": {...}}
+
+``llm_node`` turns it into a graph node that makes those calls with
+``invoke`` under ``graph.invoke``/``stream`` and with ``ainvoke`` under
+``ainvoke``/``astream``, so one event loop can drive many runs without a
+thread per run. Helpers that call an LLM are composed with ``yield from``.
+"""
+
+from typing import Any, Callable, Generator, Tuple
+
+from langchain_core.runnables import RunnableLambda
+
+# A node body: yields (runnable, input), receives responses, returns the update
+Steps = Generator[Tuple[Any, Any], Any, Any]
+
+
+def run_steps(steps: Steps) -> Any:
+    """Drive a step generator with blocking ``invoke`` calls."""
+    try:
+        runnable, payload = next(steps)
+        while True:
+            runnable, payload = steps.send(runnable.invoke(payload))
+    except StopIteration as done:
+        return done.value
+
+
+async def arun_steps(steps: Steps) -> Any:
+    """Drive a step generator with ``ainvoke`` calls."""
+    try:
+        runnable, payload = next(steps)
+        while True:
+            runnable, payload = steps.send(await runnable.ainvoke(payload))
+    except StopIteration as done:
+        return done.value
+
+
+def llm_node(steps_fn: Callable[[Any], Steps]) -> RunnableLambda:
+    """Build a graph node running ``steps_fn(state)`` on the sync or async path."""
+
+    def node(state):
+        return run_steps(steps_fn(state))
+
+    async def anode(state):
+        return await arun_steps(steps_fn(state))
+
+    return RunnableLambda(node, afunc=anode, name=getattr(steps_fn, "__name__", None))
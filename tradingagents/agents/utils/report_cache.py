@@ -0,0 +1,194 @@
+"""Cache of final analyst reports, so re-runs can skip the analyst phase.
+
+Re-running a ticker/date to try different debate or risk settings would
+otherwise regenerate every analyst report. Reports are stored per
+(analyst, ticker, trade_date, model, context) together with the tool calls
+the analyst made and a fingerprint of their outputs. The context is a hash
+of the analyst's prompt and of the config that shapes its report (data
+vendors, tool output caps, ...), so editing either invalidates old reports.
+On a re-run the stored tool calls are replayed against the data vendors (no
+LLM involved); if the data is unchanged the stored report is used and the
+analyst finishes at once.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.runnables import RunnableLambda
+
+from tradingagents.agents.utils.tool_blobs import full_tool_output
+
+logger = logging.getLogger(__name__)
+
+# (tool name, args, output) for each tool call an analyst made
+ToolRecord = Tuple[str, Dict[str, Any], str]
+
+
+def _fingerprint(records: Any) -> str:
+    raw = json.dumps(records, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def prompt_fingerprint(create_analyst) -> str:
+    """Hash of an analyst factory's source, which holds its prompts."""
+    return _fingerprint(inspect.getsource(create_analyst))
+
+
+def _tool_records(messages) -> List[ToolRecord]:
+    """Pair each tool call in an analyst's messages with the output it got."""
+    outputs = {m.tool_call_id: full_tool_output(m) for m in messages if isinstance(m, ToolMessage)}
+    records = []
+    for message in messages:
+        for call in getattr(message, "tool_calls", None) or []:
+            if call["id"] in outputs:
+                records.append((call["name"], call["args"], str(outputs[call["id"]])))
+    return records
+
+
+class AnalystReportCache:
+    """Analyst reports in a local SQLite file, validated against fresh tool outputs.
+
+    ``settings`` holds the config values that change what an analyst
+    writes; reports made under different settings are kept apart.
+    """
+
+    def __init__(self, path: str, model: str, settings: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self.model = model
+        self.settings = settings or {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # Reports from before the context column cannot be told apart
+            self._conn.execute("DROP TABLE IF EXISTS analyst_reports")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS analyst_report_entries ("
+                "analyst TEXT, ticker TEXT, trade_date TEXT, model TEXT, context TEXT, "
+                "tool_calls TEXT NOT NULL, fingerprint TEXT NOT NULL, report TEXT NOT NULL, "
+                "PRIMARY KEY (analyst, ticker, trade_date, model, context))"
+            )
+            self._conn.commit()
+
+    def context(self, prompt: str) -> str:
+        """Cache context for an analyst with the given prompt fingerprint."""
+        return _fingerprint({"prompt": prompt, "settings": self.settings})
+
+    def lookup(
+        self, analyst: str, ticker: str, trade_date: str, tools: Dict[str, Any], context: str = ""
+    ) -> Optional[str]:
+        """Return the cached report if re-running its tool calls gives the same data."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tool_calls, fingerprint, report FROM analyst_report_entries "
+                "WHERE analyst = ? AND ticker = ? AND trade_date = ? AND model = ? AND context = ?",
+                (analyst, ticker, trade_date, self.model, context),
+            ).fetchone()
+        if row is not None and self._still_valid(json.loads(row[0]), row[1], tools):
+            with self._lock:
+                self.hits += 1
+            return row[2]
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _still_valid(self, calls: List[List[Any]], fingerprint: str, tools: Dict[str, Any]) -> bool:
+        try:
+            records = [(name, args, str(tools[name].invoke(args))) for name, args in calls]
+        except Exception as e:
+            logger.info(f"Cached analyst report not reusable: {e.__class__.__name__}: {e}")
+            return False
+        return _fingerprint(records) == fingerprint
+
+    def store(
+        self, analyst: str, ticker: str, trade_date: str, report: str, messages, context: str = ""
+    ) -> None:
+        """Store a report with the tool calls (and their outputs) it was based on."""
+        records = _tool_records(messages)
+        calls = json.dumps([[name, args] for name, args, _ in records], default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analyst_report_entries "
+                "(analyst, ticker, trade_date, model, context, tool_calls, fingerprint, report) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (analyst, ticker, trade_date, self.model, context, calls, _fingerprint(records), report),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Delete every cached report."""
+        with self._lock:
+            self._conn.execute("DELETE FROM analyst_report_entries")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit/miss counters since this cache was opened."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+def with_report_cache(
+    analyst_node,
+    analyst: str,
+    report_key: str,
+    cache: AnalystReportCache,
+    tools: Dict[str, Any],
+    prompt: str = "",
+):
+    """Wrap an analyst node so it answers from the report cache when it can.
+
+    The cache is consulted on the analyst's first turn only (before it has
+    made any tool call); a hit returns the report as a final message with
+    no tool calls, so the analyst's tool loop ends immediately. ``prompt``
+    is the analyst's prompt fingerprint (see ``prompt_fingerprint``).
+    """
+    context = cache.context(prompt)
+
+    def is_first_turn(state):
+        return not any(isinstance(m, AIMessage) for m in state["messages"])
+
+    def cached_result(report):
+        return {"messages": [AIMessage(content=report)], report_key: report}
+
+    def cached_analyst_node(state):
+        ticker, trade_date = state["company_of_interest"], state["trade_date"]
+        if is_first_turn(state):
+            report = cache.lookup(analyst, ticker, trade_date, tools, context)
+            if report is not None:
+                return cached_result(report)
+
+        result = analyst_node.invoke(state)
+        if result.get(report_key):
+            cache.store(analyst, ticker, trade_date, result[report_key], state["messages"], context)
+        return result
+
+    async def acached_analyst_node(state):
+        ticker, trade_date = state["company_of_interest"], state["trade_date"]
+        if is_first_turn(state):
+            # Replaying the tool calls is blocking data-vendor I/O
+            report = await asyncio.to_thread(cache.lookup, analyst, ticker, trade_date, tools, context)
+            if report is not None:
+                return cached_result(report)
+
+        result = await analyst_node.ainvoke(state)
+        if result.get(report_key):
+            # SQLite writes block; keep them off the event loop
+            await asyncio.to_thread(
+                cache.store, analyst, ticker, trade_date, result[report_key], state["messages"], context
+            )
+        return result
+
+    return RunnableLambda(cached_analyst_node, afunc=acached_analyst_node)
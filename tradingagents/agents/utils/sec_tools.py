@@ -20,3 +20,26 @@ def get_sec_filings(
         str: SEC filing report with dates, descriptions, and excerpts
     """
     return route_to_vendor("get_sec_filings", ticker, filing_type, limit)
+
+
+@tool
+def get_sec_filing_section(
+    ticker: Annotated[str, "ticker symbol of the company"],
+    section: Annotated[str, "10-K item: 1 (Business), 1A (Risk Factors), 7 (MD&A), 7A (Market Risk)"],
+    query: Annotated[str, "optional keywords to pick the most relevant paragraphs"] = "",
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"] = None,
+) -> str:
+    """
+    Retrieve one section of the company's latest 10-K filed on or before the
+    current date: Item 1 (Business), 1A (Risk Factors), 7 (MD&A) or 7A
+    (Market Risk). With a query, returns only the most relevant paragraphs
+    of that section.
+    Args:
+        ticker (str): Ticker symbol (e.g. AAPL, NVDA)
+        section (str): Item number: 1, 1A, 7 or 7A
+        query (str): Optional keywords, e.g. "supply chain China"
+        curr_date (str): Current date you are trading at, yyyy-mm-dd
+    Returns:
+        str: Section text or its top-scoring paragraphs
+    """
+    return route_to_vendor("get_sec_filing_section", ticker, section, query, curr_date)
@@ -0,0 +1,185 @@
+"""Out-of-band storage for large tool outputs.
+
+Multi-year OHLCV CSVs, full statements and options tables would otherwise
+live in ``AgentState.messages`` as full strings, copied into every
+``stream_mode="values"`` chunk until the analyst's messages are cleared.
+With a blob store configured, a tool output longer than the spill size is
+written to a content-addressed file and its ToolMessage keeps only a
+handle and a short preview. The full text is read back only when the
+analyst's prompt is built (``expand_tool_outputs``), cut to the tool's
+cap, so the LLM never sees more than that many characters from one call.
+
+Blobs are shared by all runs (identical outputs are stored once) and
+pruned by age and total size: a blob unused for max_age_seconds, or the
+least recently used ones beyond max_bytes, are deleted. Checkpointed runs
+(``checkpoint_path``) read their blobs back when resumed, so the retention
+must cover how long checkpoints are kept; a blob pruned anyway degrades to
+its preview with a note instead of failing the run.
+
+Example config:
+    "tool_blob_dir": "./results/tool_blobs",
+    "tool_output_spill_chars": 4000,
+    "tool_output_caps": {"get_stock_data": 20000, "default": 40000},
+    "tool_blob_max_age_days": 7,
+    "tool_blob_max_mb": 1024,
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from langchain_core.messages import ToolMessage
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_CHARS = 500
+
+# Spills between two pruning passes over the blob directory
+PRUNE_EVERY_SPILLS = 200
+
+
+class ToolBlobStore:
+    """Spills large ToolMessage contents to files under a directory."""
+
+    def __init__(
+        self,
+        directory: str,
+        spill_chars: int = 4000,
+        caps: Optional[Dict[str, int]] = None,
+        max_age_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self.directory = directory
+        self.spill_chars = spill_chars
+        self.caps = dict(caps or {})
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self._spills = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.prune()
+
+    def prune(self) -> int:
+        """Delete blobs past the age limit, then the least recently used over the size limit.
+
+        Returns the number of blobs deleted.
+        """
+        if self.max_age_seconds is None and self.max_bytes is None:
+            return 0
+        blobs = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".txt"):
+                stat = entry.stat()
+                blobs.append((stat.st_mtime, stat.st_size, entry.path))
+        blobs.sort()
+
+        now = time.time()
+        total = sum(size for _, size, _ in blobs)
+        removed = 0
+        for mtime, size, path in blobs:
+            expired = self.max_age_seconds is not None and now - mtime > self.max_age_seconds
+            oversize = self.max_bytes is not None and total > self.max_bytes
+            if not (expired or oversize):
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        if removed:
+            logger.info(f"Pruned {removed} tool output blobs from {self.directory}")
+        return removed
+
+    def cap_for(self, tool_name: str) -> Optional[int]:
+        """Most characters of this tool's output the LLM should see (None = all)."""
+        return self.caps.get(tool_name, self.caps.get("default"))
+
+    def spill(self, message: ToolMessage) -> ToolMessage:
+        """Return the message as stored in state: unchanged, or a handle plus preview."""
+        content = message.content
+        cap = self.cap_for(message.name or "")
+        limit = self.spill_chars if cap is None else min(self.spill_chars, cap)
+        if not isinstance(content, str) or len(content) <= limit:
+            return message
+
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        path = os.path.join(self.directory, f"{digest}.txt")
+        if os.path.exists(path):
+            # Reused blobs count as recently used when pruning
+            os.utime(path)
+        else:
+            # Write-then-rename so concurrent runs never read a partial blob
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            self._spills += 1
+            prune_now = self._spills % PRUNE_EVERY_SPILLS == 0
+        if prune_now:
+            self.prune()
+
+        handle = (
+            f"[{len(content)} characters stored out of band as {digest[:16]}; preview:]\n"
+            f"{content[:PREVIEW_CHARS]}"
+        )
+        return message.model_copy(
+            update={
+                "content": handle,
+                "artifact": {"blob_path": path, "chars": len(content), "cap": cap},
+            }
+        )
+
+    def wrap_tool_call(self, request, execute):
+        """ToolNode ``wrap_tool_call`` hook spilling each result."""
+        result = execute(request)
+        return self.spill(result) if isinstance(result, ToolMessage) else result
+
+    async def awrap_tool_call(self, request, execute):
+        """ToolNode ``awrap_tool_call`` hook spilling each result."""
+        result = await execute(request)
+        return self.spill(result) if isinstance(result, ToolMessage) else result
+
+
+def _blob(message) -> Optional[dict]:
+    artifact = getattr(message, "artifact", None)
+    if isinstance(message, ToolMessage) and isinstance(artifact, dict) and "blob_path" in artifact:
+        return artifact
+    return None
+
+
+def full_tool_output(message: ToolMessage) -> str:
+    """The complete output of a tool call, reading a spilled blob if needed.
+
+    A blob that has been pruned since is replaced by the stored preview.
+    """
+    blob = _blob(message)
+    if blob is None:
+        return str(message.content)
+    try:
+        with open(blob["blob_path"], "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        logger.warning(f"Tool output blob {blob['blob_path']} no longer exists; using its preview")
+        return f"{message.content}\n[... full output no longer available]"
+
+
+def expand_tool_outputs(messages: List) -> List:
+    """Messages for an LLM prompt, with spilled outputs read back up to their cap."""
+    expanded = []
+    for message in messages:
+        blob = _blob(message)
+        if blob is None:
+            expanded.append(message)
+            continue
+        content = full_tool_output(message)
+        cap = blob.get("cap")
+        if cap is not None and len(content) > cap:
+            content = f"{content[:cap]}\n[... truncated: showing {cap} of {len(content)} characters]"
+        expanded.append(message.model_copy(update={"content": content}))
+    return expanded
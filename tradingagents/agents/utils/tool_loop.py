@@ -0,0 +1,118 @@
+"""Bounds and de-duplication for the analysts' tool loops.
+
+Without these, an analyst's tool loop is bounded only by the graph's
+recursion limit, and a model that re-requests the same data (e.g.
+``get_stock_data`` with identical arguments) pays for the fetch each time.
+
+- ``ToolBudget`` caps an analyst's tool rounds and total tool calls; once
+  spent, the analyst is asked for its report without tools.
+- ``ToolCallMemo`` answers a tool call repeated within the same run from
+  the earlier result instead of executing it again.
+"""
+
+import functools
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+# Runs whose memoized results are kept (least recently used are dropped)
+MEMO_MAX_RUNS = 64
+
+
+class ToolBudget:
+    """Per-analyst caps on tool rounds and total tool calls (None = unlimited)."""
+
+    def __init__(self, max_rounds: Optional[int] = None, max_calls: Optional[int] = None):
+        self.max_rounds = max_rounds
+        self.max_calls = max_calls
+
+    def exhausted(self, messages) -> bool:
+        """Whether the analyst's tool calls so far have used up the budget."""
+        rounds = [m for m in messages if isinstance(m, AIMessage) and m.tool_calls]
+        calls = sum(len(m.tool_calls) for m in rounds)
+        if self.max_rounds is not None and len(rounds) >= self.max_rounds:
+            return True
+        return self.max_calls is not None and calls >= self.max_calls
+
+
+class ToolCallMemo:
+    """ToolNode hook serving identical (tool, args) calls of one run from memory.
+
+    Runs are told apart by the ``run_id`` in the graph state.
+    """
+
+    def __init__(self, max_runs: int = MEMO_MAX_RUNS):
+        self.max_runs = max_runs
+        self.hits = 0
+        self._runs: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, request):
+        state = request.state if isinstance(request.state, dict) else {}
+        run_id = state.get("run_id")
+        if not run_id:
+            return None, None
+        call = request.tool_call
+        return run_id, (call["name"], json.dumps(call["args"], sort_keys=True, default=str))
+
+    def _lookup(self, request) -> Optional[ToolMessage]:
+        run_id, key = self._key(request)
+        if run_id is None:
+            return None
+        with self._lock:
+            memo = self._runs.get(run_id)
+            if memo is None or key not in memo:
+                return None
+            self._runs.move_to_end(run_id)
+            self.hits += 1
+            return memo[key].model_copy(update={"tool_call_id": request.tool_call["id"], "id": None})
+
+    def _store(self, request, result) -> None:
+        run_id, key = self._key(request)
+        # Failed calls are retried rather than memoized
+        if run_id is None or not isinstance(result, ToolMessage) or result.status == "error":
+            return
+        with self._lock:
+            self._runs.setdefault(run_id, {})[key] = result
+            self._runs.move_to_end(run_id)
+            while len(self._runs) > self.max_runs:
+                self._runs.popitem(last=False)
+
+    def wrap_tool_call(self, request, execute):
+        """ToolNode ``wrap_tool_call`` hook."""
+        cached = self._lookup(request)
+        if cached is not None:
+            return cached
+        result = execute(request)
+        self._store(request, result)
+        return result
+
+    async def awrap_tool_call(self, request, execute):
+        """ToolNode ``awrap_tool_call`` hook."""
+        cached = self._lookup(request)
+        if cached is not None:
+            return cached
+        result = await execute(request)
+        self._store(request, result)
+        return result
+
+
+def compose_tool_hooks(*hooks) -> dict:
+    """ToolNode kwargs chaining hook objects, the first one outermost."""
+    if not hooks:
+        return {}
+
+    def wrap_tool_call(request, execute):
+        for hook in reversed(hooks):
+            execute = functools.partial(hook.wrap_tool_call, execute=execute)
+        return execute(request)
+
+    async def awrap_tool_call(request, execute):
+        for hook in reversed(hooks):
+            execute = functools.partial(hook.awrap_tool_call, execute=execute)
+        return await execute(request)
+
+    return {"wrap_tool_call": wrap_tool_call, "awrap_tool_call": awrap_tool_call}
@@ -1,6 +1,5 @@
 import os
 import requests
-import pandas as pd
 import json
 from datetime import datetime
 from io import StringIO
@@ -99,6 +98,8 @@ def _filter_csv_by_date_range(csv_data: str, start_date: str, end_date: str) ->
     if not csv_data or csv_data.strip() == "":
         return csv_data
 
+    import pandas as pd
+
     try:
         # Parse CSV data
         df = pd.read_csv(StringIO(csv_data))
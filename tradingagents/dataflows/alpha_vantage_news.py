@@ -1,9 +1,100 @@
+import json
+from datetime import datetime, timedelta
+
 from .alpha_vantage_common import _make_api_request, format_datetime_for_api
 
-def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
+
+def _sentiment_label(score: float) -> str:
+    """Map a sentiment score to Alpha Vantage's published label buckets."""
+    if score <= -0.35:
+        return "Bearish"
+    if score <= -0.15:
+        return "Somewhat-Bearish"
+    if score < 0.15:
+        return "Neutral"
+    if score < 0.35:
+        return "Somewhat-Bullish"
+    return "Bullish"
+
+
+def _parse_feed(response: str) -> list | None:
+    """Return the NEWS_SENTIMENT feed list, or None if the body is not a feed."""
+    try:
+        data = json.loads(response)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not isinstance(data, dict) or "feed" not in data:
+        return None
+    return data["feed"]
+
+
+def _compact_article(article: dict, ticker: str = None) -> dict:
+    """Reduce a feed item to title, source, time and the relevant sentiment.
+
+    With a ticker, sentiment is that ticker's score and relevance from the
+    item's ticker_sentiment list; otherwise the article's overall score.
+    """
+    published = article.get("time_published", "")
+    try:
+        published = datetime.strptime(published, "%Y%m%dT%H%M%S").strftime("%Y-%m-%d %H:%M")
+    except ValueError:
+        pass
+
+    record = {
+        "title": article.get("title", "No title"),
+        "source": article.get("source", "Unknown"),
+        "time": published,
+        "score": float(article.get("overall_sentiment_score", 0.0)),
+        "relevance": 1.0,
+    }
+
+    if ticker:
+        for entry in article.get("ticker_sentiment", []):
+            if entry.get("ticker", "").upper() == ticker.upper():
+                record["score"] = float(entry.get("ticker_sentiment_score", 0.0))
+                record["relevance"] = float(entry.get("relevance_score", 0.0))
+                break
+        else:
+            record["relevance"] = 0.0
+
+    return record
+
+
+def _render_news(header: str, records: list, ticker: str = None) -> str:
+    """Render compact records with a pre-aggregated sentiment summary."""
+    total_relevance = sum(r["relevance"] for r in records)
+    if total_relevance > 0:
+        weighted = sum(r["score"] * r["relevance"] for r in records) / total_relevance
+    else:
+        weighted = 0.0
+
+    counts = {"Bullish": 0, "Neutral": 0, "Bearish": 0}
+    for r in records:
+        label = _sentiment_label(r["score"])
+        counts["Neutral" if label == "Neutral" else label.split("-")[-1]] += 1
+
+    scope = f"{ticker} relevance-weighted" if ticker else "Average overall"
+    news_str = "### Sentiment Summary\n"
+    news_str += f"Articles: {len(records)} | {scope} sentiment: {weighted:+.3f} ({_sentiment_label(weighted)})\n"
+    news_str += f"Bullish: {counts['Bullish']} | Neutral: {counts['Neutral']} | Bearish: {counts['Bearish']}\n\n"
+
+    for r in records:
+        label = _sentiment_label(r["score"])
+        news_str += f"### {r['title']} (source: {r['source']})\n"
+        if ticker:
+            news_str += f"{r['time']} | {ticker} sentiment: {r['score']:+.3f} ({label}), relevance {r['relevance']:.2f}\n\n"
+        else:
+            news_str += f"{r['time']} | sentiment: {r['score']:+.3f} ({label})\n\n"
+
+    return f"{header}\n\n{news_str}"
+
+
+def get_news(ticker, start_date, end_date) -> str:
     """Returns live and historical market news & sentiment data from premier news outlets worldwide.
 
     Covers stocks, cryptocurrencies, forex, and topics like fiscal policy, mergers & acquisitions, IPOs.
+    The raw NEWS_SENTIMENT feed is reduced to one compact record per article
+    (title, source, time, sentiment for the ticker) plus an aggregate summary.
 
     Args:
         ticker: Stock symbol for news articles.
@@ -11,7 +102,8 @@ def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
         end_date: End date for news search.
 
     Returns:
-        Dictionary containing news sentiment data or JSON string.
+        Formatted string in the same layout as get_news_yfinance, or the raw
+        response if it is not a news feed (e.g. an API error message).
     """
 
     params = {
@@ -20,12 +112,23 @@ def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
         "time_to": format_datetime_for_api(end_date),
     }
 
-    return _make_api_request("NEWS_SENTIMENT", params)
+    response = _make_api_request("NEWS_SENTIMENT", params)
+    feed = _parse_feed(response)
+    if feed is None:
+        return response
+    if not feed:
+        return f"No news found for {ticker} between {start_date} and {end_date}"
+
+    records = [_compact_article(article, ticker) for article in feed]
+    records.sort(key=lambda r: r["time"], reverse=True)
+    return _render_news(f"## {ticker} News, from {start_date} to {end_date}:", records, ticker)
+
 
-def get_global_news(curr_date, look_back_days: int = 7, limit: int = 50) -> dict[str, str] | str:
+def get_global_news(curr_date, look_back_days: int = 7, limit: int = 50) -> str:
     """Returns global market news & sentiment data without ticker-specific filtering.
 
     Covers broad market topics like financial markets, economy, and more.
+    Articles are reduced to compact records with their overall sentiment.
 
     Args:
         curr_date: Current date in yyyy-mm-dd format.
@@ -33,10 +136,9 @@ def get_global_news(curr_date, look_back_days: int = 7, limit: int = 50) -> dict
         limit: Maximum number of articles (default 50).
 
     Returns:
-        Dictionary containing global news sentiment data or JSON string.
+        Formatted string in the same layout as get_global_news_yfinance, or
+        the raw response if it is not a news feed.
     """
-    from datetime import datetime, timedelta
-
     # Calculate start date
     curr_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     start_dt = curr_dt - timedelta(days=look_back_days)
@@ -49,7 +151,16 @@ def get_global_news(curr_date, look_back_days: int = 7, limit: int = 50) -> dict
         "limit": str(limit),
     }
 
-    return _make_api_request("NEWS_SENTIMENT", params)
+    response = _make_api_request("NEWS_SENTIMENT", params)
+    feed = _parse_feed(response)
+    if feed is None:
+        return response
+    if not feed:
+        return f"No global news found for {curr_date}"
+
+    records = [_compact_article(article) for article in feed[:limit]]
+    records.sort(key=lambda r: r["time"], reverse=True)
+    return _render_news(f"## Global Market News, from {start_date} to {curr_date}:", records)
 
 
 def get_insider_transactions(symbol: str) -> dict[str, str] | str:
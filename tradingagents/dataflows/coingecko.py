@@ -1,9 +1,17 @@
 """CoinGecko cryptocurrency data."""
 
+import json
+import os
+import threading
+import time
 import requests
-from datetime import datetime
+from collections import deque
+from datetime import date, datetime, timedelta, timezone
 from dateutil.relativedelta import relativedelta
-from typing import Annotated
+from typing import Annotated, Dict, List, Optional, Tuple
+
+from .config import get_config
+from .index_store import DailyIndexStore
 
 
 # Common crypto symbol to CoinGecko ID mapping
@@ -32,6 +40,60 @@ CRYPTO_ID_MAP = {
 
 BASE_URL = "https://api.coingecko.com/api/v3"
 
+FEAR_GREED_URL = "https://api.alternative.me/fng/"
+
+# Free (keyless) tier allows roughly 30 calls per minute
+CALLS_PER_MINUTE = 30
+
+# /coins/markets accepts up to 250 ids per page
+MARKETS_BATCH_SIZE = 250
+
+# How long a /coins/markets snapshot is reused before refetching
+MARKETS_TTL_SECONDS = 300
+
+
+class _RateLimiter:
+    """Sliding-window limiter shared by every CoinGecko request in the process."""
+
+    def __init__(self, max_calls: int, period: float = 60.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call slot is free, then claim it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self.period - (now - self._calls[0])
+            time.sleep(wait)
+
+
+_rate_limiter = _RateLimiter(CALLS_PER_MINUTE)
+
+# coin_id -> (fetched_at, /coins/markets row)
+_markets_cache: Dict[str, Tuple[float, dict]] = {}
+_markets_lock = threading.Lock()
+_history_lock = threading.Lock()
+
+
+def _request(path: str, params: dict = None, max_retries: int = 2) -> requests.Response:
+    """GET a CoinGecko endpoint through the shared rate limiter, backing off on 429."""
+    for attempt in range(max_retries + 1):
+        _rate_limiter.acquire()
+        resp = requests.get(f"{BASE_URL}{path}", params=params, timeout=10)
+        if resp.status_code != 429 or attempt == max_retries:
+            return resp
+        retry_after = resp.headers.get("Retry-After")
+        time.sleep(float(retry_after) if retry_after else 60.0 / CALLS_PER_MINUTE)
+    return resp
+
 
 def _resolve_coin_id(symbol: str) -> str:
     """Resolve a ticker symbol to a CoinGecko coin ID."""
@@ -42,6 +104,107 @@ def _resolve_coin_id(symbol: str) -> str:
     return symbol.lower()
 
 
+def _fetch_markets(coin_ids: List[str]) -> Dict[str, dict]:
+    """
+    Get /coins/markets rows for many coins, batching up to 250 ids per call.
+
+    Rows younger than MARKETS_TTL_SECONDS are served from memory, so a basket
+    prefetch followed by per-coin lookups costs one request per batch.
+    Coins unknown to CoinGecko are simply absent from the result.
+    """
+    now = time.time()
+    with _markets_lock:
+        stale = [
+            cid for cid in dict.fromkeys(coin_ids)
+            if cid not in _markets_cache
+            or now - _markets_cache[cid][0] > MARKETS_TTL_SECONDS
+        ]
+
+    for i in range(0, len(stale), MARKETS_BATCH_SIZE):
+        batch = stale[i:i + MARKETS_BATCH_SIZE]
+        resp = _request(
+            "/coins/markets",
+            {
+                "vs_currency": "usd",
+                "ids": ",".join(batch),
+                "per_page": MARKETS_BATCH_SIZE,
+                "price_change_percentage": "24h,7d,30d",
+            },
+        )
+        resp.raise_for_status()
+        fetched_at = time.time()
+        with _markets_lock:
+            for row in resp.json():
+                _markets_cache[row["id"]] = (fetched_at, row)
+
+    with _markets_lock:
+        return {cid: _markets_cache[cid][1] for cid in coin_ids if cid in _markets_cache}
+
+
+def _history_path(coin_id: str) -> str:
+    cache_dir = os.path.join(get_config()["data_cache_dir"], "coingecko")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, f"{coin_id}-daily.json")
+
+
+def _load_history(coin_id: str) -> dict:
+    path = _history_path(coin_id)
+    if not os.path.exists(path):
+        return {"covered_from": None, "days": {}}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _get_price_history(coin_id: str, start_date: date, end_date: date) -> List[Tuple[str, float, float]]:
+    """
+    Get daily (date, price, volume) rows for a coin, backed by a local store.
+
+    Completed UTC days are persisted under data_cache_dir/coingecko, so only
+    days missing from the store are requested from /market_chart. The current
+    (partial) day is never stored; the markets snapshot covers it.
+    """
+    today = datetime.now(timezone.utc).date()
+    last_complete = min(end_date, today - timedelta(days=1))
+
+    with _history_lock:
+        history = _load_history(coin_id)
+        days = history["days"]
+        covered_from = history["covered_from"]
+
+        if covered_from and date.fromisoformat(covered_from) <= start_date:
+            newest = max(days) if days else covered_from
+            fetch_from = date.fromisoformat(newest) + timedelta(days=1)
+        else:
+            fetch_from = start_date
+
+        if fetch_from <= last_complete:
+            resp = _request(
+                f"/coins/{coin_id}/market_chart",
+                {
+                    "vs_currency": "usd",
+                    "days": str((today - fetch_from).days + 1),
+                    "interval": "daily",
+                },
+            )
+            if resp.status_code == 200:
+                chart = resp.json()
+                volumes = {ts: vol for ts, vol in chart.get("total_volumes", [])}
+                for ts, price in chart.get("prices", []):
+                    day = datetime.fromtimestamp(ts / 1000, tz=timezone.utc).date()
+                    if day < today:
+                        days[day.isoformat()] = [price, volumes.get(ts, 0)]
+                if not covered_from or fetch_from < date.fromisoformat(covered_from):
+                    history["covered_from"] = fetch_from.isoformat()
+                with open(_history_path(coin_id), "w") as f:
+                    json.dump(history, f)
+
+    return [
+        (day, values[0], values[1])
+        for day, values in sorted(days.items())
+        if start_date.isoformat() <= day <= end_date.isoformat()
+    ]
+
+
 def get_crypto_data_coingecko(
     symbol: Annotated[str, "crypto symbol e.g. BTC, ETH, SOL"],
     curr_date: Annotated[str, "current date in yyyy-mm-dd format"],
@@ -50,7 +213,9 @@ def get_crypto_data_coingecko(
     """
     Get cryptocurrency price, volume, and market cap data from CoinGecko.
 
-    No API key needed. Free tier: 30 calls/min.
+    No API key needed. Free tier: 30 calls/min, enforced client-side.
+    Market data comes from the shared /coins/markets snapshot and daily
+    history from the local price store, so repeated calls are mostly free.
 
     Args:
         symbol: Crypto symbol (e.g. "BTC", "ETH")
@@ -63,35 +228,22 @@ def get_crypto_data_coingecko(
     try:
         coin_id = _resolve_coin_id(symbol)
 
-        # Current data
-        current_url = f"{BASE_URL}/coins/{coin_id}"
-        params = {
-            "localization": "false",
-            "tickers": "false",
-            "community_data": "true",
-            "developer_data": "false",
-        }
-        resp = requests.get(current_url, params=params, timeout=10)
-
-        if resp.status_code == 404:
+        coin_data = _fetch_markets([coin_id]).get(coin_id)
+        if coin_data is None:
             return f"Cryptocurrency '{symbol}' not found on CoinGecko. Try using the full name (e.g., 'bitcoin' instead of 'BTC')."
-        resp.raise_for_status()
-        coin_data = resp.json()
-
-        market_data = coin_data.get("market_data", {})
 
         report = f"# {coin_data.get('name', symbol)} ({coin_data.get('symbol', symbol).upper()}) — Crypto Data\n\n"
 
         # Current price and market info
-        price_usd = market_data.get("current_price", {}).get("usd")
-        market_cap = market_data.get("market_cap", {}).get("usd")
-        total_volume = market_data.get("total_volume", {}).get("usd")
-        price_change_24h = market_data.get("price_change_percentage_24h")
-        price_change_7d = market_data.get("price_change_percentage_7d")
-        price_change_30d = market_data.get("price_change_percentage_30d")
-        ath = market_data.get("ath", {}).get("usd")
-        ath_change = market_data.get("ath_change_percentage", {}).get("usd")
-        atl = market_data.get("atl", {}).get("usd")
+        price_usd = coin_data.get("current_price")
+        market_cap = coin_data.get("market_cap")
+        total_volume = coin_data.get("total_volume")
+        price_change_24h = coin_data.get("price_change_percentage_24h_in_currency")
+        price_change_7d = coin_data.get("price_change_percentage_7d_in_currency")
+        price_change_30d = coin_data.get("price_change_percentage_30d_in_currency")
+        ath = coin_data.get("ath")
+        ath_change = coin_data.get("ath_change_percentage")
+        atl = coin_data.get("atl")
 
         report += "## Current Market Data\n"
         if price_usd is not None:
@@ -100,7 +252,7 @@ def get_crypto_data_coingecko(
             report += f"**Market Cap:** ${market_cap:,.0f}\n"
         if total_volume is not None:
             report += f"**24h Volume:** ${total_volume:,.0f}\n"
-        report += f"**Market Cap Rank:** #{coin_data.get('market_cap_rank', 'N/A')}\n\n"
+        report += f"**Market Cap Rank:** #{coin_data.get('market_cap_rank') or 'N/A'}\n\n"
 
         report += "## Price Changes\n"
         if price_change_24h is not None:
@@ -116,9 +268,9 @@ def get_crypto_data_coingecko(
         report += "\n"
 
         # Supply info
-        circulating = market_data.get("circulating_supply")
-        total_supply = market_data.get("total_supply")
-        max_supply = market_data.get("max_supply")
+        circulating = coin_data.get("circulating_supply")
+        total_supply = coin_data.get("total_supply")
+        max_supply = coin_data.get("max_supply")
 
         report += "## Supply\n"
         if circulating:
@@ -130,39 +282,16 @@ def get_crypto_data_coingecko(
         report += "\n"
 
         # Historical price data
-        market_chart_url = f"{BASE_URL}/coins/{coin_id}/market_chart"
-        chart_params = {
-            "vs_currency": "usd",
-            "days": str(look_back_days),
-            "interval": "daily",
-        }
-        chart_resp = requests.get(market_chart_url, params=chart_params, timeout=10)
-
-        if chart_resp.status_code == 200:
-            chart_data = chart_resp.json()
-            prices = chart_data.get("prices", [])
-            volumes = chart_data.get("total_volumes", [])
-
-            if prices:
-                report += f"## Price History (last {look_back_days} days)\n"
-                report += "| Date | Price | Volume |\n"
-                report += "|------|-------|--------|\n"
-                for i, (ts, price) in enumerate(prices):
-                    date_str = datetime.fromtimestamp(ts / 1000).strftime("%Y-%m-%d")
-                    vol = volumes[i][1] if i < len(volumes) else 0
-                    report += f"| {date_str} | ${price:,.2f} | ${vol:,.0f} |\n"
-                report += "\n"
-
-        # Community data
-        community = coin_data.get("community_data", {})
-        if community:
-            report += "## Community Metrics\n"
-            if community.get("twitter_followers"):
-                report += f"**Twitter Followers:** {community['twitter_followers']:,}\n"
-            if community.get("reddit_subscribers"):
-                report += f"**Reddit Subscribers:** {community['reddit_subscribers']:,}\n"
-            if community.get("reddit_average_posts_48h"):
-                report += f"**Reddit Posts (48h avg):** {community['reddit_average_posts_48h']:.1f}\n"
+        end_date = datetime.strptime(curr_date, "%Y-%m-%d").date()
+        start_date = end_date - relativedelta(days=look_back_days)
+        prices = _get_price_history(coin_id, start_date, end_date)
+
+        if prices:
+            report += f"## Price History (last {look_back_days} days)\n"
+            report += "| Date | Price | Volume |\n"
+            report += "|------|-------|--------|\n"
+            for date_str, price, vol in prices:
+                report += f"| {date_str} | ${price:,.2f} | ${vol:,.0f} |\n"
             report += "\n"
 
         return report
@@ -173,37 +302,110 @@ def get_crypto_data_coingecko(
         return f"Error processing CoinGecko data for {symbol}: {str(e)}"
 
 
-def get_crypto_fear_greed_coingecko() -> str:
+def get_crypto_markets_coingecko(
+    symbols: Annotated[str, "comma-separated crypto symbols e.g. BTC,ETH,SOL"],
+) -> str:
     """
-    Get the Crypto Fear & Greed Index from alternative.me.
+    Get a market snapshot for a basket of cryptocurrencies in bulk.
+
+    Uses /coins/markets with up to 250 ids per request, so a 50-coin basket
+    costs a single call. The snapshot also warms the cache used by
+    get_crypto_data_coingecko.
+
+    Args:
+        symbols: Comma-separated crypto symbols (e.g. "BTC,ETH,SOL")
+
+    Returns:
+        Formatted string with one table row per coin
+    """
+    try:
+        requested = [s.strip() for s in symbols.split(",") if s.strip()]
+        coin_ids = [_resolve_coin_id(s) for s in requested]
+        markets = _fetch_markets(coin_ids)
+
+        report = f"# Crypto Market Snapshot ({len(markets)} of {len(requested)} coins)\n\n"
+        report += "| Coin | Rank | Price | Market Cap | 24h Volume | 24h | 7d | 30d |\n"
+        report += "|------|------|-------|------------|------------|-----|----|-----|\n"
+
+        def pct(value):
+            return f"{value:+.2f}%" if value is not None else "N/A"
+
+        missing = []
+        for symbol, coin_id in zip(requested, coin_ids):
+            row = markets.get(coin_id)
+            if row is None:
+                missing.append(symbol)
+                continue
+            report += (
+                f"| {row.get('name', coin_id)} ({row.get('symbol', symbol).upper()}) "
+                f"| #{row.get('market_cap_rank') or 'N/A'} "
+                f"| ${row.get('current_price') or 0:,.2f} "
+                f"| ${row.get('market_cap') or 0:,.0f} "
+                f"| ${row.get('total_volume') or 0:,.0f} "
+                f"| {pct(row.get('price_change_percentage_24h_in_currency'))} "
+                f"| {pct(row.get('price_change_percentage_7d_in_currency'))} "
+                f"| {pct(row.get('price_change_percentage_30d_in_currency'))} |\n"
+            )
+        report += "\n"
+
+        if missing:
+            report += f"**Not found on CoinGecko:** {', '.join(missing)}\n"
+
+        return report
+
+    except requests.exceptions.RequestException as e:
+        return f"Error fetching CoinGecko market data: {str(e)}"
+    except Exception as e:
+        return f"Error processing CoinGecko market data: {str(e)}"
+
+
+def _fetch_crypto_fear_greed_history(since: Optional[str]) -> Dict[str, Tuple[float, str]]:
+    """Fetch daily alternative.me Crypto Fear & Greed values (limit=0 is full history)."""
+    limit = 0
+    if since:
+        since_dt = datetime.strptime(since, "%Y-%m-%d").date()
+        limit = (datetime.now(timezone.utc).date() - since_dt).days + 2
+
+    resp = requests.get(FEAR_GREED_URL, params={"limit": limit}, timeout=10)
+    resp.raise_for_status()
+
+    values = {}
+    for entry in resp.json().get("data", []):
+        day = datetime.fromtimestamp(int(entry["timestamp"]), tz=timezone.utc).strftime("%Y-%m-%d")
+        values[day] = (float(entry["value"]), entry.get("value_classification", "N/A"))
+    return values
+
+
+_crypto_fear_greed_store = DailyIndexStore("crypto_fear_greed", _fetch_crypto_fear_greed_history)
+
+
+def get_crypto_fear_greed_coingecko(
+    curr_date: Annotated[str, "current date in yyyy-mm-dd format"] = None,
+) -> str:
+    """
+    Get the Crypto Fear & Greed Index from alternative.me as of curr_date.
     0 = Extreme Fear, 100 = Extreme Greed.
 
+    The full daily history is stored locally and refreshed at most once a
+    day, so backtests get the value for the trade date rather than today's.
+
+    Args:
+        curr_date: Current date in yyyy-mm-dd format (default today)
+
     Returns:
         Formatted string with crypto fear & greed data
     """
     try:
-        url = "https://api.alternative.me/fng/?limit=10"
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-
-        entries = data.get("data", [])
+        curr_date = curr_date or datetime.now().strftime("%Y-%m-%d")
+        entries = _crypto_fear_greed_store.series(curr_date)[-10:]
         if not entries:
-            return "No Crypto Fear & Greed data available"
+            return f"No Crypto Fear & Greed data available as of {curr_date}"
 
         report = "# Crypto Fear & Greed Index\n\n"
 
-        latest = entries[0]
-        score = int(latest.get("value", 0))
-        classification = latest.get("value_classification", "N/A")
-        timestamp = latest.get("timestamp", "")
-
-        if timestamp:
-            date_str = datetime.fromtimestamp(int(timestamp)).strftime("%Y-%m-%d")
-        else:
-            date_str = "N/A"
+        date_str, score, classification = entries[-1]
 
-        report += f"**Current Score:** {score} / 100\n"
+        report += f"**Current Score:** {score:.0f} / 100\n"
         report += f"**Classification:** {classification}\n"
         report += f"**Date:** {date_str}\n\n"
 
@@ -211,12 +413,8 @@ def get_crypto_fear_greed_coingecko() -> str:
         report += "## Recent Trend\n"
         report += "| Date | Score | Classification |\n"
         report += "|------|-------|----------------|\n"
-        for entry in entries:
-            e_score = entry.get("value", "N/A")
-            e_class = entry.get("value_classification", "N/A")
-            e_ts = entry.get("timestamp", "")
-            e_date = datetime.fromtimestamp(int(e_ts)).strftime("%Y-%m-%d") if e_ts else "N/A"
-            report += f"| {e_date} | {e_score} | {e_class} |\n"
+        for e_date, e_score, e_class in reversed(entries):
+            report += f"| {e_date} | {e_score:.0f} | {e_class} |\n"
         report += "\n"
 
         return report
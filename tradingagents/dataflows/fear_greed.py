@@ -1,17 +1,58 @@
 """CNN Fear & Greed Index data."""
 
 import requests
-from typing import Annotated
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Dict, Optional, Tuple
+
+from .index_store import DailyIndexStore, value_as_of
+
+CNN_GRAPHDATA_URL = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
+
+# Earliest date requested when backfilling the full history
+CNN_HISTORY_START = "2020-01-01"
+
+
+def _fetch_cnn_history(since: Optional[str]) -> Dict[str, Tuple[float, str]]:
+    """Fetch daily CNN Fear & Greed scores from `since` (or the full history)."""
+    start = CNN_HISTORY_START
+    if since:
+        # Overlap a few days so the previously stored intraday value is finalized
+        start = (datetime.strptime(since, "%Y-%m-%d") - timedelta(days=7)).strftime("%Y-%m-%d")
+
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "application/json",
+    }
+    response = requests.get(f"{CNN_GRAPHDATA_URL}/{start}", headers=headers, timeout=10)
+    response.raise_for_status()
+    data = response.json()
+
+    values = {}
+    for point in data.get("fear_and_greed_historical", {}).get("data", []):
+        day = datetime.fromtimestamp(point["x"] / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+        values[day] = (float(point["y"]), point.get("rating", "N/A"))
+
+    latest = data.get("fear_and_greed", {})
+    if latest.get("score") is not None and latest.get("timestamp"):
+        day = datetime.fromisoformat(latest["timestamp"]).strftime("%Y-%m-%d")
+        values[day] = (float(latest["score"]), latest.get("rating", "N/A"))
+
+    return values
+
+
+_cnn_store = DailyIndexStore("cnn_fear_greed", _fetch_cnn_history)
 
 
 def get_fear_greed_index_cnn(
     curr_date: Annotated[str, "current date in yyyy-mm-dd format"],
 ) -> str:
     """
-    Get the CNN Fear & Greed Index score (0-100) and components.
+    Get the CNN Fear & Greed Index score (0-100) as of curr_date.
     0 = Extreme Fear, 100 = Extreme Greed.
 
-    No API key needed. Uses unofficial CNN endpoint.
+    No API key needed. Uses unofficial CNN endpoint. The daily history is
+    kept in a local store, so backtests read the value for the trade date
+    and only the first call of the day can touch the network.
 
     Args:
         curr_date: Current date in yyyy-mm-dd format
@@ -20,54 +61,43 @@ def get_fear_greed_index_cnn(
         Formatted string with Fear & Greed data
     """
     try:
-        url = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "application/json",
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        series = _cnn_store.series(curr_date)
+        if not series:
+            return f"No CNN Fear & Greed data available as of {curr_date}"
 
         report = f"# CNN Fear & Greed Index (as of {curr_date})\n\n"
 
-        # Current score
-        fear_greed = data.get("fear_and_greed", {})
-        score = fear_greed.get("score")
-        rating = fear_greed.get("rating")
-        timestamp = fear_greed.get("timestamp", "")
-
-        if score is not None:
-            report += f"**Current Score:** {score:.1f} / 100\n"
-            report += f"**Rating:** {rating}\n"
-            report += f"**Updated:** {timestamp}\n\n"
-
-            # Interpret the score
-            if score <= 25:
-                interpretation = "EXTREME FEAR - Markets are very fearful. Historically, this can be a buying opportunity (contrarian signal)."
-            elif score <= 45:
-                interpretation = "FEAR - Markets are nervous. Caution is warranted but opportunities may exist."
-            elif score <= 55:
-                interpretation = "NEUTRAL - Markets are balanced between fear and greed."
-            elif score <= 75:
-                interpretation = "GREED - Markets are getting greedy. Consider taking some profits or being cautious with new positions."
-            else:
-                interpretation = "EXTREME GREED - Markets are extremely greedy. High risk of correction. Strong contrarian sell signal."
-
-            report += f"**Interpretation:** {interpretation}\n\n"
+        updated, score, rating = series[-1]
+        report += f"**Current Score:** {score:.1f} / 100\n"
+        report += f"**Rating:** {rating}\n"
+        report += f"**Updated:** {updated}\n\n"
+
+        # Interpret the score
+        if score <= 25:
+            interpretation = "EXTREME FEAR - Markets are very fearful. Historically, this can be a buying opportunity (contrarian signal)."
+        elif score <= 45:
+            interpretation = "FEAR - Markets are nervous. Caution is warranted but opportunities may exist."
+        elif score <= 55:
+            interpretation = "NEUTRAL - Markets are balanced between fear and greed."
+        elif score <= 75:
+            interpretation = "GREED - Markets are getting greedy. Consider taking some profits or being cautious with new positions."
+        else:
+            interpretation = "EXTREME GREED - Markets are extremely greedy. High risk of correction. Strong contrarian sell signal."
+
+        report += f"**Interpretation:** {interpretation}\n\n"
 
         # Historical comparison
-        fear_greed_hist = data.get("fear_and_greed_historical", {})
-        if fear_greed_hist:
+        updated_dt = datetime.strptime(updated, "%Y-%m-%d")
+        comparisons = [("Previous Close", series[-2] if len(series) > 1 else None)]
+        for label, days in [("1 Week Ago", 7), ("1 Month Ago", 30), ("1 Year Ago", 365)]:
+            as_of = (updated_dt - timedelta(days=days)).strftime("%Y-%m-%d")
+            comparisons.append((label, value_as_of(series, as_of)))
+
+        if any(point for _, point in comparisons):
             report += "## Historical Comparison\n"
-            for period_key in ["previousClose", "oneWeekAgo", "oneMonthAgo", "oneYearAgo"]:
-                period_data = fear_greed_hist.get(period_key, {})
-                if period_data:
-                    p_score = period_data.get("score")
-                    p_rating = period_data.get("rating")
-                    if p_score is not None:
-                        label = period_key.replace("previousClose", "Previous Close").replace("oneWeekAgo", "1 Week Ago").replace("oneMonthAgo", "1 Month Ago").replace("oneYearAgo", "1 Year Ago")
-                        report += f"  **{label}:** {p_score:.1f} ({p_rating})\n"
+            for label, point in comparisons:
+                if point:
+                    report += f"  **{label}:** {point[1]:.1f} ({point[2]})\n"
             report += "\n"
 
         return report
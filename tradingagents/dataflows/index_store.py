@@ -0,0 +1,95 @@
+"""Local time-series store for global daily indices (e.g. Fear & Greed).
+
+These indices are identical for every ticker, so they are fetched at most
+once per day per process-wide store and answered as-of the trade date from
+disk afterwards. The first fill uses the vendor's full-history endpoint.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# (date, score, rating)
+IndexPoint = Tuple[str, float, str]
+
+# fetch_history(since) -> {yyyy-mm-dd: (score, rating)}; since=None means full history
+FetchHistory = Callable[[Optional[str]], Dict[str, Tuple[float, str]]]
+
+
+class DailyIndexStore:
+    """Daily-refreshed, disk-backed store for a single global index."""
+
+    def __init__(self, name: str, fetch_history: FetchHistory):
+        self.name = name
+        self.fetch_history = fetch_history
+        self._values: Optional[Dict[str, Tuple[float, str]]] = None
+        self._fetched_on: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _path(self) -> str:
+        cache_dir = os.path.join(get_config()["data_cache_dir"], "indices")
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, f"{self.name}.json")
+
+    def _load(self):
+        path = self._path()
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            self._values = {d: tuple(v) for d, v in data["values"].items()}
+            self._fetched_on = data.get("fetched_on")
+        else:
+            self._values = {}
+            self._fetched_on = None
+
+    def _save(self):
+        with open(self._path(), "w") as f:
+            json.dump({"fetched_on": self._fetched_on, "values": self._values}, f)
+
+    def _refresh(self):
+        newest = max(self._values) if self._values else None
+        try:
+            fresh = self.fetch_history(newest)
+        except requests.exceptions.RequestException as e:
+            if not self._values:
+                raise
+            logger.warning(f"Refreshing index '{self.name}' failed: {e}. Serving stored values.")
+            return
+        self._values.update(fresh)
+        self._fetched_on = date.today().isoformat()
+        self._save()
+
+    def series(self, curr_date: str) -> List[IndexPoint]:
+        """Return all stored points up to and including curr_date, oldest first.
+
+        Goes to the network only when curr_date is newer than the stored
+        history and the store has not been refreshed today.
+        """
+        with self._lock:
+            if self._values is None:
+                self._load()
+            newest = max(self._values) if self._values else None
+            if (newest is None or curr_date > newest) and self._fetched_on != date.today().isoformat():
+                self._refresh()
+            return [
+                (d, score, rating)
+                for d, (score, rating) in sorted(self._values.items())
+                if d <= curr_date
+            ]
+
+
+def value_as_of(series: List[IndexPoint], as_of: str) -> Optional[IndexPoint]:
+    """Return the latest point on or before as_of from an oldest-first series."""
+    for point in reversed(series):
+        if point[0] <= as_of:
+            return point
+    return None
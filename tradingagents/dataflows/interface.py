@@ -1,44 +1,10 @@
-from typing import Annotated
+import importlib
+from functools import lru_cache
+from typing import Annotated, Callable
 import requests
 
-# Import from vendor-specific modules
-from .y_finance import (
-    get_YFin_data_online,
-    get_stock_stats_indicators_window,
-    get_fundamentals as get_yfinance_fundamentals,
-    get_balance_sheet as get_yfinance_balance_sheet,
-    get_cashflow as get_yfinance_cashflow,
-    get_income_statement as get_yfinance_income_statement,
-    get_insider_transactions as get_yfinance_insider_transactions,
-)
-from .yfinance_news import get_news_yfinance, get_global_news_yfinance
-from .alpha_vantage import (
-    get_stock as get_alpha_vantage_stock,
-    get_indicator as get_alpha_vantage_indicator,
-    get_fundamentals as get_alpha_vantage_fundamentals,
-    get_balance_sheet as get_alpha_vantage_balance_sheet,
-    get_cashflow as get_alpha_vantage_cashflow,
-    get_income_statement as get_alpha_vantage_income_statement,
-    get_insider_transactions as get_alpha_vantage_insider_transactions,
-    get_news as get_alpha_vantage_news,
-    get_global_news as get_alpha_vantage_global_news,
-)
 from .alpha_vantage_common import AlphaVantageRateLimitError
 
-# Phase 1: Options, FRED, Google Trends
-from .yfinance_options import get_options_chain_yfinance
-from .fred_macro import get_macro_indicators_fred
-from .google_trends import get_search_trends_google
-
-# Phase 2: Reddit, Stocktwits, Fear & Greed
-from .reddit_social import get_reddit_sentiment_praw
-from .stocktwits_social import get_stocktwits_sentiment_api
-from .fear_greed import get_fear_greed_index_cnn
-
-# Phase 3: SEC EDGAR, CoinGecko
-from .sec_edgar import get_sec_filings_edgar
-from .coingecko import get_crypto_data_coingecko, get_crypto_fear_greed_coingecko
-
 # Configuration and routing logic
 from .config import get_config
 
@@ -102,13 +68,15 @@ TOOLS_CATEGORIES = {
     "sec_filings": {
         "description": "SEC EDGAR filings",
         "tools": [
-            "get_sec_filings"
+            "get_sec_filings",
+            "get_sec_filing_section",
         ]
     },
     "crypto_data": {
         "description": "Cryptocurrency data from CoinGecko",
         "tools": [
             "get_crypto_data",
+            "get_crypto_markets",
             "get_crypto_fear_greed",
         ]
     },
@@ -126,83 +94,98 @@ VENDOR_LIST = [
     "coingecko",
 ]
 
-# Mapping of methods to their vendor-specific implementations
+# Mapping of methods to their vendor-specific implementations, as
+# "module:function" in this package. Modules are imported on first use so
+# that importing the tools does not pull in yfinance, pandas and every SDK.
 VENDOR_METHODS = {
     # core_stock_apis
     "get_stock_data": {
-        "alpha_vantage": get_alpha_vantage_stock,
-        "yfinance": get_YFin_data_online,
+        "alpha_vantage": "alpha_vantage:get_stock",
+        "yfinance": "y_finance:get_YFin_data_online",
     },
     # technical_indicators
     "get_indicators": {
-        "alpha_vantage": get_alpha_vantage_indicator,
-        "yfinance": get_stock_stats_indicators_window,
+        "alpha_vantage": "alpha_vantage:get_indicator",
+        "yfinance": "y_finance:get_stock_stats_indicators_window",
     },
     # fundamental_data
     "get_fundamentals": {
-        "alpha_vantage": get_alpha_vantage_fundamentals,
-        "yfinance": get_yfinance_fundamentals,
+        "alpha_vantage": "alpha_vantage:get_fundamentals",
+        "yfinance": "y_finance:get_fundamentals",
     },
     "get_balance_sheet": {
-        "alpha_vantage": get_alpha_vantage_balance_sheet,
-        "yfinance": get_yfinance_balance_sheet,
+        "alpha_vantage": "alpha_vantage:get_balance_sheet",
+        "yfinance": "y_finance:get_balance_sheet",
     },
     "get_cashflow": {
-        "alpha_vantage": get_alpha_vantage_cashflow,
-        "yfinance": get_yfinance_cashflow,
+        "alpha_vantage": "alpha_vantage:get_cashflow",
+        "yfinance": "y_finance:get_cashflow",
     },
     "get_income_statement": {
-        "alpha_vantage": get_alpha_vantage_income_statement,
-        "yfinance": get_yfinance_income_statement,
+        "alpha_vantage": "alpha_vantage:get_income_statement",
+        "yfinance": "y_finance:get_income_statement",
     },
     # news_data
     "get_news": {
-        "alpha_vantage": get_alpha_vantage_news,
-        "yfinance": get_news_yfinance,
+        "alpha_vantage": "alpha_vantage:get_news",
+        "yfinance": "yfinance_news:get_news_yfinance",
     },
     "get_global_news": {
-        "yfinance": get_global_news_yfinance,
-        "alpha_vantage": get_alpha_vantage_global_news,
+        "yfinance": "yfinance_news:get_global_news_yfinance",
+        "alpha_vantage": "alpha_vantage:get_global_news",
     },
     "get_insider_transactions": {
-        "alpha_vantage": get_alpha_vantage_insider_transactions,
-        "yfinance": get_yfinance_insider_transactions,
+        "alpha_vantage": "alpha_vantage:get_insider_transactions",
+        "yfinance": "y_finance:get_insider_transactions",
     },
     # options_data (Phase 1)
     "get_options_chain": {
-        "yfinance": get_options_chain_yfinance,
+        "yfinance": "yfinance_options:get_options_chain_yfinance",
     },
     # macro_data (Phase 1)
     "get_macro_indicators": {
-        "fred": get_macro_indicators_fred,
+        "fred": "fred_macro:get_macro_indicators_fred",
     },
     # search_trends (Phase 1)
     "get_search_trends": {
-        "google_trends": get_search_trends_google,
+        "google_trends": "google_trends:get_search_trends_google",
     },
     # social_sentiment (Phase 2)
     "get_reddit_sentiment": {
-        "reddit": get_reddit_sentiment_praw,
+        "reddit": "reddit_social:get_reddit_sentiment_praw",
     },
     "get_stocktwits_sentiment": {
-        "stocktwits": get_stocktwits_sentiment_api,
+        "stocktwits": "stocktwits_social:get_stocktwits_sentiment_api",
     },
     "get_fear_greed_index": {
-        "cnn": get_fear_greed_index_cnn,
+        "cnn": "fear_greed:get_fear_greed_index_cnn",
     },
     # sec_filings (Phase 3)
     "get_sec_filings": {
-        "sec_edgar": get_sec_filings_edgar,
+        "sec_edgar": "sec_edgar:get_sec_filings_edgar",
+    },
+    "get_sec_filing_section": {
+        "sec_edgar": "sec_edgar:get_sec_filing_section_edgar",
     },
     # crypto_data (Phase 3)
     "get_crypto_data": {
-        "coingecko": get_crypto_data_coingecko,
+        "coingecko": "coingecko:get_crypto_data_coingecko",
+    },
+    "get_crypto_markets": {
+        "coingecko": "coingecko:get_crypto_markets_coingecko",
     },
     "get_crypto_fear_greed": {
-        "coingecko": get_crypto_fear_greed_coingecko,
+        "coingecko": "coingecko:get_crypto_fear_greed_coingecko",
     },
 }
 
+@lru_cache(maxsize=None)
+def _load_vendor_impl(spec: str) -> Callable:
+    """Import and return the implementation named by a "module:function" spec."""
+    module_name, func_name = spec.split(":")
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, func_name)
+
 def get_category_for_method(method: str) -> str:
     """Get the category that contains the specified method."""
     for category, info in TOOLS_CATEGORIES.items():
@@ -246,7 +229,8 @@ def route_to_vendor(method: str, *args, **kwargs):
             continue
 
         vendor_impl = VENDOR_METHODS[method][vendor]
-        impl_func = vendor_impl[0] if isinstance(vendor_impl, list) else vendor_impl
+        impl_spec = vendor_impl[0] if isinstance(vendor_impl, list) else vendor_impl
+        impl_func = _load_vendor_impl(impl_spec)
 
         try:
             return impl_func(*args, **kwargs)
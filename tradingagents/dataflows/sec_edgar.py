@@ -1,7 +1,357 @@
 """SEC EDGAR filings data."""
 
+import json
+import os
+import re
+import threading
+import time
 import requests
-from typing import Annotated
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Annotated, Dict, List, Optional, Tuple
+from rank_bm25 import BM25Okapi
+
+from .config import get_config
+
+EDGAR_HEADERS = {
+    "User-Agent": "TradingAgents Research Bot research@tradingagents.dev",
+    "Accept": "application/json",
+}
+
+# Characters of plain text kept per filing excerpt
+EXCERPT_CHARS = 2000
+
+# Streaming chunk size when reading filing documents
+CHUNK_SIZE = 64 * 1024
+
+# Sections indexed in the local filing store (10-K item numbering)
+INDEXED_SECTIONS = {
+    "1": "Business",
+    "1A": "Risk Factors",
+    "7": "Management's Discussion and Analysis",
+    "7A": "Quantitative and Qualitative Disclosures About Market Risk",
+}
+
+# Any "Item N." heading ends the previous section
+_ITEM_HEADING = re.compile(r"^item\s*(\d{1,2}[a-c]?)\s*[.:\-\u2013\u2014]?(\s|$)", re.IGNORECASE)
+
+# Cap on section text returned to the LLM when no query is given
+MAX_SECTION_CHARS = 15000
+
+# How long a company's submissions list is reused before it is re-fetched
+FILINGS_TTL_SECONDS = 6 * 60 * 60
+
+# cik -> (fetched_at, 'recent' filings block)
+_filings_cache: Dict[str, Tuple[float, dict]] = {}
+_filings_lock = threading.Lock()
+
+
+class _TextExtractor(HTMLParser):
+    """Incremental HTML-to-text converter that tracks how much text it has seen."""
+
+    # Content inside these tags is never shown to readers
+    SKIP_TAGS = {"script", "style", "head", "ix:header"}
+
+    # Tags that start or end a paragraph
+    BLOCK_TAGS = {
+        "p", "div", "br", "tr", "li", "table", "section",
+        "h1", "h2", "h3", "h4", "h5", "h6",
+    }
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.paragraphs = []
+        self.length = 0
+        self._current = []
+        self._skip_depth = 0
+
+    def _end_paragraph(self):
+        if self._current:
+            self.paragraphs.append(" ".join(self._current))
+            self._current = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self._end_paragraph()
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in self.BLOCK_TAGS:
+            self._end_paragraph()
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        text = " ".join(data.split())
+        if text:
+            self._current.append(text)
+            self.length += len(text) + 1
+
+    def close(self):
+        super().close()
+        self._end_paragraph()
+
+    def text(self) -> str:
+        return " ".join(self.paragraphs + self._current)
+
+
+def _excerpt_cache_path(accession: str) -> str:
+    cache_dir = os.path.join(get_config()["data_cache_dir"], "sec_edgar", "excerpts")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, f"{accession}.txt")
+
+
+def _fetch_excerpt(url: str, max_chars: int = EXCERPT_CHARS) -> Optional[str]:
+    """
+    Stream a filing document and return its first max_chars of text.
+
+    Tags are stripped incrementally as chunks arrive and the download stops
+    as soon as enough text has been collected, so multi-megabyte 10-K HTML
+    is never read in full. Returns None if the document is unavailable.
+    """
+    with requests.get(url, headers=EDGAR_HEADERS, timeout=10, stream=True) as resp:
+        if resp.status_code != 200:
+            return None
+        if resp.encoding is None:
+            resp.encoding = "utf-8"
+
+        parser = _TextExtractor()
+        for chunk in resp.iter_content(chunk_size=CHUNK_SIZE, decode_unicode=True):
+            parser.feed(chunk)
+            if parser.length > max_chars:
+                break
+
+    text = parser.text()
+    if len(text) > max_chars:
+        text = text[:max_chars] + "..."
+    return text
+
+
+def _get_filing_excerpt(accession: str, url: str) -> Optional[str]:
+    """Get a filing excerpt, cached permanently since accession numbers are immutable."""
+    path = _excerpt_cache_path(accession)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    excerpt = _fetch_excerpt(url)
+    if excerpt is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(excerpt)
+    return excerpt
+
+
+@lru_cache(maxsize=256)
+def _lookup_company(ticker: str) -> Tuple[Optional[str], Optional[str]]:
+    """Resolve a ticker to its zero-padded CIK and company name."""
+    tickers_url = "https://www.sec.gov/files/company_tickers.json"
+    resp = requests.get(tickers_url, headers=EDGAR_HEADERS, timeout=10)
+    resp.raise_for_status()
+
+    ticker_upper = ticker.upper()
+    for entry in resp.json().values():
+        if entry.get("ticker", "").upper() == ticker_upper:
+            return str(entry["cik_str"]).zfill(10), entry.get("title", ticker_upper)
+    return None, None
+
+
+def _get_recent_filings(cik: str) -> dict:
+    """Get the 'recent' filings block (parallel lists) for a CIK.
+
+    Blocks younger than FILINGS_TTL_SECONDS are served from memory, so
+    long-lived workers still pick up new filings.
+    """
+    with _filings_lock:
+        cached = _filings_cache.get(cik)
+    if cached is not None and time.time() - cached[0] <= FILINGS_TTL_SECONDS:
+        return cached[1]
+
+    filings_url = f"https://data.sec.gov/submissions/CIK{cik}.json"
+    resp = requests.get(filings_url, headers=EDGAR_HEADERS, timeout=10)
+    resp.raise_for_status()
+    recent = resp.json().get("filings", {}).get("recent", {})
+    with _filings_lock:
+        _filings_cache[cik] = (time.time(), recent)
+    return recent
+
+
+def _filing_url(cik: str, accession: str, doc: str) -> str:
+    return f"https://www.sec.gov/Archives/edgar/data/{cik.lstrip('0')}/{accession.replace('-', '')}/{doc}"
+
+
+def _filing_store_paths(accession: str) -> Tuple[str, str]:
+    store_dir = os.path.join(get_config()["data_cache_dir"], "sec_edgar", "filings")
+    os.makedirs(store_dir, exist_ok=True)
+    return (
+        os.path.join(store_dir, f"{accession}.txt"),
+        os.path.join(store_dir, f"{accession}.index.json"),
+    )
+
+
+def _build_section_index(paragraphs: List[str]) -> Dict[str, List[int]]:
+    """
+    Map indexed item numbers to [start_byte, end_byte] in the stored text.
+
+    Item headings appear in the table of contents as well as the body, so
+    for each item the occurrence followed by the most text wins.
+    """
+    offsets = []
+    headings = []
+    position = 0
+    for i, paragraph in enumerate(paragraphs):
+        offsets.append(position)
+        position += len(paragraph.encode("utf-8")) + 1
+        match = _ITEM_HEADING.match(paragraph) if len(paragraph) < 300 else None
+        if match:
+            headings.append((i, match.group(1).upper()))
+    offsets.append(position)
+
+    index = {}
+    for n, (para_idx, item) in enumerate(headings):
+        if item not in INDEXED_SECTIONS:
+            continue
+        end_idx = next(
+            (j for j, other in headings[n + 1:] if other != item),
+            len(paragraphs),
+        )
+        start, end = offsets[para_idx], offsets[end_idx]
+        if item not in index or end - start > index[item][1] - index[item][0]:
+            index[item] = [start, end]
+    return index
+
+
+def _load_filing(accession: str, url: str) -> dict:
+    """
+    Get the section index for a filing, downloading and parsing it only once.
+
+    The full plain text is stored one paragraph per line next to a JSON
+    index of byte offsets, so later section reads are a seek and a read.
+    """
+    text_path, index_path = _filing_store_paths(accession)
+    if os.path.exists(index_path):
+        with open(index_path, "r") as f:
+            return json.load(f)
+
+    with requests.get(url, headers=EDGAR_HEADERS, timeout=30, stream=True) as resp:
+        resp.raise_for_status()
+        if resp.encoding is None:
+            resp.encoding = "utf-8"
+        parser = _TextExtractor()
+        for chunk in resp.iter_content(chunk_size=CHUNK_SIZE, decode_unicode=True):
+            parser.feed(chunk)
+        parser.close()
+
+    with open(text_path, "w", encoding="utf-8", newline="\n") as f:
+        for paragraph in parser.paragraphs:
+            f.write(paragraph + "\n")
+
+    index = {"url": url, "sections": _build_section_index(parser.paragraphs)}
+    with open(index_path, "w") as f:
+        json.dump(index, f)
+    return index
+
+
+def _read_section(accession: str, span: List[int]) -> List[str]:
+    text_path, _ = _filing_store_paths(accession)
+    with open(text_path, "rb") as f:
+        f.seek(span[0])
+        data = f.read(span[1] - span[0])
+    return data.decode("utf-8").splitlines()
+
+
+def _tokenize(text: str) -> List[str]:
+    return re.findall(r"\b\w+\b", text.lower())
+
+
+def get_sec_filing_section_edgar(
+    ticker: Annotated[str, "ticker symbol"],
+    section: Annotated[str, "10-K item: 1 (Business), 1A (Risk Factors), 7 (MD&A), 7A (Market Risk)"],
+    query: Annotated[str, "optional keywords to rank paragraphs by"] = "",
+    curr_date: Annotated[Optional[str], "current trading date, yyyy-mm-dd"] = None,
+    filing_type: Annotated[str, "filing type e.g. 10-K"] = "10-K",
+    top_k: Annotated[int, "number of paragraphs to return when a query is given"] = 8,
+) -> str:
+    """
+    Return one section of the latest filing from the local section-indexed store.
+
+    With curr_date, the latest filing filed on or before that date is used,
+    so backtests never read filings from their future.
+
+    The filing is downloaded and indexed on first use; afterwards sections
+    are read by byte offset with no network access. With a query, only the
+    top_k BM25-scoring paragraphs of the section are returned.
+
+    Args:
+        ticker: Ticker symbol (e.g. "AAPL")
+        section: Item number: "1", "1A", "7" or "7A"
+        query: Optional keywords; when set, return the best-matching paragraphs
+        curr_date: Trading date (yyyy-mm-dd); newer filings are ignored
+        filing_type: Filing type (default "10-K")
+        top_k: Paragraphs to return for a query (default 8)
+
+    Returns:
+        Formatted string with the section text or top paragraphs
+    """
+    section = section.upper().replace("ITEM", "").strip()
+    if section not in INDEXED_SECTIONS:
+        return f"Unsupported section '{section}'. Choose from: {', '.join(INDEXED_SECTIONS)}"
+
+    try:
+        cik, company_name = _lookup_company(ticker)
+        if not cik:
+            return f"Ticker {ticker} not found in SEC EDGAR database"
+
+        recent = _get_recent_filings(cik)
+        forms = recent.get("form", [])
+        dates = recent.get("filingDate", [])
+        # Filings are listed newest first; ISO dates compare as strings
+        idx = next(
+            (
+                i for i, form in enumerate(forms)
+                if form.upper() == filing_type.upper() and (not curr_date or dates[i] <= curr_date)
+            ),
+            None,
+        )
+        if idx is None:
+            if curr_date:
+                return f"No {filing_type} filings found for {ticker.upper()} filed on or before {curr_date}"
+            return f"No {filing_type} filings found for {ticker.upper()}"
+
+        accession = recent["accessionNumber"][idx]
+        filing_date = dates[idx]
+        index = _load_filing(accession, _filing_url(cik, accession, recent["primaryDocument"][idx]))
+
+        span = index["sections"].get(section)
+        if not span:
+            return f"Item {section} ({INDEXED_SECTIONS[section]}) not found in {filing_type} {accession}"
+
+        paragraphs = _read_section(accession, span)
+
+        report = f"# {company_name} ({ticker.upper()}) {filing_type} Filed {filing_date}\n"
+        report += f"## Item {section}. {INDEXED_SECTIONS[section]}\n"
+        report += f"**Accession:** {accession}\n\n"
+
+        if query.strip():
+            bm25 = BM25Okapi([_tokenize(p) for p in paragraphs])
+            scores = bm25.get_scores(_tokenize(query))
+            top = sorted(range(len(paragraphs)), key=lambda i: scores[i], reverse=True)[:top_k]
+            report += f"Top {len(top)} paragraphs for query: {query}\n\n"
+            for i in sorted(top):
+                report += f"{paragraphs[i]}\n\n"
+            return report
+
+        text = "\n\n".join(paragraphs)
+        if len(text) > MAX_SECTION_CHARS:
+            text = text[:MAX_SECTION_CHARS] + "\n\n... (section truncated; pass a query to get the most relevant paragraphs)"
+        return report + text + "\n"
+
+    except requests.exceptions.RequestException as e:
+        return f"Error fetching SEC EDGAR data for {ticker}: {str(e)}"
+    except Exception as e:
+        return f"Error processing SEC data for {ticker}: {str(e)}"
 
 
 def get_sec_filings_edgar(
@@ -22,37 +372,16 @@ def get_sec_filings_edgar(
     Returns:
         Formatted string with filing summaries
     """
-    headers = {
-        "User-Agent": "TradingAgents Research Bot research@tradingagents.dev",
-        "Accept": "application/json",
-    }
-
     try:
         # Step 1: Get CIK from ticker
-        tickers_url = "https://www.sec.gov/files/company_tickers.json"
-        resp = requests.get(tickers_url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        tickers_data = resp.json()
-
-        cik = None
-        company_name = None
+        cik, company_name = _lookup_company(ticker)
         ticker_upper = ticker.upper()
-        for entry in tickers_data.values():
-            if entry.get("ticker", "").upper() == ticker_upper:
-                cik = str(entry["cik_str"]).zfill(10)
-                company_name = entry.get("title", ticker_upper)
-                break
 
         if not cik:
             return f"Ticker {ticker} not found in SEC EDGAR database"
 
         # Step 2: Get filings
-        filings_url = f"https://data.sec.gov/submissions/CIK{cik}.json"
-        resp = requests.get(filings_url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        filings_data = resp.json()
-
-        recent = filings_data.get("filings", {}).get("recent", {})
+        recent = _get_recent_filings(cik)
         forms = recent.get("form", [])
         dates = recent.get("filingDate", [])
         accessions = recent.get("accessionNumber", [])
@@ -82,8 +411,7 @@ def get_sec_filings_edgar(
             desc = descriptions[idx] if idx < len(descriptions) else "N/A"
             doc = docs[idx] if idx < len(docs) else ""
 
-            accession_clean = accession.replace("-", "")
-            filing_url = f"https://www.sec.gov/Archives/edgar/data/{cik.lstrip('0')}/{accession_clean}/{doc}"
+            filing_url = _filing_url(cik, accession, doc)
 
             report += f"## {form} — Filed {date}\n"
             report += f"**Description:** {desc}\n"
@@ -92,16 +420,9 @@ def get_sec_filings_edgar(
 
             # Try to fetch filing summary/header
             try:
-                doc_resp = requests.get(filing_url, headers=headers, timeout=10)
-                if doc_resp.status_code == 200:
-                    text = doc_resp.text
-                    # Extract first ~2000 chars of text content (skip HTML tags)
-                    import re
-                    clean_text = re.sub(r"<[^>]+>", " ", text)
-                    clean_text = re.sub(r"\s+", " ", clean_text).strip()
-                    if len(clean_text) > 2000:
-                        clean_text = clean_text[:2000] + "..."
-                    report += f"\n**Filing Excerpt:**\n{clean_text}\n"
+                excerpt = _get_filing_excerpt(accession, filing_url)
+                if excerpt is not None:
+                    report += f"\n**Filing Excerpt:**\n{excerpt}\n"
             except Exception:
                 report += "\n(Could not fetch filing content)\n"
 
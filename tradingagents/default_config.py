@@ -19,13 +19,81 @@ DEFAULT_CONFIG = {
     "quick_think_llm": "gpt-5-mini",
     "quick_think_backend_url": None,    # e.g. "https://api.deepseek.com"
     "quick_think_api_key": None,        # e.g. os.getenv("DEEPSEEK_API_KEY")
+    # Optional pools of {"base_url", "api_key"} backends per role; calls go to
+    # the least-loaded member and a member answering 429/5xx sits out a cooldown
+    "deep_think_backends": None,        # e.g. [{"api_key": KEY_1}, {"api_key": KEY_2}]
+    "quick_think_backends": None,
+    "llm_backend_cooldown_seconds": 30,
+    # Per-role latency SLO: after this many seconds (or on failure) the call is
+    # also sent to a fallback model and the first completion wins, e.g.
+    # {"deep_think": {"after_seconds": 90, "provider": "openai", "model": "gpt-5.2"}}
+    "llm_hedging": {},
     # Provider-specific thinking configuration
     "google_thinking_level": None,      # "high", "minimal", etc.
     "openai_reasoning_effort": None,    # "medium", "high", "low"
+    # Exact-match LLM response cache (SQLite file path; None disables it)
+    "llm_cache_path": None,             # e.g. "./results/llm_cache.sqlite"
+    # Client-side LLM limits keyed by "provider" or "provider/model", shared by
+    # the deep and quick clients, e.g. {"openrouter": {"rpm": 60, "tpm": 200000,
+    # "max_concurrency": 4}}. Empty disables limiting.
+    "llm_rate_limits": {},
+    # Connections per backend in the process-wide LLM HTTP pool (None = default 20)
+    "llm_http_pool_size": None,
+    # Use HTTP/2 for pooled LLM connections (needs h2 from httpx[http2];
+    # without it the pool warns and uses HTTP/1.1)
+    "llm_http2": True,
+    # Record every LLM response to a JSONL trace (None disables recording);
+    # replay it offline with llm_provider="replay" and replay_trace_path
+    "llm_trace_record_path": None,      # e.g. "./results/traces/nvda.jsonl"
+    "replay_trace_path": None,
+    "replay_latency": None,             # "recorded", "fixed:1.5", "uniform:0.5:2", "lognormal:0:0.5"
+    "replay_latency_seed": None,
+    # Spill tool outputs longer than tool_output_spill_chars to files under
+    # tool_blob_dir, keeping a handle and preview in the graph state; the
+    # LLM sees at most tool_output_caps[tool] (or ["default"]) characters
+    # of each output (None disables spilling; no caps by default)
+    "tool_blob_dir": None,              # e.g. "./results/tool_blobs"
+    "tool_output_spill_chars": 4000,
+    "tool_output_caps": {},             # e.g. {"get_stock_data": 20000, "default": 40000}
+    # Blobs unused for this many days, or least recently used beyond this
+    # total size, are deleted (None = keep); keep blobs at least as long as
+    # checkpoints that may be resumed
+    "tool_blob_max_age_days": 7,
+    "tool_blob_max_mb": 1024,
+    # Bound each analyst's tool loop: after this many tool rounds or tool
+    # calls it must write its report (None = unlimited)
+    "analyst_max_tool_rounds": 8,
+    "analyst_max_tool_calls": 20,
+    # Answer a tool call repeated with identical arguments within one run
+    # from the earlier result instead of fetching again
+    "tool_call_memo": True,
+    # Reuse analyst reports for the same ticker, date and model when the
+    # analysts' tool outputs are unchanged (None disables it)
+    "analyst_report_cache_path": None,  # e.g. "./results/analyst_reports.sqlite"
+    # Checkpoint every completed graph node to this SQLite file so an
+    # interrupted run can continue with propagate(..., resume=True)
+    # (None disables it; needs the checkpoint extra: pip install ".[checkpoint]")
+    "checkpoint_path": None,            # e.g. "./results/checkpoints.sqlite"
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
+    # "sequential" (debators take turns) or "parallel_rounds" (all three
+    # answer the previous round concurrently, ~3x faster per round)
+    "risk_debate_mode": "sequential",
     "max_recur_limit": 100,
+    # End a debate before its round limit once every speaker has stated the
+    # same BUY/HOLD/SELL stance for this many consecutive rounds
+    "debate_stop_on_convergence": False,
+    "debate_convergence_rounds": 1,
+    # Run the selected analysts as concurrent branches that join before the
+    # research debate, instead of one after another (opt-in, like
+    # risk_debate_mode="parallel_rounds")
+    "parallel_analysts": False,
+    # Debate-history compaction: once the history re-sent to the next speaker
+    # exceeds this many tokens, older turns are folded into a rolling summary
+    # and only the last N turns stay verbatim (None disables it)
+    "debate_history_budget_tokens": None,   # e.g. 4000
+    "debate_history_keep_turns": 2,
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
@@ -1,6 +1,6 @@
 # TradingAgents/graph/__init__.py
 
-from .trading_graph import TradingAgentsGraph
+from .trading_graph import PropagateResult, TradingAgentsGraph
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
 from .propagation import Propagator
@@ -9,6 +9,7 @@ from .signal_processing import SignalProcessor
 
 __all__ = [
     "TradingAgentsGraph",
+    "PropagateResult",
     "ConditionalLogic",
     "GraphSetup",
     "Propagator",
@@ -0,0 +1,116 @@
+# TradingAgents/graph/checkpointing.py
+
+"""Durable LangGraph checkpoints so an interrupted propagate can resume.
+
+Every completed node is checkpointed to a local SQLite file under a thread
+keyed by (ticker, trade_date, config hash). If a run dies part-way, e.g. at
+the Risk Judge, ``propagate(..., resume=True)`` continues from the last
+completed node instead of re-paying every earlier LLM call. Requires the
+optional ``langgraph-checkpoint-sqlite`` package, installed with the
+``checkpoint`` extra (``pip install 'tradingagents[checkpoint]'``).
+
+Async runs (``apropagate``) use the same file; the saver's async methods
+run the small SQLite operations on a worker thread.
+
+With a tool blob store (``tool_blob_dir``), checkpointed messages hold
+handles to blob files; keep the blob retention (``tool_blob_max_age_days``)
+at least as long as runs may be resumed.
+
+The database runs in WAL mode with ``synchronous=NORMAL`` and LangGraph
+persists checkpoints in the background while the next node runs, so leaving
+checkpointing on costs a few small local writes per node.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, AsyncIterator, Dict, List
+
+# Config keys that change where things are stored or how they are called,
+# not what the graph decides, so they do not split checkpoint threads
+_UNHASHED_CONFIG_KEYS = (
+    "project_dir",
+    "results_dir",
+    "data_cache_dir",
+    "checkpoint_path",
+    "llm_cache_path",
+    "llm_trace_record_path",
+    "llm_http_pool_size",
+    "llm_http2",
+    "llm_rate_limits",
+    "deep_think_api_key",
+    "quick_think_api_key",
+    "deep_think_backends",
+    "quick_think_backends",
+    "llm_backend_cooldown_seconds",
+    "tool_call_memo",
+    "tool_blob_max_age_days",
+    "tool_blob_max_mb",
+)
+
+
+def _saver_class():
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError as e:
+        raise ImportError(
+            "checkpoint_path requires the optional langgraph-checkpoint-sqlite package "
+            "(pip install 'tradingagents[checkpoint]', or pip install -e '.[checkpoint]' from a checkout)"
+        ) from e
+
+    class ThreadedSqliteSaver(SqliteSaver):
+        """SqliteSaver whose async methods run the sync ones on a worker thread."""
+
+        async def aget_tuple(self, config):
+            return await asyncio.to_thread(self.get_tuple, config)
+
+        async def alist(self, config, *, filter=None, before=None, limit=None) -> AsyncIterator:
+            items = await asyncio.to_thread(
+                lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+            )
+            for item in items:
+                yield item
+
+        async def aput(self, config, checkpoint, metadata, new_versions):
+            return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+        async def aput_writes(self, config, writes, task_id, task_path=""):
+            return await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+        async def adelete_thread(self, thread_id):
+            return await asyncio.to_thread(self.delete_thread, thread_id)
+
+    return ThreadedSqliteSaver
+
+
+_savers: Dict[str, Any] = {}
+_savers_lock = threading.Lock()
+
+
+def get_checkpointer(path: str):
+    """Return the process-wide SQLite checkpointer for a file, opening it once."""
+    saver_class = _saver_class()
+    key = os.path.abspath(path)
+    with _savers_lock:
+        if key not in _savers:
+            os.makedirs(os.path.dirname(key), exist_ok=True)
+            conn = sqlite3.connect(key, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _savers[key] = saver_class(conn)
+        return _savers[key]
+
+
+def checkpoint_thread_id(
+    company_name: str, trade_date: str, config: Dict[str, Any], selected_analysts: List[str]
+) -> str:
+    """Thread id for one run: ticker, trade date and a hash of the graph's config."""
+    relevant = {k: v for k, v in config.items() if k not in _UNHASHED_CONFIG_KEYS}
+    relevant["selected_analysts"] = list(selected_analysts)
+    digest = hashlib.sha256(
+        json.dumps(relevant, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"{company_name}:{trade_date}:{digest[:16]}"
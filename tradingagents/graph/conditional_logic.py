@@ -1,15 +1,59 @@
 # TradingAgents/graph/conditional_logic.py
 
+import re
+from typing import Optional
+
 from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.agents.utils.debate_history import split_turns
+
+from .signal_processing import parse_decision
+
+# Risk debate nodes that speak concurrently in each parallel round
+RISK_DEBATORS = ("Aggressive Analyst", "Conservative Analyst", "Neutral Analyst")
+
+# "Stance: BUY" lines requested by STANCE_INSTRUCTION
+_STANCE = re.compile(r"stance\W*(buy|sell|hold)\b", re.IGNORECASE)
+
+
+def extract_stance(turn: str) -> Optional[str]:
+    """BUY/SELL/HOLD stated in a debate turn, or None if it takes no clear stance."""
+    stances = _STANCE.findall(turn)
+    if stances:
+        return stances[-1].upper()
+    return parse_decision(turn)
 
 
 class ConditionalLogic:
     """Handles conditional logic for determining graph flow."""
 
-    def __init__(self, max_debate_rounds=1, max_risk_discuss_rounds=1):
-        """Initialize with configuration parameters."""
+    def __init__(
+        self,
+        max_debate_rounds=1,
+        max_risk_discuss_rounds=1,
+        stop_on_convergence=False,
+        convergence_rounds=1,
+    ):
+        """Initialize with configuration parameters.
+
+        With stop_on_convergence, a debate ends before its round limit once
+        every speaker has taken the same stance for convergence_rounds
+        consecutive rounds.
+        """
         self.max_debate_rounds = max_debate_rounds
         self.max_risk_discuss_rounds = max_risk_discuss_rounds
+        self.stop_on_convergence = stop_on_convergence
+        self.convergence_rounds = convergence_rounds
+
+    def _converged(self, debate_state, speakers: int) -> bool:
+        """Whether the latest rounds of turns all state the same stance."""
+        if not self.stop_on_convergence:
+            return False
+        window = speakers * self.convergence_rounds
+        turns = split_turns(debate_state.get("history", ""))
+        if len(turns) < window:
+            return False
+        stances = {extract_stance(turn) for turn in turns[-window:]}
+        return len(stances) == 1 and None not in stances
 
     def should_continue_market(self, state: AgentState):
         """Determine if market analysis should continue."""
@@ -50,6 +94,8 @@ class ConditionalLogic:
             state["investment_debate_state"]["count"] >= 2 * self.max_debate_rounds
         ):  # 3 rounds of back-and-forth between 2 agents
             return "Research Manager"
+        if self._converged(state["investment_debate_state"], speakers=2):
+            return "Research Manager"
         if state["investment_debate_state"]["current_response"].startswith("Bull"):
             return "Bear Researcher"
         return "Bull Researcher"
@@ -60,8 +106,18 @@ class ConditionalLogic:
             state["risk_debate_state"]["count"] >= 3 * self.max_risk_discuss_rounds
         ):  # 3 rounds of back-and-forth between 3 agents
             return "Risk Judge"
+        if self._converged(state["risk_debate_state"], speakers=3):
+            return "Risk Judge"
         if state["risk_debate_state"]["latest_speaker"].startswith("Aggressive"):
             return "Conservative Analyst"
         if state["risk_debate_state"]["latest_speaker"].startswith("Conservative"):
             return "Neutral Analyst"
         return "Aggressive Analyst"
+
+    def should_continue_risk_round(self, state: AgentState):
+        """Start another concurrent risk round, or hand over to the judge."""
+        if state["risk_debate_state"]["count"] >= 3 * self.max_risk_discuss_rounds:
+            return "Risk Judge"
+        if self._converged(state["risk_debate_state"], speakers=3):
+            return "Risk Judge"
+        return list(RISK_DEBATORS)
@@ -1,5 +1,6 @@
 # TradingAgents/graph/propagation.py
 
+import uuid
 from typing import Dict, Any, List, Optional
 from tradingagents.agents.utils.agent_states import (
     AgentState,
@@ -23,12 +24,21 @@ class Propagator:
             "messages": [("human", company_name)],
             "company_of_interest": company_name,
             "trade_date": str(trade_date),
+            "run_id": uuid.uuid4().hex,
             "investment_debate_state": InvestDebateState(
-                {"history": "", "current_response": "", "count": 0}
+                {
+                    "history": "",
+                    "history_summary": "",
+                    "summarized_turns": 0,
+                    "current_response": "",
+                    "count": 0,
+                }
             ),
             "risk_debate_state": RiskDebateState(
                 {
                     "history": "",
+                    "history_summary": "",
+                    "summarized_turns": 0,
                     "current_aggressive_response": "",
                     "current_conservative_response": "",
                     "current_neutral_response": "",
@@ -41,16 +51,27 @@ class Propagator:
             "news_report": "",
         }
 
-    def get_graph_args(self, callbacks: Optional[List] = None) -> Dict[str, Any]:
+    def get_graph_args(
+        self,
+        callbacks: Optional[List] = None,
+        thread_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """Get arguments for the graph invocation.
 
         Args:
             callbacks: Optional list of callback handlers for tool execution tracking.
                        Note: LLM callbacks are handled separately via LLM constructor.
+            thread_id: Checkpoint thread of the run, when checkpointing is enabled.
+            run_id: The run's state "run_id", passed to every call as metadata.
         """
         config = {"recursion_limit": self.max_recur_limit}
         if callbacks:
             config["callbacks"] = callbacks
+        if thread_id:
+            config["configurable"] = {"thread_id": thread_id}
+        if run_id:
+            config["metadata"] = {"run_id": run_id}
         return {
             "stream_mode": "values",
             "config": config,
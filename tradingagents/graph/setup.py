@@ -1,14 +1,88 @@
 # TradingAgents/graph/setup.py
 
-from typing import Dict, Any
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, Optional
+from typing_extensions import TypedDict
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
 from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.agents.utils.debate_history import DebateHistoryCompactor
+from tradingagents.agents.utils.llm_steps import llm_node
+from tradingagents.agents.utils.report_cache import (
+    AnalystReportCache,
+    prompt_fingerprint,
+    with_report_cache,
+)
+from tradingagents.agents.utils.tool_loop import ToolBudget
 
-from .conditional_logic import ConditionalLogic
+from .conditional_logic import ConditionalLogic, RISK_DEBATORS
+
+# State key each analyst writes its final report to
+ANALYST_REPORT_KEYS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
+# Factory building each analyst; its source is the analyst's prompt fingerprint
+ANALYST_FACTORIES = {
+    "market": create_market_analyst,
+    "social": create_social_media_analyst,
+    "news": create_news_analyst,
+    "fundamentals": create_fundamentals_analyst,
+}
+
+RISK_DEBATE_MODES = ("sequential", "parallel_rounds")
+
+
+def _as_round_update(debator_node, speaker: str):
+    """Wrap a risk debator so its output merges with concurrent speakers.
+
+    The debator still reads the previous round's snapshot; only its own
+    fields and argument are handed to merge_risk_debate_state.
+    """
+    key = speaker.lower()
+    own_fields = (f"{key}_history", f"current_{key}_response")
+
+    def round_update(new_state):
+        return {
+            "risk_debate_state": {
+                "round_update": True,
+                "speaker": speaker,
+                "argument": new_state[f"current_{key}_response"],
+                "fields": {k: new_state[k] for k in own_fields if k in new_state},
+            }
+        }
+
+    def round_node(state):
+        return round_update(debator_node.invoke(state)["risk_debate_state"])
+
+    async def around_node(state):
+        return round_update((await debator_node.ainvoke(state))["risk_debate_state"])
+
+    return RunnableLambda(round_node, afunc=around_node)
+
+
+def _create_risk_round(history_compactor, should_continue_risk_round):
+    """Join/fan-out node of the concurrent risk rounds.
+
+    With history compaction on, the history is compacted here once per
+    round, before the fan-out, so the three debators (given a read-only
+    compactor) share one summary instead of each summarizing the snapshot.
+    """
+
+    def risk_round(state):
+        if history_compactor is None or should_continue_risk_round(state) == "Risk Judge":
+            return {}
+        debate_state = state["risk_debate_state"]
+        _, fields = yield from history_compactor.compact_steps(debate_state)
+        return {"risk_debate_state": {**debate_state, **fields}}
+
+    return llm_node(risk_round)
 
 
 class GraphSetup:
@@ -16,8 +90,8 @@ class GraphSetup:
 
     def __init__(
         self,
-        quick_thinking_llm: ChatOpenAI,
-        deep_thinking_llm: ChatOpenAI,
+        quick_thinking_llm: BaseChatModel,
+        deep_thinking_llm: BaseChatModel,
         tool_nodes: Dict[str, ToolNode],
         bull_memory,
         bear_memory,
@@ -25,6 +99,11 @@ class GraphSetup:
         invest_judge_memory,
         risk_manager_memory,
         conditional_logic: ConditionalLogic,
+        history_compactor: Optional[DebateHistoryCompactor] = None,
+        parallel_analysts: bool = False,
+        risk_debate_mode: str = "sequential",
+        report_cache: Optional[AnalystReportCache] = None,
+        tool_budget: Optional[ToolBudget] = None,
     ):
         """Initialize with required components."""
         self.quick_thinking_llm = quick_thinking_llm
@@ -36,9 +115,40 @@ class GraphSetup:
         self.invest_judge_memory = invest_judge_memory
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
+        self.history_compactor = history_compactor
+        self.parallel_analysts = parallel_analysts
+        if risk_debate_mode not in RISK_DEBATE_MODES:
+            raise ValueError(
+                f"Unsupported risk_debate_mode: {risk_debate_mode} (expected one of {RISK_DEBATE_MODES})"
+            )
+        self.risk_debate_mode = risk_debate_mode
+        self.report_cache = report_cache
+        self.tool_budget = tool_budget
+
+    def _build_analyst_branch(self, analyst_type: str, analyst_node, tool_node):
+        """Compile one analyst and its tool loop as an isolated subgraph.
+
+        The branch keeps its own message channel and only hands its report
+        back to the parent graph, so branches can run concurrently.
+        """
+        name = analyst_type.capitalize()
+        report_key = ANALYST_REPORT_KEYS[analyst_type]
+        branch_output = TypedDict(f"{name}AnalystOutput", {report_key: str})
+
+        branch = StateGraph(AgentState, output_schema=branch_output)
+        branch.add_node(f"{name} Analyst", analyst_node)
+        branch.add_node(f"tools_{analyst_type}", tool_node)
+        branch.add_edge(START, f"{name} Analyst")
+        branch.add_conditional_edges(
+            f"{name} Analyst",
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            {f"tools_{analyst_type}": f"tools_{analyst_type}", f"Msg Clear {name}": END},
+        )
+        branch.add_edge(f"tools_{analyst_type}", f"{name} Analyst")
+        return branch.compile()
 
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self, selected_analysts=["market", "social", "news", "fundamentals"], checkpointer=None
     ):
         """Set up and compile the agent workflow graph.
 
@@ -48,6 +158,16 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            checkpointer: Optional LangGraph checkpointer persisting each
+                completed node, so an interrupted run can be resumed
+
+        With parallel_analysts, each analyst runs as its own branch from
+        START and all branches join before the Bull Researcher; otherwise
+        they run one after another on the shared message channel.
+
+        With risk_debate_mode="parallel_rounds", the three risk debators
+        speak concurrently each round, answering the previous round's
+        arguments, instead of taking turns.
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -59,48 +179,71 @@ class GraphSetup:
 
         if "market" in selected_analysts:
             analyst_nodes["market"] = create_market_analyst(
-                self.quick_thinking_llm
+                self.quick_thinking_llm, self.tool_budget
             )
             delete_nodes["market"] = create_msg_delete()
             tool_nodes["market"] = self.tool_nodes["market"]
 
         if "social" in selected_analysts:
             analyst_nodes["social"] = create_social_media_analyst(
-                self.quick_thinking_llm
+                self.quick_thinking_llm, self.tool_budget
             )
             delete_nodes["social"] = create_msg_delete()
             tool_nodes["social"] = self.tool_nodes["social"]
 
         if "news" in selected_analysts:
             analyst_nodes["news"] = create_news_analyst(
-                self.quick_thinking_llm
+                self.quick_thinking_llm, self.tool_budget
             )
             delete_nodes["news"] = create_msg_delete()
             tool_nodes["news"] = self.tool_nodes["news"]
 
         if "fundamentals" in selected_analysts:
             analyst_nodes["fundamentals"] = create_fundamentals_analyst(
-                self.quick_thinking_llm
+                self.quick_thinking_llm, self.tool_budget
             )
             delete_nodes["fundamentals"] = create_msg_delete()
             tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
 
+        # Serve unchanged analyst reports from the cache on re-runs
+        if self.report_cache is not None:
+            for analyst_type, node in analyst_nodes.items():
+                analyst_nodes[analyst_type] = with_report_cache(
+                    node,
+                    analyst_type,
+                    ANALYST_REPORT_KEYS[analyst_type],
+                    self.report_cache,
+                    tool_nodes[analyst_type].tools_by_name,
+                    prompt_fingerprint(ANALYST_FACTORIES[analyst_type]),
+                )
+
         # Create researcher and manager nodes
+        # Ask debators for an explicit stance when debates may end on agreement
+        ask_stance = self.conditional_logic.stop_on_convergence
         bull_researcher_node = create_bull_researcher(
-            self.quick_thinking_llm, self.bull_memory
+            self.quick_thinking_llm, self.bull_memory, self.history_compactor, ask_stance
         )
         bear_researcher_node = create_bear_researcher(
-            self.quick_thinking_llm, self.bear_memory
+            self.quick_thinking_llm, self.bear_memory, self.history_compactor, ask_stance
         )
         research_manager_node = create_research_manager(
             self.deep_thinking_llm, self.invest_judge_memory
         )
         trader_node = create_trader(self.quick_thinking_llm, self.trader_memory)
 
-        # Create risk analysis nodes
-        aggressive_analyst = create_aggressive_debator(self.quick_thinking_llm)
-        neutral_analyst = create_neutral_debator(self.quick_thinking_llm)
-        conservative_analyst = create_conservative_debator(self.quick_thinking_llm)
+        # Create risk analysis nodes (concurrent rounds compact in Risk Round)
+        risk_compactor = self.history_compactor
+        if risk_compactor is not None and self.risk_debate_mode == "parallel_rounds":
+            risk_compactor = risk_compactor.read_only()
+        aggressive_analyst = create_aggressive_debator(
+            self.quick_thinking_llm, risk_compactor, ask_stance
+        )
+        neutral_analyst = create_neutral_debator(
+            self.quick_thinking_llm, risk_compactor, ask_stance
+        )
+        conservative_analyst = create_conservative_debator(
+            self.quick_thinking_llm, risk_compactor, ask_stance
+        )
         risk_manager_node = create_risk_manager(
             self.deep_thinking_llm, self.risk_manager_memory
         )
@@ -109,24 +252,62 @@ class GraphSetup:
         workflow = StateGraph(AgentState)
 
         # Add analyst nodes to the graph
-        for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
-            workflow.add_node(
-                f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
-            )
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
+        if self.parallel_analysts:
+            for analyst_type, node in analyst_nodes.items():
+                workflow.add_node(
+                    f"{analyst_type.capitalize()} Analyst",
+                    self._build_analyst_branch(analyst_type, node, tool_nodes[analyst_type]),
+                )
+        else:
+            for analyst_type, node in analyst_nodes.items():
+                workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
+                workflow.add_node(
+                    f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
+                )
+                workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
 
         # Add other nodes
         workflow.add_node("Bull Researcher", bull_researcher_node)
         workflow.add_node("Bear Researcher", bear_researcher_node)
         workflow.add_node("Research Manager", research_manager_node)
         workflow.add_node("Trader", trader_node)
+        if self.risk_debate_mode == "parallel_rounds":
+            aggressive_analyst = _as_round_update(aggressive_analyst, "Aggressive")
+            conservative_analyst = _as_round_update(conservative_analyst, "Conservative")
+            neutral_analyst = _as_round_update(neutral_analyst, "Neutral")
+            workflow.add_node(
+                "Risk Round",
+                _create_risk_round(
+                    self.history_compactor, self.conditional_logic.should_continue_risk_round
+                ),
+            )
         workflow.add_node("Aggressive Analyst", aggressive_analyst)
         workflow.add_node("Neutral Analyst", neutral_analyst)
         workflow.add_node("Conservative Analyst", conservative_analyst)
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
+        if self.parallel_analysts:
+            # Fan out from START and join before the debate
+            branches = [f"{a.capitalize()} Analyst" for a in selected_analysts]
+            for branch in branches:
+                workflow.add_edge(START, branch)
+            workflow.add_edge(branches, "Bull Researcher")
+        else:
+            self._add_sequential_analyst_edges(workflow, selected_analysts)
+
+        self._add_research_edges(workflow)
+        if self.risk_debate_mode == "parallel_rounds":
+            self._add_parallel_risk_edges(workflow)
+        else:
+            self._add_sequential_risk_edges(workflow)
+        workflow.add_edge("Risk Judge", END)
+
+        # Compile and return
+        return workflow.compile(checkpointer=checkpointer)
+
+    def _add_sequential_analyst_edges(self, workflow, selected_analysts):
+        """Chain the analysts in order, each with its tool loop and Msg Clear."""
         # Start with the first analyst
         first_analyst = selected_analysts[0]
         workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
@@ -152,7 +333,8 @@ class GraphSetup:
             else:
                 workflow.add_edge(current_clear, "Bull Researcher")
 
-        # Add remaining edges
+    def _add_research_edges(self, workflow):
+        """Wire the bull/bear debate through to the trader."""
         workflow.add_conditional_edges(
             "Bull Researcher",
             self.conditional_logic.should_continue_debate,
@@ -170,6 +352,19 @@ class GraphSetup:
             },
         )
         workflow.add_edge("Research Manager", "Trader")
+
+    def _add_parallel_risk_edges(self, workflow):
+        """Each round fans out to all three debators and joins at Risk Round."""
+        workflow.add_edge("Trader", "Risk Round")
+        workflow.add_conditional_edges(
+            "Risk Round",
+            self.conditional_logic.should_continue_risk_round,
+            [*RISK_DEBATORS, "Risk Judge"],
+        )
+        workflow.add_edge(list(RISK_DEBATORS), "Risk Round")
+
+    def _add_sequential_risk_edges(self, workflow):
+        """Aggressive, conservative and neutral take turns each round."""
         workflow.add_edge("Trader", "Aggressive Analyst")
         workflow.add_conditional_edges(
             "Aggressive Analyst",
@@ -195,8 +390,3 @@ class GraphSetup:
                 "Risk Judge": "Risk Judge",
             },
         )
-
-        workflow.add_edge("Risk Judge", END)
-
-        # Compile and return
-        return workflow.compile()
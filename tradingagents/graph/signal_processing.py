@@ -1,25 +1,94 @@
 # TradingAgents/graph/signal_processing.py
 
-from langchain_openai import ChatOpenAI
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+
+from tradingagents.agents.utils.llm_steps import arun_steps, run_steps
+
+_DECISION = r"(?:strong\s+)?(buy|sell|hold)\b"
+_EMPHASIS = r"[\s*_`#>\"'\[\]]*"
+
+# Explicit conclusions, e.g. "FINAL TRANSACTION PROPOSAL: **BUY**",
+# "**Recommendation:** Sell", "Final decision - HOLD"
+_EXPLICIT = re.compile(
+    r"(?:final\s+(?:transaction\s+proposal|trade\s+decision|decision|recommendation|verdict)"
+    r"|(?:my\s+|overall\s+)?recommendation|decision|verdict)"
+    + _EMPHASIS + r"(?:is|:|-|–|—)" + _EMPHASIS + r"(?:to\s+)?" + _DECISION,
+    re.IGNORECASE,
+)
+
+# Weaker cues used only when no explicit conclusion is present
+_IMPLICIT = re.compile(
+    r"(?:\*\*|__)\s*" + _DECISION + r"\s*(?:\*\*|__)"
+    r"|\b(?:I|we)\s+(?:strongly\s+)?recommend(?:\s+that\s+we|\s+to)?\s+" + _DECISION,
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class SignalDecision:
+    """Decision extracted from a trading signal."""
+
+    decision: str
+    confident: bool
+    method: str  # "parser" or "llm"
+
+
+def _found(pattern: re.Pattern, text: str) -> List[str]:
+    return [
+        next(group for group in match.groups() if group).upper()
+        for match in pattern.finditer(text)
+    ]
+
+
+def parse_decision(full_signal: str) -> Optional[str]:
+    """Deterministically extract BUY/SELL/HOLD, or None if ambiguous or conflicting."""
+    explicit = _found(_EXPLICIT, full_signal)
+    if explicit:
+        # The concluding statement wins; earlier ones must not contradict it
+        return explicit[-1] if len(set(explicit)) == 1 else None
+
+    implicit = set(_found(_IMPLICIT, full_signal))
+    if len(implicit) == 1:
+        return implicit.pop()
+    return None
 
 
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
 
-    def __init__(self, quick_thinking_llm: ChatOpenAI):
+    def __init__(self, quick_thinking_llm: BaseChatModel):
         """Initialize with an LLM for processing."""
         self.quick_thinking_llm = quick_thinking_llm
 
-    def process_signal(self, full_signal: str) -> str:
+    def extract_decision(self, full_signal: str) -> SignalDecision:
         """
-        Process a full trading signal to extract the core decision.
+        Extract the decision, parsing it locally when the text is unambiguous.
+
+        The LLM is only called when the signal has no clear conclusion or
+        its conclusions conflict.
 
         Args:
             full_signal: Complete trading signal text
 
         Returns:
-            Extracted decision (BUY, SELL, or HOLD)
+            SignalDecision with the decision (BUY, SELL, or HOLD), whether it
+            came from an unambiguous parse, and the method used
         """
+        return run_steps(self._extract_steps(full_signal))
+
+    async def aextract_decision(self, full_signal: str) -> SignalDecision:
+        """Async version of extract_decision."""
+        return await arun_steps(self._extract_steps(full_signal))
+
+    def _extract_steps(self, full_signal: str):
+        decision = parse_decision(full_signal)
+        if decision:
+            return SignalDecision(decision, confident=True, method="parser")
+
         messages = [
             (
                 "system",
@@ -27,5 +96,23 @@ class SignalProcessor:
             ),
             ("human", full_signal),
         ]
+        content = (yield self.quick_thinking_llm, messages).content
+        match = re.search(r"\b(BUY|SELL|HOLD)\b", content, re.IGNORECASE)
+        decision = match.group(1).upper() if match else content.strip()
+        return SignalDecision(decision, confident=False, method="llm")
+
+    def process_signal(self, full_signal: str) -> str:
+        """
+        Process a full trading signal to extract the core decision.
+
+        Args:
+            full_signal: Complete trading signal text
+
+        Returns:
+            Extracted decision (BUY, SELL, or HOLD)
+        """
+        return self.extract_decision(full_signal).decision
 
-        return self.quick_thinking_llm.invoke(messages).content
+    async def aprocess_signal(self, full_signal: str) -> str:
+        """Async version of process_signal."""
+        return (await self.aextract_decision(full_signal)).decision
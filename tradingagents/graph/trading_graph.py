@@ -1,14 +1,19 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 import json
 from datetime import date
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Iterable, Iterator, Tuple, List, Optional
 
 from langgraph.prebuilt import ToolNode
 
-from tradingagents.llm_clients import create_llm_client
+from tradingagents.llm_clients import SQLiteLLMCache, TraceRecorder, create_llm_client
+from tradingagents.llm_clients.hedging import create_hedged_llm
+from tradingagents.llm_clients.load_balancer import create_balanced_llm
 
 from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
@@ -18,6 +23,10 @@ from tradingagents.agents.utils.agent_states import (
     InvestDebateState,
     RiskDebateState,
 )
+from tradingagents.agents.utils.debate_history import DebateHistoryCompactor
+from tradingagents.agents.utils.report_cache import AnalystReportCache
+from tradingagents.agents.utils.tool_blobs import ToolBlobStore
+from tradingagents.agents.utils.tool_loop import ToolBudget, ToolCallMemo, compose_tool_hooks
 from tradingagents.dataflows.config import set_config
 
 # Import the new abstract tool methods from agent_utils
@@ -41,16 +50,40 @@ from tradingagents.agents.utils.agent_utils import (
     get_fear_greed_index,
     # Phase 3
     get_sec_filings,
+    get_sec_filing_section,
     get_crypto_data,
+    get_crypto_markets,
     get_crypto_fear_greed,
 )
 
+from .checkpointing import checkpoint_thread_id, get_checkpointer
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
 
+# Config keys that change what an analyst writes, so cached reports are
+# only reused when they match
+REPORT_CACHE_CONFIG_KEYS = (
+    "data_vendors",
+    "tool_vendors",
+    "tool_output_spill_chars",
+    "tool_output_caps",
+    "analyst_max_tool_rounds",
+    "analyst_max_tool_calls",
+)
+
+@dataclass
+class PropagateResult:
+    """Outcome of one (ticker, trade_date) job from propagate_many."""
+
+    company_name: str
+    trade_date: str
+    final_state: Optional[Dict[str, Any]] = None
+    decision: Optional[str] = None
+    error: Optional[BaseException] = None
+
 
 class TradingAgentsGraph:
     """Main class that orchestrates the trading agents framework."""
@@ -112,25 +145,20 @@ class TradingAgentsGraph:
             quick_kwargs[key_name] = quick_api_key
 
         # Add callbacks to kwargs if provided (passed to LLM constructor)
-        if self.callbacks:
-            deep_kwargs["callbacks"] = self.callbacks
-            quick_kwargs["callbacks"] = self.callbacks
-
-        deep_client = create_llm_client(
-            provider=deep_provider,
-            model=self.config["deep_think_llm"],
-            base_url=deep_url,
-            **deep_kwargs,
-        )
-        quick_client = create_llm_client(
-            provider=quick_provider,
-            model=self.config["quick_think_llm"],
-            base_url=quick_url,
-            **quick_kwargs,
-        )
-
-        self.deep_thinking_llm = deep_client.get_llm()
-        self.quick_thinking_llm = quick_client.get_llm()
+        llm_callbacks = list(self.callbacks)
+        if self.config.get("llm_trace_record_path"):
+            llm_callbacks.append(TraceRecorder(self.config["llm_trace_record_path"]))
+        if llm_callbacks:
+            deep_kwargs["callbacks"] = llm_callbacks
+            quick_kwargs["callbacks"] = llm_callbacks
+
+        self.deep_thinking_llm = self._create_llm("deep_think", deep_provider, deep_url, deep_kwargs)
+        self.quick_thinking_llm = self._create_llm("quick_think", quick_provider, quick_url, quick_kwargs)
+        self.llm_caches = list({
+            id(llm.cache): llm.cache
+            for llm in (self.deep_thinking_llm, self.quick_thinking_llm)
+            if isinstance(llm.cache, SQLiteLLMCache)
+        }.values())
         
         # Initialize memories
         self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
@@ -146,6 +174,8 @@ class TradingAgentsGraph:
         self.conditional_logic = ConditionalLogic(
             self.config.get("max_debate_rounds", 1),
             self.config.get("max_risk_discuss_rounds", 1),
+            stop_on_convergence=self.config.get("debate_stop_on_convergence", False),
+            convergence_rounds=self.config.get("debate_convergence_rounds", 1),
         )
         self.graph_setup = GraphSetup(
             self.quick_thinking_llm,
@@ -157,6 +187,14 @@ class TradingAgentsGraph:
             self.invest_judge_memory,
             self.risk_manager_memory,
             self.conditional_logic,
+            history_compactor=self._create_history_compactor(),
+            parallel_analysts=self.config.get("parallel_analysts", False),
+            risk_debate_mode=self.config.get("risk_debate_mode", "sequential"),
+            report_cache=self._create_report_cache(quick_provider),
+            tool_budget=ToolBudget(
+                max_rounds=self.config.get("analyst_max_tool_rounds", 8),
+                max_calls=self.config.get("analyst_max_tool_calls", 20),
+            ),
         )
 
         self.propagator = Propagator(self.config.get("max_recur_limit", 100))
@@ -166,14 +204,75 @@ class TradingAgentsGraph:
         # State tracking
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        self.log_states_dict = {}  # ticker to {date: full state dict}
+        self._state_lock = threading.Lock()
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.selected_analysts = list(selected_analysts)
+        checkpoint_path = self.config.get("checkpoint_path")
+        self.checkpointer = get_checkpointer(checkpoint_path) if checkpoint_path else None
+        self.graph = self.graph_setup.setup_graph(selected_analysts, checkpointer=self.checkpointer)
+
+    def _create_llm(self, role: str, provider: str, base_url: Optional[str], kwargs: Dict[str, Any]):
+        """Create the LLM for a role ("deep_think" or "quick_think").
+
+        If a pool of backends is configured for the role, calls are balanced
+        across them; otherwise a single client uses base_url. If hedging is
+        configured for the role, slow or failed calls are raced against the
+        fallback model.
+        """
+        hedge = (self.config.get("llm_hedging") or {}).get(role)
+        common = {
+            "model": self.config[f"{role}_llm"],
+            "rate_limits": self.config.get("llm_rate_limits"),
+            **kwargs,
+        }
+        if hedge:
+            # The hedged wrapper owns callbacks and the response cache
+            callbacks = common.pop("callbacks", None)
+        else:
+            common["cache_path"] = self.config.get("llm_cache_path")
+
+        backends = self.config.get(f"{role}_backends")
+        if backends:
+            llm = create_balanced_llm(
+                provider,
+                backends=backends,
+                cooldown_seconds=self.config.get("llm_backend_cooldown_seconds", 30),
+                **common,
+            )
+        else:
+            llm = create_llm_client(provider=provider, base_url=base_url, **common).get_llm()
+
+        if not hedge:
+            return llm
+
+        fallback_kwargs = self._get_provider_kwargs(hedge["provider"])
+        if hedge.get("api_key"):
+            key_name = "google_api_key" if hedge["provider"].lower() == "google" else "api_key"
+            fallback_kwargs[key_name] = hedge["api_key"]
+        fallback = create_llm_client(
+            provider=hedge["provider"],
+            model=hedge["model"],
+            base_url=hedge.get("base_url"),
+            rate_limits=self.config.get("llm_rate_limits"),
+            **fallback_kwargs,
+        ).get_llm()
+        return create_hedged_llm(
+            llm,
+            fallback,
+            hedge["after_seconds"],
+            provider=provider,
+            cache_path=self.config.get("llm_cache_path"),
+            callbacks=callbacks,
+        )
 
     def _get_provider_kwargs(self, provider: str = None) -> Dict[str, Any]:
         """Get provider-specific kwargs for LLM client creation."""
         kwargs = {}
+        if self.config.get("llm_http_pool_size"):
+            kwargs["http_pool_size"] = self.config["llm_http_pool_size"]
+        kwargs["http2"] = self.config.get("llm_http2", True)
         provider = (provider or self.config.get("llm_provider", "")).lower()
 
         if provider == "google":
@@ -186,10 +285,66 @@ class TradingAgentsGraph:
             if reasoning_effort:
                 kwargs["reasoning_effort"] = reasoning_effort
 
+        elif provider == "replay":
+            kwargs["trace_path"] = self.config.get("replay_trace_path")
+            kwargs["latency"] = self.config.get("replay_latency")
+            kwargs["latency_seed"] = self.config.get("replay_latency_seed")
+
         return kwargs
 
+    def _create_history_compactor(self) -> Optional[DebateHistoryCompactor]:
+        """Create the debate-history compactor if a token budget is configured."""
+        budget = self.config.get("debate_history_budget_tokens")
+        if not budget:
+            return None
+        return DebateHistoryCompactor(
+            self.quick_thinking_llm,
+            budget,
+            keep_turns=self.config.get("debate_history_keep_turns", 2),
+        )
+
+    def _create_report_cache(self, provider: str) -> Optional[AnalystReportCache]:
+        """Open the analyst report cache if a path is configured.
+
+        Analysts run on the quick-thinking model, so reports are cached per
+        quick-think provider and model, and per the config values in
+        REPORT_CACHE_CONFIG_KEYS.
+        """
+        path = self.config.get("analyst_report_cache_path")
+        if not path:
+            return None
+        return AnalystReportCache(
+            path,
+            model=f"{provider}/{self.config['quick_think_llm']}",
+            settings={key: self.config.get(key) for key in REPORT_CACHE_CONFIG_KEYS},
+        )
+
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
-        """Create tool nodes for different data sources using abstract methods."""
+        """Create tool nodes for different data sources using abstract methods.
+
+        With "tool_call_memo" on, a call repeated with the same arguments in
+        one run is answered from the first result. With "tool_blob_dir" set,
+        large tool outputs are spilled to a blob store and the graph state
+        keeps only a handle and preview.
+        """
+        tool_hooks = []
+        if self.config.get("tool_call_memo", True):
+            tool_hooks.append(ToolCallMemo())
+        blob_dir = self.config.get("tool_blob_dir")
+        if blob_dir:
+            max_age_days = self.config.get("tool_blob_max_age_days", 7)
+            max_mb = self.config.get("tool_blob_max_mb", 1024)
+            tool_hooks.append(
+                ToolBlobStore(
+                    blob_dir,
+                    spill_chars=self.config.get("tool_output_spill_chars", 4000),
+                    caps=self.config.get("tool_output_caps"),
+                    max_age_seconds=None if max_age_days is None else max_age_days * 86400,
+                    max_bytes=None if max_mb is None else int(max_mb * 1024 * 1024),
+                )
+            )
+        hooks = compose_tool_hooks(*tool_hooks)
+
         return {
             "market": ToolNode(
                 [
@@ -199,7 +354,8 @@ class TradingAgentsGraph:
                     get_indicators,
                     # Options data (Phase 1)
                     get_options_chain,
-                ]
+                ],
+                **hooks,
             ),
             "social": ToolNode(
                 [
@@ -210,7 +366,8 @@ class TradingAgentsGraph:
                     get_fear_greed_index,
                     # News for context
                     get_news,
-                ]
+                ],
+                **hooks,
             ),
             "news": ToolNode(
                 [
@@ -220,7 +377,8 @@ class TradingAgentsGraph:
                     get_insider_transactions,
                     # Macro data (Phase 1)
                     get_macro_indicators,
-                ]
+                ],
+                **hooks,
             ),
             "fundamentals": ToolNode(
                 [
@@ -231,22 +389,103 @@ class TradingAgentsGraph:
                     get_income_statement,
                     # SEC filings (Phase 3)
                     get_sec_filings,
-                ]
+                    get_sec_filing_section,
+                ],
+                **hooks,
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+    def prepare_run(self, company_name, trade_date, resume=False, callbacks=None):
+        """Return (graph input, graph args) for a run.
+
+        With checkpointing enabled, resume=True continues the run's thread
+        from its last completed node (input None); a finished thread is not
+        re-run. Otherwise any earlier checkpoints of the thread are dropped
+        and the run starts from the initial state.
+        """
+        thread_id = None
+        if self.checkpointer is not None:
+            thread_id = checkpoint_thread_id(
+                company_name, trade_date, self.config, self.selected_analysts
+            )
+        args = self.propagator.get_graph_args(callbacks=callbacks, thread_id=thread_id)
+
+        if thread_id is not None:
+            saved = self.graph.get_state(args["config"]).values
+            if resume and saved:
+                return None, self.propagator.get_graph_args(
+                    callbacks=callbacks, thread_id=thread_id, run_id=saved.get("run_id")
+                )
+            self.checkpointer.delete_thread(thread_id)
+
+        init_agent_state = self.propagator.create_initial_state(company_name, trade_date)
+        args = self.propagator.get_graph_args(
+            callbacks=callbacks, thread_id=thread_id, run_id=init_agent_state["run_id"]
+        )
+        return init_agent_state, args
+
+    def propagate(self, company_name, trade_date, resume=False):
+        """Run the trading agents graph for a company on a specific date.
+
+        With checkpointing enabled (config "checkpoint_path"), resume=True
+        continues an interrupted run of the same ticker, date and config
+        from its last completed node.
+        """
 
         self.ticker = company_name
+        final_state = self._run(company_name, trade_date, resume, debug=self.debug)
+
+        # Return decision and processed signal
+        return final_state, self.process_signal(final_state["final_trade_decision"])
+
+    def propagate_many(
+        self,
+        jobs: Iterable[Tuple[str, str]],
+        max_concurrency: int = 4,
+        resume: bool = False,
+    ) -> Iterator[PropagateResult]:
+        """Run many (ticker, trade_date) jobs concurrently, yielding results as they finish.
+
+        Jobs share this graph's compiled workflow, LLM clients and data
+        caches. At most max_concurrency jobs run at once; per-provider
+        request limits still come from "llm_rate_limits", so concurrency
+        can be raised without overrunning a provider. A failed job yields a
+        result with ``error`` set instead of stopping the batch.
+
+        Example:
+            for result in ta.propagate_many([("NVDA", "2026-02-14"), ("AMD", "2026-02-14")], 8):
+                print(result.company_name, result.decision or result.error)
+        """
+
+        def run_job(company_name, trade_date):
+            final_state = self._run(company_name, trade_date, resume)
+            return final_state, self.process_signal(final_state["final_trade_decision"])
+
+        executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="propagate")
+        try:
+            futures = {
+                executor.submit(run_job, company_name, str(trade_date)): (company_name, str(trade_date))
+                for company_name, trade_date in jobs
+            }
+            for future in as_completed(futures):
+                company_name, trade_date = futures[future]
+                try:
+                    final_state, decision = future.result()
+                except Exception as e:
+                    yield PropagateResult(company_name, trade_date, error=e)
+                else:
+                    yield PropagateResult(company_name, trade_date, final_state, decision)
+        finally:
+            # Stop queued jobs if the caller stops consuming results early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, company_name, trade_date, resume=False, debug=False):
+        """Run the graph for one job, then record and log its final state."""
 
         # Initialize state
-        init_agent_state = self.propagator.create_initial_state(
-            company_name, trade_date
-        )
-        args = self.propagator.get_graph_args()
+        init_agent_state, args = self.prepare_run(company_name, trade_date, resume=resume)
 
-        if self.debug:
+        if debug:
             # Debug mode with tracing
             trace = []
             for chunk in self.graph.stream(init_agent_state, **args):
@@ -261,18 +500,55 @@ class TradingAgentsGraph:
             # Standard mode without tracing
             final_state = self.graph.invoke(init_agent_state, **args)
 
-        # Store current state for reflection
-        self.curr_state = final_state
+        self._record_state(trade_date, final_state)
+        return final_state
 
-        # Log state
-        self._log_state(trade_date, final_state)
+    async def apropagate(self, company_name, trade_date, resume=False):
+        """Async version of propagate, for running many analyses on one event loop.
 
-        # Return decision and processed signal
-        return final_state, self.process_signal(final_state["final_trade_decision"])
+        Every agent makes its LLM calls with ``ainvoke``, so concurrent runs
+        (e.g. under ``asyncio.gather``) need no thread each.
+        """
+        self.ticker = company_name
+
+        final_state = None
+        async for chunk in self.astream(company_name, trade_date, resume=resume):
+            if self.debug and len(chunk["messages"]) > 0:
+                chunk["messages"][-1].pretty_print()
+            final_state = chunk
+
+        return final_state, await self.signal_processor.aprocess_signal(
+            final_state["final_trade_decision"]
+        )
+
+    async def astream(self, company_name, trade_date, resume=False, callbacks=None):
+        """Run the graph asynchronously, yielding the full state after each step.
+
+        Once the run completes, its final state is kept for reflection and
+        logged like a propagate run.
+        """
+        init_agent_state, args = self.prepare_run(
+            company_name, trade_date, resume=resume, callbacks=callbacks
+        )
+
+        final_state = None
+        async for chunk in self.graph.astream(init_agent_state, **args):
+            final_state = chunk
+            yield chunk
+
+        self._record_state(trade_date, final_state)
+
+    def _record_state(self, trade_date, final_state):
+        """Keep a finished run's state for reflection and write its log."""
+        with self._state_lock:
+            self.curr_state = final_state
+
+        self._log_state(trade_date, final_state)
 
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        ticker = final_state["company_of_interest"]
+        entry = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -304,11 +580,14 @@ class TradingAgentsGraph:
 
         # Save to file
         results_dir = self.config.get("results_dir", "./results")
-        directory = Path(results_dir) / self.ticker / "TradingAgentsStrategy_logs"
+        directory = Path(results_dir) / ticker / "TradingAgentsStrategy_logs"
         directory.mkdir(parents=True, exist_ok=True)
 
-        with open(directory / f"full_states_log_{trade_date}.json", "w") as f:
-            json.dump(self.log_states_dict, f, indent=4)
+        with self._state_lock:
+            ticker_states = self.log_states_dict.setdefault(ticker, {})
+            ticker_states[str(trade_date)] = entry
+            with open(directory / f"full_states_log_{trade_date}.json", "w") as f:
+                json.dump(ticker_states, f, indent=4)
 
     def reflect_and_remember(self, returns_losses):
         """Reflect on decisions and update memory based on returns."""
@@ -328,6 +607,14 @@ class TradingAgentsGraph:
             self.curr_state, returns_losses, self.risk_manager_memory
         )
 
+    def get_llm_cache_stats(self) -> Dict[str, int]:
+        """Return combined LLM response cache hits/misses (zeros if caching is off)."""
+        stats = {"hits": 0, "misses": 0}
+        for cache in self.llm_caches:
+            for key, value in cache.get_stats().items():
+                stats[key] += value
+        return stats
+
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
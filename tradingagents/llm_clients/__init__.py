@@ -1,4 +1,14 @@
 from .base_client import BaseLLMClient
+from .cache import SQLiteLLMCache, bypass_llm_cache
 from .factory import create_llm_client
+from .rate_limit import ProviderRateLimiter
+from .replay_client import TraceRecorder
 
-__all__ = ["BaseLLMClient", "create_llm_client"]
+__all__ = [
+    "BaseLLMClient",
+    "ProviderRateLimiter",
+    "SQLiteLLMCache",
+    "TraceRecorder",
+    "bypass_llm_cache",
+    "create_llm_client",
+]
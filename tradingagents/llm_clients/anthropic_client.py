@@ -1,11 +1,36 @@
+import os
+from functools import cached_property
 from typing import Any, Optional
 
+import anthropic
 from langchain_anthropic import ChatAnthropic
 
 from .base_client import BaseLLMClient
+from .http_pool import get_http_client
+from .prompt_cache import with_cache_control
+from .rate_limit import RateLimitedChatModel
 from .validators import validate_model
 
 
+class PrefixCachingChatAnthropic(RateLimitedChatModel, ChatAnthropic):
+    """ChatAnthropic that places a cache_control breakpoint after the shared prefix.
+
+    Also accepts an ``http_client`` so requests go through a shared pool.
+    """
+
+    http_client: Optional[Any] = None
+
+    @cached_property
+    def _client(self) -> anthropic.Client:
+        if self.http_client is None:
+            return super()._client
+        return anthropic.Client(**self._client_params, http_client=self.http_client)
+
+    def _get_request_payload(self, input_, *, stop=None, **kwargs):
+        messages = with_cache_control(self._convert_input(input_).to_messages())
+        return super()._get_request_payload(messages, stop=stop, **kwargs)
+
+
 class AnthropicClient(BaseLLMClient):
     """Client for Anthropic Claude models."""
 
@@ -13,14 +38,22 @@ class AnthropicClient(BaseLLMClient):
         super().__init__(model, base_url, **kwargs)
 
     def get_llm(self) -> Any:
-        """Return configured ChatAnthropic instance."""
+        """Return configured PrefixCachingChatAnthropic instance."""
         llm_kwargs = {"model": self.model}
 
-        for key in ("timeout", "max_retries", "api_key", "max_tokens", "callbacks"):
+        for key in ("timeout", "max_retries", "api_key", "max_tokens", "callbacks", "cache", "call_limiter", "http_client"):
             if key in self.kwargs:
                 llm_kwargs[key] = self.kwargs[key]
 
-        return ChatAnthropic(**llm_kwargs)
+        if "http_client" not in llm_kwargs:
+            llm_kwargs["http_client"] = get_http_client(
+                os.environ.get("ANTHROPIC_BASE_URL") or "https://api.anthropic.com",
+                anthropic.DefaultHttpxClient,
+                self.kwargs.get("http_pool_size"),
+                self.kwargs.get("http2", True),
+            )
+
+        return PrefixCachingChatAnthropic(**llm_kwargs)
 
     def validate_model(self) -> bool:
         """Validate model for Anthropic."""
@@ -0,0 +1,153 @@
+"""Exact-match LLM response cache backed by a local SQLite file.
+
+Re-running the same ticker and date (prompt iteration, backtest replays)
+replays every agent's response, tool calls included, instead of paying
+provider latency again. Opt in via the ``cache_path`` argument of
+``create_llm_client``.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from langchain_core._api import LangChainBetaWarning
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, Generation
+
+# Only these classes may be revived from the cache file
+_ALLOWED_OBJECTS = [AIMessage, AIMessageChunk, ChatGeneration, ChatGenerationChunk, Generation]
+
+# Message fields that vary between otherwise identical runs
+_VOLATILE_MESSAGE_FIELDS = ("id", "response_metadata", "usage_metadata")
+
+_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+
+
+@contextmanager
+def bypass_llm_cache():
+    """Skip cache reads (but still record fresh responses) within this block.
+
+    Example:
+        with bypass_llm_cache():
+            graph.propagate("NVDA", "2026-02-14")
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def _normalize(node: Any) -> Any:
+    """Drop per-run message fields from a serialized prompt."""
+    if isinstance(node, list):
+        return [_normalize(item) for item in node]
+    if isinstance(node, dict):
+        if node.get("type") == "constructor" and isinstance(node.get("kwargs"), dict):
+            kwargs = {
+                k: _normalize(v)
+                for k, v in node["kwargs"].items()
+                if k not in _VOLATILE_MESSAGE_FIELDS
+            }
+            return {**node, "kwargs": kwargs}
+        return {k: _normalize(v) for k, v in node.items()}
+    return node
+
+
+class SQLiteLLMCache(BaseCache):
+    """LangChain cache keyed on (namespace, model config incl. bound tools, messages).
+
+    The model config string comes from LangChain and already covers the
+    model name, reasoning settings and bound tool schemas; the namespace
+    adds the provider.
+    """
+
+    def __init__(self, path: str, namespace: str = ""):
+        self.path = path
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._conn.commit()
+
+    def _key(self, prompt: str, llm_string: str) -> str:
+        try:
+            prompt = json.dumps(_normalize(json.loads(prompt)), sort_keys=True)
+        except json.JSONDecodeError:
+            pass
+        raw = "\x00".join((self.namespace, llm_string, prompt))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Return cached generations, or None on a miss or when bypassed."""
+        if _bypass.get():
+            with self._lock:
+                self.misses += 1
+            return None
+
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", LangChainBetaWarning)
+            return [
+                loads(generation, allowed_objects=_ALLOWED_OBJECTS)
+                for generation in json.loads(row[0])
+            ]
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store generations, including any tool calls on the messages."""
+        key = self._key(prompt, llm_string)
+        value = json.dumps([dumps(generation) for generation in return_val])
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value) VALUES (?, ?)", (key, value)
+            )
+            self._conn.commit()
+
+    def clear(self, **kwargs: Any) -> None:
+        """Delete every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit/miss counters since this cache was opened."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+_caches: Dict[tuple, SQLiteLLMCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_cache(path: str, namespace: str = "") -> SQLiteLLMCache:
+    """Return the process-wide cache for (path, namespace), opening it once."""
+    key = (os.path.abspath(path), namespace)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = SQLiteLLMCache(path, namespace)
+        return _caches[key]
@@ -1,23 +1,28 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from .base_client import BaseLLMClient
-from .openai_client import OpenAIClient
-from .anthropic_client import AnthropicClient
-from .google_client import GoogleClient
+from .cache import get_llm_cache
+from .rate_limit import backend_id, get_rate_limiter
 
 
 def create_llm_client(
     provider: str,
     model: str,
     base_url: Optional[str] = None,
+    cache_path: Optional[str] = None,
+    rate_limits: Optional[Dict[str, Dict[str, int]]] = None,
     **kwargs,
 ) -> BaseLLMClient:
     """Create an LLM client for the specified provider.
 
     Args:
-        provider: LLM provider (openai, anthropic, google, xai, ollama, openrouter)
+        provider: LLM provider (openai, anthropic, google, xai, ollama, openrouter, replay)
         model: Model name/identifier
         base_url: Optional base URL for API endpoint
+        cache_path: Optional SQLite file for the exact-match response cache
+        rate_limits: Optional {"provider" or "provider/model": {"rpm", "tpm",
+            "max_concurrency"}} limits, shared by all clients with the same key
+            on the same endpoint and API key
         **kwargs: Additional provider-specific arguments
 
     Returns:
@@ -28,16 +33,29 @@ def create_llm_client(
     """
     provider_lower = provider.lower()
 
-    if provider_lower in ("openai", "ollama", "openrouter"):
-        return OpenAIClient(model, base_url, provider=provider_lower, **kwargs)
+    if cache_path:
+        kwargs["cache"] = get_llm_cache(cache_path, namespace=provider_lower)
+
+    api_key = kwargs.get("google_api_key" if provider_lower == "google" else "api_key")
+    limiter = get_rate_limiter(provider_lower, model, rate_limits, backend_id(base_url, api_key))
+    if limiter:
+        kwargs["call_limiter"] = limiter
 
-    if provider_lower == "xai":
-        return OpenAIClient(model, base_url, provider="xai", **kwargs)
+    # Provider SDKs are imported only when selected; each costs seconds at import
+    if provider_lower in ("openai", "ollama", "openrouter", "xai"):
+        from .openai_client import OpenAIClient
+        return OpenAIClient(model, base_url, provider=provider_lower, **kwargs)
 
     if provider_lower == "anthropic":
+        from .anthropic_client import AnthropicClient
         return AnthropicClient(model, base_url, **kwargs)
 
     if provider_lower == "google":
+        from .google_client import GoogleClient
         return GoogleClient(model, base_url, **kwargs)
 
+    if provider_lower == "replay":
+        from .replay_client import ReplayClient
+        return ReplayClient(model, base_url, **kwargs)
+
     raise ValueError(f"Unsupported LLM provider: {provider}")
@@ -3,10 +3,11 @@ from typing import Any, Optional
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from .base_client import BaseLLMClient
+from .rate_limit import RateLimitedChatModel
 from .validators import validate_model
 
 
-class NormalizedChatGoogleGenerativeAI(ChatGoogleGenerativeAI):
+class NormalizedChatGoogleGenerativeAI(RateLimitedChatModel, ChatGoogleGenerativeAI):
     """ChatGoogleGenerativeAI with normalized content output.
 
     Gemini 3 models return content as list: [{'type': 'text', 'text': '...'}]
@@ -38,7 +39,7 @@ class GoogleClient(BaseLLMClient):
         """Return configured ChatGoogleGenerativeAI instance."""
         llm_kwargs = {"model": self.model}
 
-        for key in ("timeout", "max_retries", "google_api_key", "callbacks"):
+        for key in ("timeout", "max_retries", "google_api_key", "callbacks", "cache", "call_limiter"):
             if key in self.kwargs:
                 llm_kwargs[key] = self.kwargs[key]
 
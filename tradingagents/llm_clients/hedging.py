@@ -0,0 +1,145 @@
+"""Tail-latency hedging and model fallback for a role's LLM calls.
+
+Once a call to the primary model has run longer than the role's latency
+SLO (or has failed), the same request is sent to a fallback
+model/provider and whichever completes first is used. On the async path
+the losing request is cancelled, which closes its HTTP connection; sync
+requests cannot be interrupted, so an abandoned one finishes in the
+background and its result is discarded.
+
+Example config:
+    "llm_hedging": {
+        "deep_think": {"after_seconds": 90, "provider": "openai", "model": "gpt-5.2"},
+    }
+"""
+
+import asyncio
+import contextvars
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.outputs import ChatResult
+
+from .cache import get_llm_cache
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=64, thread_name_prefix="llm-hedge")
+
+
+class HedgedChatModel(BaseChatModel):
+    """Chat model that races a fallback against a slow or failing primary."""
+
+    primary: BaseChatModel
+    fallback: BaseChatModel
+    hedge_after_seconds: float
+
+    @property
+    def _llm_type(self) -> str:
+        # Same type and params as the primary, so LLM cache keys match
+        return self.primary._llm_type
+
+    @property
+    def _identifying_params(self) -> Mapping[str, Any]:
+        return self.primary._identifying_params
+
+    def bind_tools(self, tools, **kwargs):
+        # Providers differ in tool formats, so each member binds the tools
+        # itself, once, and every call reuses its bound kwargs
+        return self.bind(
+            hedge_primary_kwargs=self.primary.bind_tools(tools, **kwargs).kwargs,
+            hedge_fallback_kwargs=self.fallback.bind_tools(tools, **kwargs).kwargs,
+        )
+
+    def _member_kwargs(self, kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        primary = kwargs.pop("hedge_primary_kwargs", None) or {}
+        fallback = kwargs.pop("hedge_fallback_kwargs", None) or {}
+        return {**kwargs, **primary}, {**kwargs, **fallback}
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        primary_kwargs, fallback_kwargs = self._member_kwargs(kwargs)
+
+        def submit(member, member_kwargs):
+            context = contextvars.copy_context()
+            return _executor.submit(
+                context.run, member._generate, messages, stop=stop, run_manager=run_manager, **member_kwargs
+            )
+
+        primary = submit(self.primary, primary_kwargs)
+        done, _ = wait([primary], timeout=self.hedge_after_seconds)
+        if done and primary.exception() is None:
+            return primary.result()
+
+        self._log_hedge(primary_failed=bool(done))
+        pending = {primary, submit(self.fallback, fallback_kwargs)} - done
+        error: Optional[BaseException] = primary.exception() if done else None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        primary_kwargs, fallback_kwargs = self._member_kwargs(kwargs)
+
+        primary = asyncio.create_task(
+            self.primary._agenerate(messages, stop=stop, run_manager=run_manager, **primary_kwargs)
+        )
+        done, _ = await asyncio.wait([primary], timeout=self.hedge_after_seconds)
+        if done and primary.exception() is None:
+            return primary.result()
+
+        self._log_hedge(primary_failed=bool(done))
+        fallback = asyncio.create_task(
+            self.fallback._agenerate(messages, stop=stop, run_manager=run_manager, **fallback_kwargs)
+        )
+        pending = {primary, fallback} - done
+        error: Optional[BaseException] = primary.exception() if done else None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    return task.result()
+                error = task.exception()
+        raise error
+
+    def _log_hedge(self, primary_failed: bool) -> None:
+        if primary_failed:
+            logger.warning(f"Primary {self.primary._llm_type} call failed; falling back to {self.fallback._llm_type}")
+        else:
+            logger.warning(
+                f"Primary {self.primary._llm_type} call exceeded {self.hedge_after_seconds:g}s; "
+                f"hedging with {self.fallback._llm_type}"
+            )
+
+
+def create_hedged_llm(
+    primary: BaseChatModel,
+    fallback: BaseChatModel,
+    hedge_after_seconds: float,
+    provider: str,
+    cache_path: Optional[str] = None,
+    callbacks: Optional[List] = None,
+) -> HedgedChatModel:
+    """Wrap primary/fallback models built without callbacks or cache.
+
+    ``callbacks`` and the response cache (namespaced by the primary
+    provider) sit on the hedged model, so each call is reported and cached
+    once whichever member answered.
+    """
+    kwargs: Dict[str, Any] = {}
+    if callbacks:
+        kwargs["callbacks"] = callbacks
+    if cache_path:
+        kwargs["cache"] = get_llm_cache(cache_path, namespace=provider.lower())
+    return HedgedChatModel(
+        primary=primary, fallback=fallback, hedge_after_seconds=hedge_after_seconds, **kwargs
+    )
@@ -0,0 +1,79 @@
+"""Process-wide keep-alive HTTP clients shared by LLM objects per backend.
+
+Every graph builds its own chat model objects, and by default each one gets
+its own connection pool, so a worker running many graphs keeps
+re-handshaking with the same endpoints. The OpenAI-compatible and Anthropic
+clients instead share one pooled client per base URL, over HTTP/2 unless
+the ``llm_http2`` config is False. HTTP/2 needs ``h2``, installed with the
+``httpx[http2]`` dependency; if it is missing the pool logs a warning and
+falls back to HTTP/1.1.
+
+Only synchronous clients are shared: an async client's pool is bound to
+the event loop it was first used on, so async clients stay per model.
+"""
+
+import importlib
+import importlib.util
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_POOL_SIZE = 20
+KEEPALIVE_EXPIRY_SECONDS = 120
+
+logger = logging.getLogger(__name__)
+
+_clients: Dict[Tuple[type, str, int, bool], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _httpx_module(client_cls: type):
+    """The httpx flavour (httpx or httpx2) an SDK's client class is built on."""
+    for cls in client_cls.__mro__:
+        top = cls.__module__.partition(".")[0]
+        if top.startswith("httpx"):
+            return importlib.import_module(top)
+    raise TypeError(f"{client_cls.__name__} is not an httpx client class")
+
+
+def _resolve_http2(http2: bool) -> bool:
+    """Whether HTTP/2 can be used, warning when it was requested but h2 is missing."""
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "llm_http2 is enabled but the h2 package is not installed; "
+            "LLM clients fall back to HTTP/1.1 (pip install 'httpx[http2]')"
+        )
+        return False
+    return http2
+
+
+def get_http_client(
+    base_url: str,
+    client_cls: type,
+    pool_size: Optional[int] = None,
+    http2: bool = True,
+) -> Any:
+    """Return the shared keep-alive client for base_url, creating it once.
+
+    Args:
+        base_url: API base URL the client will talk to
+        client_cls: The provider SDK's default client class (e.g.
+            ``openai.DefaultHttpxClient``), which keeps the SDK's timeouts
+        pool_size: Maximum connections to this backend
+        http2: Negotiate HTTP/2 (falls back to HTTP/1.1, with a warning,
+            when h2 is not installed)
+    """
+    pool_size = pool_size or DEFAULT_POOL_SIZE
+    key = (client_cls, base_url.rstrip("/"), pool_size, http2)
+    with _clients_lock:
+        if key not in _clients:
+            httpx_module = _httpx_module(client_cls)
+            _clients[key] = client_cls(
+                http2=_resolve_http2(http2),
+                limits=httpx_module.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size,
+                    keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+        return _clients[key]
@@ -0,0 +1,213 @@
+"""Spread one role's LLM calls over a pool of (base_url, api_key) backends.
+
+Each call goes to the healthy member with the fewest outstanding requests.
+A member that answers 429 or 5xx is taken out of rotation for a cooldown
+and the call is retried on the next member, so batch throughput scales
+with the number of keys instead of being capped by one account's limits.
+
+Example config:
+    "quick_think_backends": [
+        {"api_key": os.getenv("OPENAI_API_KEY_1")},
+        {"api_key": os.getenv("OPENAI_API_KEY_2")},
+        {"base_url": "https://eu.example.com/v1", "api_key": "..."},
+    ]
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.outputs import ChatResult
+
+from .cache import get_llm_cache
+from .factory import create_llm_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COOLDOWN_SECONDS = 30.0
+
+
+def _status(error: Exception) -> Optional[int]:
+    """HTTP status behind an exception, following wrapped causes.
+
+    OpenAI and Anthropic errors carry ``status_code``; langchain-google-genai
+    re-raises the google-genai error (whose status is ``code``) as a
+    ``ChatGoogleGenerativeAIError`` without one.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        for status in (
+            getattr(error, "status_code", None),
+            getattr(getattr(error, "response", None), "status_code", None),
+            getattr(error, "code", None),
+        ):
+            if isinstance(status, int):
+                return status
+        error = error.__cause__ or error.__context__
+    return None
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Rate limits and server errors are worth retrying on another backend."""
+    status = _status(error)
+    return status == 429 or (status is not None and status >= 500)
+
+
+# Members must surface a 429 at once, so the balancer can move to another
+# backend. Google's client needs 1 (a single attempt) to disable retries.
+_NO_RETRIES = {"google": 1}
+
+
+class BalancedChatModel(BaseChatModel):
+    """Chat model routing each call to one of several equivalent members."""
+
+    members: List[BaseChatModel]
+    cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS
+    # Extra passes over the pool once every member has failed a call
+    max_retries: int = 2
+    _outstanding: List[int]
+    _cooldown_until: List[float]
+    _lock: Any
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._outstanding = [0] * len(self.members)
+        self._cooldown_until = [0.0] * len(self.members)
+        self._lock = threading.Lock()
+
+    @property
+    def _llm_type(self) -> str:
+        # Same type and params as a single member, so LLM cache keys match
+        return self.members[0]._llm_type
+
+    @property
+    def _identifying_params(self) -> Mapping[str, Any]:
+        return self.members[0]._identifying_params
+
+    def bind_tools(self, tools, **kwargs):
+        # Members share a provider, so the first one formats the tool schemas
+        return self.bind(**self.members[0].bind_tools(tools, **kwargs).kwargs)
+
+    def _pick(self, tried: set) -> int:
+        """Claim the least-loaded healthy member, falling back to the soonest to recover."""
+        with self._lock:
+            now = time.monotonic()
+            candidates = [i for i in range(len(self.members)) if i not in tried]
+            healthy = [i for i in candidates if self._cooldown_until[i] <= now]
+            if healthy:
+                index = min(healthy, key=lambda i: self._outstanding[i])
+            else:
+                index = min(candidates, key=lambda i: self._cooldown_until[i])
+            self._outstanding[index] += 1
+            return index
+
+    def _finish(self, index: int, error: Optional[Exception] = None) -> None:
+        with self._lock:
+            self._outstanding[index] -= 1
+            if error is not None:
+                self._cooldown_until[index] = time.monotonic() + self.cooldown_seconds
+        if error is not None:
+            logger.warning(
+                f"LLM backend {index} failed ({error.__class__.__name__}); "
+                f"out of rotation for {self.cooldown_seconds:.0f}s"
+            )
+
+    def _backoff(self, passes: int) -> float:
+        """Wait before another pass over a pool that is entirely failing."""
+        return min(2.0 ** (passes - 1), self.cooldown_seconds)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        tried = set()
+        passes = 0
+        while True:
+            index = self._pick(tried)
+            tried.add(index)
+            try:
+                result = self.members[index]._generate(
+                    messages, stop=stop, run_manager=run_manager, **kwargs
+                )
+            except Exception as e:
+                if not _is_retryable(e):
+                    self._finish(index)
+                    raise
+                self._finish(index, e)
+                if len(tried) == len(self.members):
+                    if passes >= self.max_retries:
+                        raise
+                    passes += 1
+                    tried.clear()
+                    time.sleep(self._backoff(passes))
+                continue
+            self._finish(index)
+            return result
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        tried = set()
+        passes = 0
+        while True:
+            index = self._pick(tried)
+            tried.add(index)
+            try:
+                result = await self.members[index]._agenerate(
+                    messages, stop=stop, run_manager=run_manager, **kwargs
+                )
+            except Exception as e:
+                if not _is_retryable(e):
+                    self._finish(index)
+                    raise
+                self._finish(index, e)
+                if len(tried) == len(self.members):
+                    if passes >= self.max_retries:
+                        raise
+                    passes += 1
+                    tried.clear()
+                    await asyncio.sleep(self._backoff(passes))
+                continue
+            self._finish(index)
+            return result
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """Return per-member outstanding requests and whether it is cooling down."""
+        with self._lock:
+            now = time.monotonic()
+            return [
+                {"outstanding": self._outstanding[i], "cooling_down": self._cooldown_until[i] > now}
+                for i in range(len(self.members))
+            ]
+
+
+def create_balanced_llm(
+    provider: str,
+    model: str,
+    backends: List[Dict[str, Optional[str]]],
+    cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+    **kwargs,
+) -> BalancedChatModel:
+    """Build one member per {"base_url", "api_key"} backend and balance across them.
+
+    ``callbacks``, ``cache`` and ``max_retries`` apply to the balanced model
+    only, so each call is reported and cached once regardless of which
+    member served it, and a rate-limited member fails over instead of
+    retrying on the same key. Other kwargs (e.g. rate_limits,
+    http_pool_size) go to every member.
+    """
+    outer = {key: kwargs.pop(key) for key in ("callbacks", "cache", "max_retries") if key in kwargs}
+    cache_path = kwargs.pop("cache_path", None)
+    key_name = "google_api_key" if provider.lower() == "google" else "api_key"
+
+    members = []
+    for backend in backends:
+        member_kwargs = dict(kwargs, max_retries=_NO_RETRIES.get(provider.lower(), 0))
+        if backend.get("api_key"):
+            member_kwargs[key_name] = backend["api_key"]
+        client = create_llm_client(provider, model, base_url=backend.get("base_url"), **member_kwargs)
+        members.append(client.get_llm())
+
+    if cache_path:
+        outer["cache"] = get_llm_cache(cache_path, namespace=provider.lower())
+
+    return BalancedChatModel(members=members, cooldown_seconds=cooldown_seconds, **outer)
@@ -1,14 +1,25 @@
 import os
 from typing import Any, Optional
 
+import openai
 from langchain_openai import ChatOpenAI
 
 from .base_client import BaseLLMClient
+from .http_pool import get_http_client
+from .prompt_cache import find_cache_prefix, prefix_cache_key
+from .rate_limit import RateLimitedChatModel
 from .validators import validate_model
 
 
-class UnifiedChatOpenAI(ChatOpenAI):
-    """ChatOpenAI subclass that strips incompatible params for certain models."""
+class UnifiedChatOpenAI(RateLimitedChatModel, ChatOpenAI):
+    """ChatOpenAI subclass that strips incompatible params for certain models.
+
+    When ``emit_prompt_cache_key`` is set, prompts with a marked shared
+    prefix carry a ``prompt_cache_key`` so OpenAI routes them to the same
+    prefix cache.
+    """
+
+    emit_prompt_cache_key: bool = False
 
     def __init__(self, **kwargs):
         model = kwargs.get("model", "")
@@ -17,6 +28,14 @@ class UnifiedChatOpenAI(ChatOpenAI):
             kwargs.pop("top_p", None)
         super().__init__(**kwargs)
 
+    def _get_request_payload(self, input_, *, stop=None, **kwargs):
+        if self.emit_prompt_cache_key and "prompt_cache_key" not in kwargs:
+            messages = self._convert_input(input_).to_messages()
+            idx = find_cache_prefix(messages)
+            if idx is not None:
+                kwargs["prompt_cache_key"] = prefix_cache_key(messages[idx])
+        return super()._get_request_payload(input_, stop=stop, **kwargs)
+
     @staticmethod
     def _is_reasoning_model(model: str) -> bool:
         """Check if model is a reasoning model that doesn't support temperature."""
@@ -61,10 +80,23 @@ class OpenAIClient(BaseLLMClient):
         elif self.base_url:
             llm_kwargs["base_url"] = self.base_url
 
-        for key in ("timeout", "max_retries", "reasoning_effort", "api_key", "callbacks"):
+        for key in ("timeout", "max_retries", "reasoning_effort", "api_key", "callbacks", "cache", "call_limiter", "http_client"):
             if key in self.kwargs:
                 llm_kwargs[key] = self.kwargs[key]
 
+        if "http_client" not in llm_kwargs:
+            llm_kwargs["http_client"] = get_http_client(
+                llm_kwargs.get("base_url") or os.environ.get("OPENAI_BASE_URL") or "https://api.openai.com/v1",
+                openai.DefaultHttpxClient,
+                self.kwargs.get("http_pool_size"),
+                self.kwargs.get("http2", True),
+            )
+
+        # prompt_cache_key is an OpenAI API parameter; compatible backends may reject it
+        base_url = llm_kwargs.get("base_url")
+        if self.provider == "openai" and (not base_url or "api.openai.com" in base_url):
+            llm_kwargs["emit_prompt_cache_key"] = True
+
         return UnifiedChatOpenAI(**llm_kwargs)
 
     def validate_model(self) -> bool:
@@ -0,0 +1,48 @@
+"""Provider prompt-prefix caching for the shared analyst-report block.
+
+Agents mark the first message of a prompt as a cacheable prefix with
+``mark_cache_prefix``; the provider chat models then emit the matching
+cache hint (an Anthropic ``cache_control`` breakpoint or an OpenAI
+``prompt_cache_key``). Other providers ignore the marker.
+"""
+
+import hashlib
+from typing import List, Optional
+
+from langchain_core.messages import BaseMessage
+
+CACHE_PREFIX_KWARG = "cache_prefix"
+
+
+def mark_cache_prefix(message: BaseMessage) -> BaseMessage:
+    """Flag a message as the stable, shareable prefix of a prompt."""
+    message.additional_kwargs[CACHE_PREFIX_KWARG] = True
+    return message
+
+
+def find_cache_prefix(messages: List[BaseMessage]) -> Optional[int]:
+    """Return the index of the marked prefix message, if any."""
+    for i, message in enumerate(messages):
+        if message.additional_kwargs.get(CACHE_PREFIX_KWARG):
+            return i
+    return None
+
+
+def prefix_cache_key(message: BaseMessage) -> str:
+    """Stable routing key derived from the prefix content."""
+    return "ta-" + hashlib.sha256(str(message.content).encode("utf-8")).hexdigest()[:32]
+
+
+def with_cache_control(messages: List[BaseMessage]) -> List[BaseMessage]:
+    """Return messages with an ephemeral cache_control breakpoint after the prefix."""
+    idx = find_cache_prefix(messages)
+    if idx is None or not isinstance(messages[idx].content, str):
+        return messages
+
+    prefix = messages[idx]
+    blocks = [{
+        "type": "text",
+        "text": prefix.content,
+        "cache_control": {"type": "ephemeral"},
+    }]
+    return messages[:idx] + [prefix.model_copy(update={"content": blocks})] + messages[idx + 1:]
@@ -0,0 +1,254 @@
+"""Client-side request/token/concurrency limits for LLM providers.
+
+Limits are configured per provider or per ``provider/model`` and are shared
+by every chat model created for that key and account (endpoint and API
+key) in the process, so the deep- and quick-think clients (and concurrent
+tickers) draw from one budget, while each backend of a load-balanced pool
+has its own. Calls
+queue in FIFO order until the budget allows them, which keeps throughput at
+the provider limit instead of bursting into 429s and retry storms.
+
+Example config:
+    "llm_rate_limits": {
+        "openrouter": {"rpm": 60, "tpm": 200_000, "max_concurrency": 4},
+        "anthropic/claude-sonnet-4-5": {"rpm": 50, "max_concurrency": 2},
+    }
+"""
+
+import asyncio
+import hashlib
+import itertools
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+
+# Output tokens reserved per call until the real usage is known
+DEFAULT_OUTPUT_TOKENS = 1024
+
+# Set while a call holds its slot, so a sync fallback inside _agenerate
+# (LangChain's default runs _generate in an executor) does not acquire twice
+_holding_slot: ContextVar[bool] = ContextVar("llm_call_holding_slot", default=False)
+
+
+class _TokenBucket:
+    """Continuously refilling bucket holding up to one minute of budget."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` is available (0 if it is available now)."""
+        self._refill(now)
+        # A single call larger than the bucket only waits for a full bucket
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float):
+        self.level -= amount
+
+    def give(self, amount: float):
+        self.level = min(self.capacity, self.level + amount)
+
+
+class ProviderRateLimiter:
+    """FIFO limiter enforcing requests/min, tokens/min and max in-flight calls."""
+
+    def __init__(
+        self,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self._requests = _TokenBucket(rpm) if rpm else None
+        self._tokens = _TokenBucket(tpm) if tpm else None
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._tickets = itertools.count()
+        self._next_ticket = 0
+
+        self.calls = 0
+        self.queued_seconds = 0.0
+
+    def _wait_time(self, tokens: int) -> Optional[float]:
+        """Seconds to wait for budget, or None if blocked on concurrency."""
+        if self.max_concurrency and self._in_flight >= self.max_concurrency:
+            return None
+        now = time.monotonic()
+        wait = 0.0
+        if self._requests:
+            wait = max(wait, self._requests.wait_time(1, now))
+        if self._tokens:
+            wait = max(wait, self._tokens.wait_time(tokens, now))
+        return wait
+
+    def acquire(self, tokens: int) -> None:
+        """Block until this call may start; callers are served in arrival order."""
+        start = time.monotonic()
+        with self._cond:
+            ticket = next(self._tickets)
+            while True:
+                if ticket == self._next_ticket:
+                    wait = self._wait_time(tokens)
+                    if wait == 0.0:
+                        break
+                    self._cond.wait(timeout=wait)
+                else:
+                    self._cond.wait()
+
+            self._next_ticket += 1
+            self._in_flight += 1
+            if self._requests:
+                self._requests.take(1)
+            if self._tokens:
+                self._tokens.take(tokens)
+            self.calls += 1
+            self.queued_seconds += time.monotonic() - start
+            self._cond.notify_all()
+
+    def release(self, reserved_tokens: int, used_tokens: Optional[int]) -> None:
+        """Free the in-flight slot and settle the token reservation."""
+        with self._cond:
+            self._in_flight -= 1
+            if self._tokens and used_tokens is not None:
+                if used_tokens < reserved_tokens:
+                    self._tokens.give(reserved_tokens - used_tokens)
+                else:
+                    self._tokens.take(used_tokens - reserved_tokens)
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return call count and total time spent queued."""
+        with self._cond:
+            return {"calls": self.calls, "queued_seconds": round(self.queued_seconds, 3)}
+
+
+def estimate_tokens(messages: List[BaseMessage]) -> int:
+    """Rough prompt size (~4 characters per token) plus the output reservation."""
+    chars = sum(len(str(m.content)) for m in messages)
+    return chars // 4 + DEFAULT_OUTPUT_TOKENS
+
+
+def _used_tokens(result: ChatResult) -> Optional[int]:
+    for generation in result.generations:
+        usage = getattr(generation.message, "usage_metadata", None)
+        if usage:
+            return usage.get("total_tokens")
+    return None
+
+
+class RateLimitedChatModel(BaseChatModel):
+    """Chat model mixin that routes provider calls through a ProviderRateLimiter.
+
+    Cache hits never reach ``_generate``, so they do not consume budget.
+    """
+
+    call_limiter: Optional[Any] = None
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.call_limiter is None or _holding_slot.get():
+            return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        reserved = estimate_tokens(messages)
+        self.call_limiter.acquire(reserved)
+        used = None
+        try:
+            result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            used = _used_tokens(result)
+            return result
+        finally:
+            self.call_limiter.release(reserved, used)
+
+    async def _aacquire(self, reserved: int) -> None:
+        """Wait for a slot on a worker thread, handing it back if the caller is cancelled.
+
+        The blocking acquire cannot be interrupted, so when the awaiting task
+        is cancelled (e.g. the losing call of a hedge) the worker releases the
+        slot itself as soon as it obtains it.
+        """
+        limiter = self.call_limiter
+        lock = threading.Lock()
+        status = {"acquired": False, "abandoned": False}
+
+        def acquire():
+            limiter.acquire(reserved)
+            with lock:
+                if status["abandoned"]:
+                    limiter.release(reserved, 0)
+                else:
+                    status["acquired"] = True
+
+        try:
+            await asyncio.to_thread(acquire)
+        except asyncio.CancelledError:
+            with lock:
+                status["abandoned"] = True
+                if status["acquired"]:
+                    limiter.release(reserved, 0)
+            raise
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.call_limiter is None or _holding_slot.get():
+            return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        reserved = estimate_tokens(messages)
+        await self._aacquire(reserved)
+        token = _holding_slot.set(True)
+        used = None
+        try:
+            result = await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            used = _used_tokens(result)
+            return result
+        finally:
+            _holding_slot.reset(token)
+            self.call_limiter.release(reserved, used)
+
+
+_limiters: Dict[Tuple[str, str], ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def backend_id(base_url: Optional[str], api_key: Optional[str]) -> str:
+    """Identify the account a client calls: its endpoint and a hash of its key."""
+    key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12] if api_key else ""
+    return f"{base_url or ''}#{key_hash}"
+
+
+def get_rate_limiter(
+    provider: str,
+    model: str,
+    rate_limits: Optional[Dict[str, Dict[str, int]]],
+    backend: str = "",
+) -> Optional[ProviderRateLimiter]:
+    """Return the shared limiter for provider/model on a backend, or None if unlimited.
+
+    A ``provider/model`` entry takes precedence over a ``provider`` entry;
+    a provider-wide entry is shared across all of that provider's models.
+    Limits are per account, so clients on different backends (``backend_id``,
+    e.g. the members of a load-balanced pool) each get their own budget.
+    """
+    if not rate_limits:
+        return None
+
+    provider = provider.lower()
+    for key in (f"{provider}/{model}", provider):
+        if key in rate_limits:
+            with _limiters_lock:
+                if (key, backend) not in _limiters:
+                    _limiters[(key, backend)] = ProviderRateLimiter(**rate_limits[key])
+                return _limiters[(key, backend)]
+    return None
@@ -0,0 +1,214 @@
+"""Offline ``replay`` provider serving LLM responses from recorded run traces.
+
+Record a live run by setting ``llm_trace_record_path``; every chat model
+response (tool calls included) is appended as one JSON line keyed by the
+LangGraph node that made the call and that node's turn number. Replaying
+the trace with ``llm_provider="replay"`` then runs ``propagate`` end to end
+with no network and no API keys, optionally sleeping per call to model
+provider latency:
+
+    "recorded"               the latency measured while recording
+    "fixed:1.5"              a constant number of seconds
+    "uniform:0.5:2.0"        uniform between two bounds
+    "lognormal:0.0:0.5"      lognormal with the given mu and sigma
+"""
+
+import json
+import os
+import random
+import threading
+import time
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core._api import LangChainBetaWarning
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.load import dumps, loads
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult, LLMResult
+
+from .base_client import BaseLLMClient
+from .cache import _ALLOWED_OBJECTS
+
+# Calls made outside the graph (signal processing, reflection)
+OUTSIDE_GRAPH = ""
+
+
+def _node_of(metadata: Optional[Dict[str, Any]]) -> str:
+    return (metadata or {}).get("langgraph_node", OUTSIDE_GRAPH)
+
+
+class TraceRecorder(BaseCallbackHandler):
+    """Callback handler that appends each chat model response to a JSONL trace."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._starts: Dict[UUID, tuple] = {}
+        self._turns: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs):
+        with self._lock:
+            self._starts[run_id] = (_node_of(metadata), time.monotonic())
+
+    def on_llm_end(self, response: LLMResult, *, run_id, **kwargs):
+        with self._lock:
+            start = self._starts.pop(run_id, None)
+            if start is None:
+                return
+            node, started = start
+            turn = self._turns.get(node, 0)
+            self._turns[node] = turn + 1
+            record = {
+                "node": node,
+                "turn": turn,
+                "latency": round(time.monotonic() - started, 3),
+                "message": dumps(response.generations[0][0].message),
+            }
+            with open(self.path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        with self._lock:
+            self._starts.pop(run_id, None)
+
+
+class ReplayTrace:
+    """Recorded responses grouped by node, served in turn order.
+
+    Turns are counted per run (the ``run_id`` the graph puts in its call
+    metadata), so repeated and concurrent ``propagate`` calls each replay
+    the recorded run from its start. A node asking for more turns than were
+    recorded raises instead of replaying a wrong response; calls made
+    outside the graph share one counter, which ``reset`` rewinds.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: Dict[str, List[dict]] = {}
+        with open(path, "r") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._entries.setdefault(record["node"], []).append(record)
+        for entries in self._entries.values():
+            entries.sort(key=lambda record: record["turn"])
+        self._positions: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def next(self, node: str, run_id: str = "") -> dict:
+        """Return the next recorded response for a node in a run."""
+        entries = self._entries.get(node)
+        if not entries:
+            raise ValueError(f"Replay trace {self.path} has no recorded calls for node '{node or '(outside graph)'}'")
+        with self._lock:
+            position = self._positions.get((run_id, node), 0)
+            if position >= len(entries):
+                raise ValueError(
+                    f"Replay trace {self.path} has {len(entries)} recorded calls for node "
+                    f"'{node or '(outside graph)'}' but the run asked for turn {position}; "
+                    "the run diverged from the recording"
+                )
+            self._positions[(run_id, node)] = position + 1
+        return entries[position]
+
+    def reset(self) -> None:
+        """Start every node from its first recorded turn again."""
+        with self._lock:
+            self._positions.clear()
+
+
+def _latency_sampler(spec: Optional[str], seed: Optional[int]) -> Callable[[dict], float]:
+    if not spec:
+        return lambda record: 0.0
+
+    kind, *args = spec.split(":")
+    values = [float(a) for a in args]
+    rng = random.Random(seed)
+    if kind == "recorded":
+        return lambda record: record.get("latency", 0.0)
+    if kind == "fixed":
+        return lambda record: values[0]
+    if kind == "uniform":
+        return lambda record: rng.uniform(values[0], values[1])
+    if kind == "lognormal":
+        return lambda record: rng.lognormvariate(values[0], values[1])
+    raise ValueError(f"Unsupported replay latency spec: {spec}")
+
+
+class ReplayChatModel(BaseChatModel):
+    """Chat model answering from a ReplayTrace instead of a provider."""
+
+    trace: Any
+    latency: Optional[str] = None
+    latency_seed: Optional[int] = None
+    _sample: Callable[[dict], float]
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._sample = _latency_sampler(self.latency, self.latency_seed)
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def bind_tools(self, tools, **kwargs):
+        # The recorded messages already carry the tool calls
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        metadata = run_manager.metadata if run_manager else None
+        record = self.trace.next(_node_of(metadata), (metadata or {}).get("run_id", ""))
+        delay = self._sample(record)
+        if delay > 0:
+            time.sleep(delay)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", LangChainBetaWarning)
+            message = loads(record["message"], allowed_objects=_ALLOWED_OBJECTS)
+        message = AIMessage(
+            content=message.content,
+            tool_calls=getattr(message, "tool_calls", []),
+            usage_metadata=getattr(message, "usage_metadata", None),
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+_traces: Dict[str, ReplayTrace] = {}
+_traces_lock = threading.Lock()
+
+
+def get_replay_trace(path: str) -> ReplayTrace:
+    """Return the process-wide trace for a file, so deep and quick clients share turn counters."""
+    key = os.path.abspath(path)
+    with _traces_lock:
+        if key not in _traces:
+            _traces[key] = ReplayTrace(path)
+        return _traces[key]
+
+
+class ReplayClient(BaseLLMClient):
+    """Client for the offline replay provider."""
+
+    def __init__(self, model: str, base_url: Optional[str] = None, **kwargs):
+        super().__init__(model, base_url, **kwargs)
+
+    def get_llm(self) -> Any:
+        """Return configured ReplayChatModel instance."""
+        trace_path = self.kwargs.get("trace_path")
+        if not trace_path:
+            raise ValueError("The replay provider requires a trace_path (config 'replay_trace_path')")
+
+        llm_kwargs = {"trace": get_replay_trace(trace_path)}
+        for key in ("latency", "latency_seed", "callbacks", "cache"):
+            if key in self.kwargs:
+                llm_kwargs[key] = self.kwargs[key]
+
+        return ReplayChatModel(**llm_kwargs)
+
+    def validate_model(self) -> bool:
+        """Any model name is accepted; it is not used when replaying."""
+        return True